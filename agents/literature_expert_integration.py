@@ -10,7 +10,13 @@ literature-expert 集成示例代码
 日期: 2025-12-28
 """
 
+import hashlib
+import random
+import re
 import sys
+import time
+import unicodedata
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 # 添加技能路径 - 修复导入路径问题
@@ -27,6 +33,185 @@ if pubscholar_scripts.exists():
 if arxiv_scripts.exists():
     sys.path.insert(0, str(arxiv_scripts))
 
+try:
+    from common.literature_index import get_literature_index
+except ImportError:
+    # 分词依赖（jieba）未安装时不建立本地全文索引
+    get_literature_index = None
+
+# 各检索源的等待上限（秒），超时的检索源不再等待，只返回已完成检索源的结果
+DEFAULT_SOURCE_TIMEOUTS = {'chinese': 120.0, 'english': 60.0}
+
+_DOI_PATTERN = re.compile(r'10\.\d{4,9}/[^\s"<>]+', re.IGNORECASE)
+_ARXIV_URL_PATTERN = re.compile(r'arxiv\.org/(?:abs|pdf)/(.+?)(?:v\d+)?(?:\.pdf)?$', re.IGNORECASE)
+_ARXIV_VERSION_PATTERN = re.compile(r'v\d+$')
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def normalize_title(title):
+    """
+    标题归一化：全角转半角、转小写，只保留字母、数字与汉字
+
+    Args:
+        title: 原始标题
+
+    Returns:
+        归一化后的标题
+    """
+    text = unicodedata.normalize('NFKC', title or '').lower()
+    return ''.join(ch for ch in text if ch.isalnum())
+
+
+def paper_identifiers(paper):
+    """
+    提取文献的唯一标识（DOI与不含版本号的arXiv ID）
+
+    Args:
+        paper: 文献字典
+
+    Returns:
+        标识列表，如['doi:10.1000/xyz', 'arxiv:2312.11805']
+    """
+    identifiers = []
+
+    doi = paper.get('doi')
+    if not doi:
+        for field in ('url', 'journal_ref'):
+            match = _DOI_PATTERN.search(paper.get(field) or '')
+            if match:
+                doi = match.group(0)
+                break
+    if doi:
+        identifiers.append('doi:' + doi.lower().rstrip('.'))
+
+    # 旧式arXiv ID（如hep-th/9901001）的arxiv_id字段只保留了斜杠后的部分，优先从链接中解析
+    arxiv_id = None
+    for field in ('pdf_url', 'url'):
+        match = _ARXIV_URL_PATTERN.search(paper.get(field) or '')
+        if match:
+            arxiv_id = match.group(1)
+            break
+    if arxiv_id is None and paper.get('arxiv_id'):
+        arxiv_id = _ARXIV_VERSION_PATTERN.sub('', paper['arxiv_id'])
+    if arxiv_id:
+        identifiers.append('arxiv:' + arxiv_id.lower())
+
+    return identifiers
+
+
+class StreamingDeduplicator:
+    """
+    流式文献去重器
+
+    逐条加入文献，判断是否与已保留的文献重复：
+    1. DOI或arXiv ID相同即为重复
+    2. 否则将归一化标题切分为字符n-gram，计算MinHash签名并分段（LSH）放入桶中，
+       只与同桶的候选文献比较Jaccard相似度，达到阈值即为重复
+
+    每条文献只与少量候选比较，总开销随文献数近似线性增长。
+    重复文献不会加入结果，其来源与缺失字段合并到已保留的文献中。
+    """
+
+    def __init__(self, threshold=0.8, shingle_size=3, num_perm=16, bands=8):
+        """
+        初始化去重器
+
+        Args:
+            threshold: 判定标题重复的Jaccard相似度阈值
+            shingle_size: 标题字符n-gram的长度
+            num_perm: MinHash签名长度
+            bands: LSH分段数（num_perm需能被整除）
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm必须能被bands整除")
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = random.Random(num_perm)
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self.papers = []
+        self.duplicates = 0
+        self._by_identifier = {}
+        self._buckets = {}
+        self._shingles = []
+
+    def add(self, paper, source):
+        """
+        加入一条文献
+
+        Args:
+            paper: 文献字典
+            source: 检索源名称
+
+        Returns:
+            True表示新文献（已保留），False表示重复
+        """
+        identifiers = paper_identifiers(paper)
+        shingles = self._shingle(paper.get('title'))
+
+        match = next((self._by_identifier[i] for i in identifiers if i in self._by_identifier), None)
+        band_keys = self._band_keys(shingles) if shingles else []
+        if match is None and shingles:
+            match = self._match_title(shingles, band_keys)
+
+        if match is not None:
+            self._merge(self.papers[match], paper, source)
+            for identifier in identifiers:
+                self._by_identifier.setdefault(identifier, match)
+            self.duplicates += 1
+            return False
+
+        position = len(self.papers)
+        paper.setdefault('found_in', [source])
+        self.papers.append(paper)
+        self._shingles.append(shingles)
+        for identifier in identifiers:
+            self._by_identifier[identifier] = position
+        for key in band_keys:
+            self._buckets.setdefault(key, []).append(position)
+        return True
+
+    def _shingle(self, title):
+        text = normalize_title(title)
+        if not text:
+            return frozenset()
+        if len(text) <= self.shingle_size:
+            return frozenset([text])
+        return frozenset(text[i:i + self.shingle_size] for i in range(len(text) - self.shingle_size + 1))
+
+    def _band_keys(self, shingles):
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'big')
+            for s in shingles
+        ]
+        signature = [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self._permutations]
+        return [
+            (band, tuple(signature[band * self.rows:(band + 1) * self.rows]))
+            for band in range(self.bands)
+        ]
+
+    def _match_title(self, shingles, band_keys):
+        candidates = set()
+        for key in band_keys:
+            candidates.update(self._buckets.get(key, ()))
+        for position in sorted(candidates):
+            other = self._shingles[position]
+            if len(shingles & other) / len(shingles | other) >= self.threshold:
+                return position
+        return None
+
+    @staticmethod
+    def _merge(kept, duplicate, source):
+        if source not in kept['found_in']:
+            kept['found_in'].append(source)
+        for key, value in duplicate.items():
+            if value and not kept.get(key):
+                kept[key] = value
+
 
 class LiteratureExpertIntegrator:
     """
@@ -39,8 +224,19 @@ class LiteratureExpertIntegrator:
     4. 提供综合分析报告
     """
 
-    def __init__(self, debug=False):
+    def __init__(self, debug=False, source_timeouts=None, index_path=None):
+        """
+        Args:
+            debug: 是否输出调试信息
+            source_timeouts: 各检索源的等待上限（秒），如{'chinese': 120, 'english': 60}
+            index_path: 本地全文索引路径，None时读取SSCI_LITERATURE_INDEX环境变量，
+                两者都未提供时不建立索引
+        """
         self.debug = debug
+        self.index = get_literature_index(index_path) if get_literature_index else None
+        self.source_timeouts = dict(DEFAULT_SOURCE_TIMEOUTS)
+        if source_timeouts:
+            self.source_timeouts.update(source_timeouts)
 
     def detect_language(self, query):
         """
@@ -114,6 +310,10 @@ class LiteratureExpertIntegrator:
         """
         智能文献检索主入口
 
+        中英文检索源并发执行，按完成先后将结果逐条送入去重器，DOI/arXiv ID相同
+        或标题近似的文献只保留最先到达的一条。某个检索源出错或超时时，
+        只返回其余检索源的结果，状态记录在sources中。
+
         Args:
             query: 搜索关键词
             max_results: 最大结果数
@@ -135,61 +335,103 @@ class LiteratureExpertIntegrator:
             'platform': platform,
             'chinese_papers': [],
             'english_papers': [],
-            'total': 0
+            'total': 0,
+            'duplicates_removed': 0,
+            'sources': {}
         }
 
         # 根据检测调用对应技能
+        searches = {}
         if platform == 'pubscholar' or language in ['chinese', 'both']:
             if self.debug:
                 print(f"[检索] 中文文献: {query}")
-
-            cn_results = self._search_chinese(query, max_results)
-            results['chinese_papers'] = cn_results
-            results['total'] += len(cn_results)
+            searches['chinese'] = self._search_chinese
 
         if platform == 'arxiv' or language in ['english', 'both']:
             if self.debug:
                 print(f"[检索] 英文文献: {query}")
-
-            en_results = self._search_english(query, max_results)
-            results['english_papers'] = en_results
-            results['total'] += len(en_results)
+            searches['english'] = self._search_english
+
+        deduplicator = StreamingDeduplicator()
+        for source, papers in self._run_searches(searches, query, max_results, results['sources']):
+            for paper in papers:
+                if deduplicator.add(paper, source):
+                    results[f'{source}_papers'].append(paper)
+
+        results['duplicates_removed'] = deduplicator.duplicates
+        results['total'] = len(results['chinese_papers']) + len(results['english_papers'])
+        if self.index is not None:
+            self.index.add_papers(results['chinese_papers'], 'pubscholar')
+            self.index.add_papers(results['english_papers'], 'arxiv')
+        if self.debug and deduplicator.duplicates:
+            print(f"[去重] 移除重复文献 {deduplicator.duplicates} 篇")
 
         return results
 
-    def _search_chinese(self, query, max_results):
-        """调用中文检索技能"""
-        try:
-            from pubscholar_searcher import SynchronousPubScholarSearcher
-
-            searcher = SynchronousPubScholarSearcher(debug=self.debug)
-            results = searcher.search(query, max_results=max_results, auto_expand=True)
-
-            return results
+    def _run_searches(self, searches, query, max_results, statuses):
+        """
+        并发执行各检索源，按完成先后产出结果
 
-        except ImportError as e:
-            print(f"[错误] 无法导入中文检索技能: {e}")
-            return []
-        except Exception as e:
-            print(f"[错误] 中文检索失败: {e}")
-            return []
+        Args:
+            searches: {检索源名称: 检索函数}
+            query: 搜索关键词
+            max_results: 最大结果数
+            statuses: 写入各检索源状态（ok/error/timeout）、结果数与耗时的字典
 
-    def _search_english(self, query, max_results):
-        """调用英文检索技能"""
+        Returns:
+            逐个产出的(检索源名称, 文献列表)
+        """
+        if not searches:
+            return
+        start = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=len(searches), thread_name_prefix='literature-search')
+        futures = {executor.submit(search, query, max_results): source for source, search in searches.items()}
+        give_up_at = {
+            source: start + self.source_timeouts.get(source, max(DEFAULT_SOURCE_TIMEOUTS.values()))
+            for source in searches
+        }
+        pending = set(futures)
         try:
-            from arxiv_searcher import ArxivPaperSearcher
+            while pending:
+                remaining = min(give_up_at[futures[f]] for f in pending) - time.monotonic()
+                done, pending = wait(pending, timeout=max(0.0, remaining), return_when=FIRST_COMPLETED)
+                for future in done:
+                    source = futures[future]
+                    seconds = round(time.monotonic() - start, 3)
+                    try:
+                        papers = future.result()
+                    except Exception as e:
+                        print(f"[错误] {source}检索失败: {e}")
+                        statuses[source] = {'status': 'error', 'count': 0, 'seconds': seconds, 'error': str(e)}
+                        continue
+                    statuses[source] = {'status': 'ok', 'count': len(papers), 'seconds': seconds}
+                    yield source, papers
+
+                now = time.monotonic()
+                for future in [f for f in pending if give_up_at[futures[f]] <= now]:
+                    source = futures[future]
+                    print(f"[错误] {source}检索超时（{self.source_timeouts.get(source)}秒），仅返回其他检索源的结果")
+                    statuses[source] = {'status': 'timeout', 'count': 0, 'seconds': round(now - start, 3)}
+                    future.cancel()
+                    pending.discard(future)
+        finally:
+            # 超时的检索在后台线程中自行结束，不阻塞本次返回
+            executor.shutdown(wait=False)
 
-            searcher = ArxivPaperSearcher(debug=self.debug)
-            results = searcher.search(query, max_results=max_results)
+    def _search_chinese(self, query, max_results):
+        """调用中文检索技能（异常由_run_searches记录）"""
+        from pubscholar_searcher import get_shared_searcher
 
-            return results
+        # 共享同一个常驻浏览器，重复检索不再重新启动Chromium
+        searcher = get_shared_searcher(debug=self.debug)
+        return searcher.search(query, max_results=max_results, auto_expand=True)
 
-        except ImportError as e:
-            print(f"[错误] 无法导入英文检索技能: {e}")
-            return []
-        except Exception as e:
-            print(f"[错误] 英文检索失败: {e}")
-            return []
+    def _search_english(self, query, max_results):
+        """调用英文检索技能（异常由_run_searches记录）"""
+        from arxiv_searcher import ArxivPaperSearcher
+
+        searcher = ArxivPaperSearcher(debug=self.debug)
+        return searcher.search(query, max_results=max_results)
 
     def generate_report(self, results):
         """
@@ -212,6 +454,11 @@ class LiteratureExpertIntegrator:
         report.append(f"  中文文献: {len(results['chinese_papers'])} 篇")
         report.append(f"  英文文献: {len(results['english_papers'])} 篇")
         report.append(f"  总计: {results['total']} 篇")
+        if results.get('duplicates_removed'):
+            report.append(f"  去除重复: {results['duplicates_removed']} 篇")
+        for source, status in results.get('sources', {}).items():
+            if status['status'] != 'ok':
+                report.append(f"  {source}检索{'超时' if status['status'] == 'timeout' else '失败'}，结果不完整")
 
         # 中文文献列表
         if results['chinese_papers']:
@@ -243,6 +490,23 @@ class LiteratureExpertIntegrator:
 
         return "\n".join(report)
 
+    def search_local(self, query, limit=20, **filters):
+        """
+        在本地全文索引中离线检索此前检索到的文献
+
+        Args:
+            query: 查询字符串，双引号内为短语
+            limit: 最多返回的条数
+            **filters: year_from、year_to、category、source、match_all
+
+        Returns:
+            [{"doc_key", "source", "year", "score", "paper"}]，未配置索引时返回空列表
+        """
+        if self.index is None:
+            print("[提示] 未配置本地全文索引（index_path或SSCI_LITERATURE_INDEX）")
+            return []
+        return self.index.search(query, limit=limit, **filters)
+
 
 def demo_scenario_1_chinese_only():
     """场景1: 纯中文文献检索"""
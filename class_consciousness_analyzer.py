@@ -9,8 +9,8 @@ Class Consciousness Analysis System
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Optional, Union
-from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple, Optional, Union
+from dataclasses import dataclass, replace
 from enum import Enum
 import math
 from datetime import datetime
@@ -77,9 +77,39 @@ class ConsciousnessDevelopment:
         level_diff = self.overall_level - previous_point.overall_level
         return level_diff / time_diff
 
+@dataclass(frozen=True)
+class CompiledIndicatorSystem:
+    """编译后的指标体系，以权重矩阵形式对整张受访者表计算意识水平"""
+    dimensions: List[ConsciousnessDimension]
+    columns: List[Optional[str]]  # 每个指标对应的数据列，None表示该测量方法不适用于该维度
+    weight_matrix: np.ndarray  # (指标数 × 维度数)，按各维度总权重归一化
+    dimension_weights: np.ndarray  # 各维度在整体水平中的权重
+    dimension_reliability: np.ndarray  # 各维度指标的平均可靠性
+
 class ClassConsciousnessAnalyzer:
     """阶级意识分析器"""
     
+    # 测量方法与意识维度到数据字段的映射，未列出的组合取默认值0.5
+    INDICATOR_COLUMNS = {
+        ('survey', ConsciousnessDimension.ECONOMIC_CONSCIOUSNESS): 'economic_survey_score',
+        ('survey', ConsciousnessDimension.POLITICAL_CONSCIOUSNESS): 'political_survey_score',
+        ('survey', ConsciousnessDimension.SOCIAL_CONSCIOUSNESS): 'social_survey_score',
+        ('survey', ConsciousnessDimension.HISTORICAL_CONSCIOUSNESS): 'historical_survey_score',
+        ('survey', ConsciousnessDimension.REVOLUTIONARY_CONSCIOUSNESS): 'revolutionary_survey_score',
+        ('interview', ConsciousnessDimension.ECONOMIC_CONSCIOUSNESS): 'economic_interview_score',
+        ('interview', ConsciousnessDimension.POLITICAL_CONSCIOUSNESS): 'political_interview_score',
+        ('interview', ConsciousnessDimension.SOCIAL_CONSCIOUSNESS): 'social_interview_score',
+        ('interview', ConsciousnessDimension.HISTORICAL_CONSCIOUSNESS): 'historical_interview_score',
+        ('interview', ConsciousnessDimension.REVOLUTIONARY_CONSCIOUSNESS): 'revolutionary_interview_score',
+        ('observation', ConsciousnessDimension.ECONOMIC_CONSCIOUSNESS): 'economic_observation_score',
+        ('observation', ConsciousnessDimension.POLITICAL_CONSCIOUSNESS): 'political_observation_score',
+        ('observation', ConsciousnessDimension.SOCIAL_CONSCIOUSNESS): 'social_observation_score',
+        ('content_analysis', ConsciousnessDimension.POLITICAL_CONSCIOUSNESS): 'political_content_score',
+        ('content_analysis', ConsciousnessDimension.HISTORICAL_CONSCIOUSNESS): 'historical_content_score',
+        ('behavioral_analysis', ConsciousnessDimension.POLITICAL_CONSCIOUSNESS): 'political_behavior_score',
+        ('behavioral_analysis', ConsciousnessDimension.REVOLUTIONARY_CONSCIOUSNESS): 'revolutionary_behavior_score'
+    }
+    
     def __init__(self):
         self.consciousness_weights = {
             ConsciousnessDimension.ECONOMIC_CONSCIOUSNESS: 0.25,
@@ -252,12 +282,14 @@ class ClassConsciousnessAnalyzer:
             dimension_score = 0.0
             total_weight = 0.0
             
+            measured_indicators = []
             for indicator in dim_indicators:
-                # 根据测量方法获取数据
+                # 根据测量方法获取数据，使用副本以免修改共享的指标体系
                 raw_value = self._extract_indicator_value(indicator.measurement_method, individual_data, dimension)
-                indicator.value = raw_value
+                measured = replace(indicator, value=raw_value)
+                measured_indicators.append(measured)
                 
-                weighted_score = indicator.weighted_score()
+                weighted_score = measured.weighted_score()
                 dimension_score += weighted_score
                 total_weight += indicator.weight
             
@@ -267,7 +299,7 @@ class ClassConsciousnessAnalyzer:
             
             measurement_results[dimension] = {
                 'score': dimension_score,
-                'indicators': dim_indicators,
+                'indicators': measured_indicators,
                 'reliability': np.mean([ind.reliability for ind in dim_indicators])
             }
         
@@ -288,37 +320,129 @@ class ClassConsciousnessAnalyzer:
                                data: Dict, 
                                dimension: ConsciousnessDimension) -> float:
         """提取指标值"""
-        method_mappings = {
-            'survey': {
-                ConsciousnessDimension.ECONOMIC_CONSCIOUSNESS: data.get('economic_survey_score', 0.5),
-                ConsciousnessDimension.POLITICAL_CONSCIOUSNESS: data.get('political_survey_score', 0.5),
-                ConsciousnessDimension.SOCIAL_CONSCIOUSNESS: data.get('social_survey_score', 0.5),
-                ConsciousnessDimension.HISTORICAL_CONSCIOUSNESS: data.get('historical_survey_score', 0.5),
-                ConsciousnessDimension.REVOLUTIONARY_CONSCIOUSNESS: data.get('revolutionary_survey_score', 0.5)
-            },
-            'interview': {
-                ConsciousnessDimension.ECONOMIC_CONSCIOUSNESS: data.get('economic_interview_score', 0.5),
-                ConsciousnessDimension.POLITICAL_CONSCIOUSNESS: data.get('political_interview_score', 0.5),
-                ConsciousnessDimension.SOCIAL_CONSCIOUSNESS: data.get('social_interview_score', 0.5),
-                ConsciousnessDimension.HISTORICAL_CONSCIOUSNESS: data.get('historical_interview_score', 0.5),
-                ConsciousnessDimension.REVOLUTIONARY_CONSCIOUSNESS: data.get('revolutionary_interview_score', 0.5)
-            },
-            'observation': {
-                ConsciousnessDimension.ECONOMIC_CONSCIOUSNESS: data.get('economic_observation_score', 0.5),
-                ConsciousnessDimension.POLITICAL_CONSCIOUSNESS: data.get('political_observation_score', 0.5),
-                ConsciousnessDimension.SOCIAL_CONSCIOUSNESS: data.get('social_observation_score', 0.5)
-            },
-            'content_analysis': {
-                ConsciousnessDimension.POLITICAL_CONSCIOUSNESS: data.get('political_content_score', 0.5),
-                ConsciousnessDimension.HISTORICAL_CONSCIOUSNESS: data.get('historical_content_score', 0.5)
-            },
-            'behavioral_analysis': {
-                ConsciousnessDimension.POLITICAL_CONSCIOUSNESS: data.get('political_behavior_score', 0.5),
-                ConsciousnessDimension.REVOLUTIONARY_CONSCIOUSNESS: data.get('revolutionary_behavior_score', 0.5)
-            }
+        column = self.INDICATOR_COLUMNS.get((method, dimension))
+        return data.get(column, 0.5) if column else 0.5
+    
+    def compile_indicator_system(self, 
+                               indicators: Optional[Dict[ConsciousnessDimension, List[ConsciousnessIndicator]]] = None
+                               ) -> CompiledIndicatorSystem:
+        """
+        将指标体系编译为权重矩阵
+        
+        Args:
+            indicators: 指标体系，默认使用construct_consciousness_indicators构建
+            
+        Returns:
+            编译后的指标体系
+        """
+        if indicators is None:
+            indicators = self.construct_consciousness_indicators()
+        
+        dimensions = list(indicators)
+        columns = []
+        rows = []
+        for dim_index, (dimension, dim_indicators) in enumerate(indicators.items()):
+            total_weight = sum(indicator.weight for indicator in dim_indicators)
+            for indicator in dim_indicators:
+                columns.append(self.INDICATOR_COLUMNS.get((indicator.measurement_method, dimension)))
+                row = np.zeros(len(dimensions))
+                row[dim_index] = indicator.weight / total_weight if total_weight > 0 else indicator.weight
+                rows.append(row)
+        
+        return CompiledIndicatorSystem(
+            dimensions=dimensions,
+            columns=columns,
+            weight_matrix=np.array(rows).reshape(len(columns), len(dimensions)),
+            dimension_weights=np.array([self.consciousness_weights[dimension] for dimension in dimensions]),
+            dimension_reliability=np.array([
+                np.mean([indicator.reliability for indicator in dim_indicators])
+                for dim_indicators in indicators.values()
+            ])
+        )
+    
+    def measure_population(self, 
+                         respondents: Union[pd.DataFrame, Dict[str, Any], List[Dict]],
+                         compiled: Optional[CompiledIndicatorSystem] = None) -> Dict:
+        """
+        以矩阵乘法测量整张受访者表的阶级意识水平
+        
+        Args:
+            respondents: 受访者表，DataFrame、列名到数组的字典或个体字典列表；
+                缺失的列与缺失值按默认值0.5处理
+            compiled: 编译后的指标体系，默认编译construct_consciousness_indicators的结果
+            
+        Returns:
+            各维度得分、整体水平、转化阶段与可靠性，每行对应一个受访者
+        """
+        if compiled is None:
+            compiled = self.compile_indicator_system()
+        table = respondents if isinstance(respondents, pd.DataFrame) else pd.DataFrame(respondents)
+        
+        values = np.full((len(table), len(compiled.columns)), 0.5)
+        for position, column in enumerate(compiled.columns):
+            if column is not None and column in table:
+                values[:, position] = table[column].to_numpy(dtype=float, na_value=np.nan)
+        values = np.where(np.isnan(values), 0.5, values)
+        
+        dimension_scores = values @ compiled.weight_matrix
+        overall_level = dimension_scores @ compiled.dimension_weights
+        
+        # 按转化阈值划分阶段，恰好等于阈值时进入较高阶段
+        thresholds = sorted(self.transformation_thresholds.values())
+        stage_names = np.array([phase.value for phase in TransformationPhase], dtype=object)
+        stages = stage_names[np.searchsorted(thresholds, overall_level, side='right')]
+        
+        dimension_names = [dimension.value for dimension in compiled.dimensions]
+        return {
+            'dimension_scores': pd.DataFrame(dimension_scores, index=table.index, columns=dimension_names),
+            'overall_level': pd.Series(overall_level, index=table.index, name='overall_level'),
+            'transformation_stage': pd.Series(stages, index=table.index, name='transformation_stage'),
+            'dimension_reliability': pd.Series(compiled.dimension_reliability, index=dimension_names),
+            'measurement_quality': float(np.mean(compiled.dimension_reliability))
         }
+    
+    def measure_longitudinal_waves(self, 
+                                 panel: pd.DataFrame,
+                                 wave_column: str = 'wave',
+                                 id_column: Optional[str] = 'respondent_id',
+                                 compiled: Optional[CompiledIndicatorSystem] = None) -> Dict:
+        """
+        测量纵向追踪调查各轮次的阶级意识水平
+        
+        Args:
+            panel: 长格式面板数据，每行为某受访者在某一轮次的测量
+            wave_column: 轮次列名，轮次按取值排序
+            id_column: 受访者编号列名，提供时返回每个受访者跨轮次的水平与变化
+            compiled: 编译后的指标体系
+            
+        Returns:
+            逐行得分、各轮次均值，以及（有编号列时）受访者×轮次的整体水平与轮次间变化
+        """
+        measurement = self.measure_population(panel, compiled)
+        keys = [column for column in (id_column, wave_column) if column and column in panel]
+        scores = pd.concat([
+            panel[keys],
+            measurement['dimension_scores'],
+            measurement['overall_level'],
+            measurement['transformation_stage']
+        ], axis=1)
+        
+        score_columns = list(measurement['dimension_scores'].columns) + ['overall_level']
+        result = {
+            'scores': scores,
+            'wave_summary': scores.groupby(wave_column)[score_columns].mean().sort_index(),
+            'dimension_reliability': measurement['dimension_reliability'],
+            'measurement_quality': measurement['measurement_quality']
+        }
+        
+        if id_column and id_column in panel:
+            overall_by_wave = scores.pivot_table(
+                index=id_column, columns=wave_column, values='overall_level', aggfunc='mean'
+            ).sort_index(axis=1)
+            result['overall_by_wave'] = overall_by_wave
+            result['wave_change'] = overall_by_wave.diff(axis=1).iloc[:, 1:]
         
-        return method_mappings.get(method, {}).get(dimension, 0.5)
+        return result
     
     def analyze_transformation_process(self, 
                                      consciousness_history: List[ConsciousnessDevelopment]) -> Dict:
@@ -0,0 +1,3 @@
+"""
+公共模块：依赖管理与文本分析技能共享的基础设施
+"""
@@ -0,0 +1,318 @@
+"""
+理论词汇多模式匹配模块
+
+将各分析器的理论词汇库一次性编译为Aho-Corasick自动机，单次扫描文本即可
+得到每个词项的出现次数与位置，以及各词汇类别的命中统计，替代逐词调用
+text.count(word)或re.findall(word, text)的多遍扫描。安装pyahocorasick时
+使用其C实现，否则使用纯Python自动机。长文本可按段落增量扫描，反复编辑时
+只需重新扫描改动过的段落。
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Hashable, Iterable, List, Tuple
+
+import numpy as np
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# 段落切分：每段以换行符结尾（最后一段可以没有），各段拼接即为原文
+_PARAGRAPH_PATTERN = re.compile(r'[^\n]*\n*')
+
+
+class _PythonAutomaton:
+    """纯Python实现的Aho-Corasick自动机"""
+
+    def __init__(self, terms: List[str]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[int]] = [[]]
+
+        for term_id, term in enumerate(terms):
+            state = 0
+            for char in term:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = next_state
+            self.output[state].append(term_id)
+
+        # 广度优先构建失败指针，并把后缀状态的输出合并到当前状态
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def iter(self, text: str):
+        """逐个产出(结束位置, 词项编号)，包含重叠匹配"""
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for term_id in output[state]:
+                yield end, term_id
+
+
+class LexiconHits:
+    """单篇文本的词汇命中结果
+
+    计数语义与str.count一致：同一词项的出现互不重叠，不同词项之间允许重叠。
+    """
+
+    def __init__(self, matcher: 'LexiconMatcher', text: str, positions: Dict[str, List[int]]):
+        self._matcher = matcher
+        self._text = text
+        self.positions = positions
+        self._delimiter_positions: Dict[str, List[int]] = {}
+
+    def starts(self, term: str) -> List[int]:
+        """词项各次出现的起始位置"""
+        if term in self._matcher.term_index:
+            return self.positions.get(term, [])
+        starts, start = [], self._text.find(term)
+        while term and start >= 0:
+            starts.append(start)
+            start = self._text.find(term, start + len(term))
+        return starts
+
+    def count(self, term: str) -> int:
+        """词项出现次数"""
+        if term in self._matcher.term_index:
+            return len(self.positions.get(term, ()))
+        # 不在词汇库中的词项退回到直接计数
+        return self._text.count(term)
+
+    def contains(self, term: str) -> bool:
+        """词项是否出现"""
+        return self.count(term) > 0
+
+    def total(self, terms: Iterable[str]) -> int:
+        """多个词项的出现次数之和，等价于sum(text.count(t) for t in terms)"""
+        return sum(self.count(term) for term in terms)
+
+    def present(self, terms: Iterable[str]) -> int:
+        """出现过的词项个数，等价于sum(1 for t in terms if t in text)"""
+        return sum(1 for term in terms if self.contains(term))
+
+    def segments(self, term: str, delimiter: str = '。') -> List[str]:
+        """包含词项的分句，结果与re.findall(f'([^{delimiter}]*{term}[^{delimiter}]*)', text)一致"""
+        bounds = self._delimiter_positions.get(delimiter)
+        if bounds is None:
+            bounds = [match.start() for match in re.finditer(re.escape(delimiter), self._text)]
+            self._delimiter_positions[delimiter] = bounds
+
+        segments, last_index = [], -1
+        for start in self.starts(term):
+            index = bisect_left(bounds, start)
+            # 同一分句内的多次出现只返回一次
+            if index == last_index:
+                continue
+            last_index = index
+            begin = bounds[index - 1] + 1 if index > 0 else 0
+            end = bounds[index] if index < len(bounds) else len(self._text)
+            segments.append(self._text[begin:end])
+        return segments
+
+    def category_count(self, category: Hashable) -> int:
+        """某词汇类别的总命中次数"""
+        return self.total(self._matcher.categories[category])
+
+    def category_counts(self) -> Dict[Hashable, int]:
+        """所有词汇类别的命中次数"""
+        return {category: self.total(terms) for category, terms in self._matcher.categories.items()}
+
+
+class LexiconMatcher:
+    """多词汇类别的单遍匹配器
+
+    Args:
+        lexicon: 类别到词项列表的映射，列表中重复的词项按重复次数计入类别统计
+        cache_size: 最近扫描结果的缓存条数，同一文本被多个评分函数使用时只扫描一次
+        paragraph_cache_size: 增量扫描时段落扫描结果的缓存条数
+    """
+
+    def __init__(self, lexicon: Dict[Hashable, Iterable[str]], cache_size: int = 32,
+                 paragraph_cache_size: int = 4096):
+        self.categories: Dict[Hashable, List[str]] = {
+            category: [term for term in terms if term] for category, terms in lexicon.items()
+        }
+        self.terms: List[str] = list(dict.fromkeys(
+            term for terms in self.categories.values() for term in terms
+        ))
+        self.term_index: Dict[str, int] = {term: i for i, term in enumerate(self.terms)}
+        self._term_lengths = [len(term) for term in self.terms]
+        self._automaton = self._build_automaton()
+        self.cache_size = cache_size
+        self._cache: 'OrderedDict[str, LexiconHits]' = OrderedDict()
+        self.paragraph_cache_size = paragraph_cache_size
+        self._paragraph_cache: 'OrderedDict[str, Dict[str, List[int]]]' = OrderedDict()
+        # 词项跨越换行时段落边界会切断匹配，此时增量扫描退回整篇扫描
+        self._paragraph_safe = not any('\n' in term for term in self.terms)
+        # 同一匹配器可能被多个线程共用，缓存的读写需加锁（扫描本身在锁外进行）
+        self._cache_lock = threading.Lock()
+
+    @classmethod
+    def from_vocabularies(cls, *vocabularies: Any, **kwargs) -> 'LexiconMatcher':
+        """由嵌套的词汇库字典构建匹配器
+
+        每个字符串列表成为一个类别，类别键为字典路径组成的元组，
+        例如{'tool_level': {'primitive': [...]}}得到类别('tool_level', 'primitive')。
+        """
+        lexicon: Dict[Tuple, List[str]] = {}
+
+        def walk(node, path):
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    walk(value, path + (key,))
+            elif isinstance(node, (list, tuple, set)) and all(isinstance(item, str) for item in node):
+                lexicon[path] = list(node)
+
+        for vocabulary in vocabularies:
+            walk(vocabulary, ())
+        return cls(lexicon, **kwargs)
+
+    def scan(self, text: str) -> LexiconHits:
+        """单遍扫描文本，返回各词项的出现位置"""
+        cached = self._cached_hits(text)
+        if cached is not None:
+            return cached
+        return self._store_hits(LexiconHits(self, text, self._positions(text)))
+
+    def scan_incremental(self, text: str) -> LexiconHits:
+        """按段落增量扫描，结果与scan(text)一致
+
+        各段落的匹配位置按段落内容单独缓存，再加上段落偏移拼接为整篇文本的
+        命中结果；编辑长文本后重新评估时，只有改动过的段落需要重新扫描。
+        """
+        cached = self._cached_hits(text)
+        if cached is not None:
+            return cached
+        if not self._paragraph_safe or '\n' not in text:
+            return self.scan(text)
+
+        positions: Dict[str, List[int]] = {}
+        offset = 0
+        for paragraph in _PARAGRAPH_PATTERN.findall(text):
+            if not paragraph:
+                continue
+            for term, starts in self._paragraph_positions(paragraph).items():
+                target = positions.setdefault(term, [])
+                target.extend(start + offset for start in starts)
+            offset += len(paragraph)
+
+        return self._store_hits(LexiconHits(self, text, positions))
+
+    def scan_many(self, texts: Iterable[str], workers: int = 0) -> List[LexiconHits]:
+        """批量扫描，workers大于1时在多个进程中扫描"""
+        texts = list(texts)
+        if workers <= 1 or len(texts) < workers:
+            return [self._scan_uncached(text) for text in texts]
+
+        chunk_size = max(1, len(texts) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            all_positions = list(executor.map(self._positions, texts, chunksize=chunk_size))
+        return [LexiconHits(self, text, positions) for text, positions in zip(texts, all_positions)]
+
+    def count_matrix(self, texts: Iterable[str], workers: int = 0) -> Tuple[np.ndarray, List[Hashable]]:
+        """批量统计类别命中次数，返回(文本数 × 类别数)矩阵及类别顺序"""
+        categories = list(self.categories)
+        # 类别-词项权重矩阵，重复词项按重复次数计权
+        weights = np.zeros((len(self.terms), len(categories)), dtype=np.int64)
+        for col, category in enumerate(categories):
+            for term, multiplicity in Counter(self.categories[category]).items():
+                weights[self.term_index[term], col] = multiplicity
+
+        hits_list = self.scan_many(texts, workers)
+        term_counts = np.zeros((len(hits_list), len(self.terms)), dtype=np.int64)
+        for row, hits in enumerate(hits_list):
+            for term, starts in hits.positions.items():
+                term_counts[row, self.term_index[term]] = len(starts)
+        return term_counts @ weights, categories
+
+    def _cached_hits(self, text: str):
+        with self._cache_lock:
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache.move_to_end(text)
+            return cached
+
+    def _store_hits(self, hits: LexiconHits) -> LexiconHits:
+        if self.cache_size:
+            with self._cache_lock:
+                self._cache[hits._text] = hits
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return hits
+
+    def _paragraph_positions(self, paragraph: str) -> Dict[str, List[int]]:
+        with self._cache_lock:
+            positions = self._paragraph_cache.get(paragraph)
+            if positions is not None:
+                self._paragraph_cache.move_to_end(paragraph)
+                return positions
+        positions = self._positions(paragraph)
+        if self.paragraph_cache_size:
+            with self._cache_lock:
+                self._paragraph_cache[paragraph] = positions
+                if len(self._paragraph_cache) > self.paragraph_cache_size:
+                    self._paragraph_cache.popitem(last=False)
+        return positions
+
+    def _scan_uncached(self, text: str) -> LexiconHits:
+        return LexiconHits(self, text, self._positions(text))
+
+    def _positions(self, text: str) -> Dict[str, List[int]]:
+        positions: Dict[str, List[int]] = {}
+        if not self.terms:
+            return positions
+
+        next_free = [0] * len(self.terms)
+        lengths = self._term_lengths
+        for end, term_id in self._automaton.iter(text):
+            start = end - lengths[term_id] + 1
+            # 与str.count相同，同一词项只统计不重叠的出现
+            if start >= next_free[term_id]:
+                next_free[term_id] = end + 1
+                positions.setdefault(self.terms[term_id], []).append(start)
+        return positions
+
+    def _build_automaton(self):
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton(ahocorasick.STORE_INTS)
+            for term_id, term in enumerate(self.terms):
+                automaton.add_word(term, term_id)
+            if self.terms:
+                automaton.make_automaton()
+            return automaton
+        return _PythonAutomaton(self.terms)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_cache'] = OrderedDict()
+        state['_paragraph_cache'] = OrderedDict()
+        del state['_cache_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
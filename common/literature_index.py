@@ -0,0 +1,433 @@
+"""
+本地文献全文索引模块
+
+为arxiv-paper-search、pubscholar-auto-search及文献智能体集成器检索到的文献
+元数据建立嵌入式倒排索引（SQLite FTS5）：导出或采集结果时增量写入，之后可在
+离线状态下按关键词进行BM25排序检索，并按年份、分类、来源过滤。中文文本先经
+共享分词服务切分为词语再写入索引，英文词语经Porter词干化。
+
+命令行（在项目根目录执行）：
+    python -m common.literature_index --index lit.sqlite3 add papers.json --source arxiv
+    python -m common.literature_index --index lit.sqlite3 search '双重差分' --year-from 2018
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from common.text_tokenizer import TokenizationService, get_tokenizer
+
+# 索引文件路径的环境变量，未设置且未显式指定路径时不建立索引
+INDEX_PATH_ENV = 'SSCI_LITERATURE_INDEX'
+
+# 索引字段及其BM25权重（标题命中比摘要命中更重要）
+INDEXED_FIELDS = ('title', 'keywords', 'abstract', 'authors')
+FIELD_WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+
+# 查询中忽略的常见虚词（引号内的短语保留原样）
+QUERY_STOPWORDS = frozenset([
+    '的', '了', '和', '与', '及', '或', '在', '是', '对', '等', '中', '之',
+    'a', 'an', 'the', 'of', 'and', 'or', 'in', 'on', 'for', 'to', 'with',
+])
+
+_WORD_PATTERN = re.compile(r'\w', re.UNICODE)
+_WORDS_PATTERN = re.compile(r'\w+', re.UNICODE)
+_HAN_PATTERN = re.compile(r'[\u4e00-\u9fff]')
+_QUERY_PART_PATTERN = re.compile(r'"([^"]+)"|(\S+)')
+_ARXIV_URL_PATTERN = re.compile(r'arxiv\.org/(?:abs|pdf)/(.+?)(?:v\d+)?(?:\.pdf)?$', re.IGNORECASE)
+_YEAR_PATTERN = re.compile(r'(19|20)\d{2}')
+
+
+def document_key(paper: Dict, source: str) -> str:
+    """
+    计算文献在索引中的唯一键
+
+    优先使用arXiv ID（不含版本号）与DOI，同一论文的不同版本或不同来源只保留一条；
+    都没有时依次使用URL、来源与标题。
+
+    Args:
+        paper: 文献字典
+        source: 来源名称
+
+    Returns:
+        索引键
+    """
+    for field in ('pdf_url', 'url'):
+        match = _ARXIV_URL_PATTERN.search(paper.get(field) or '')
+        if match:
+            return 'arxiv:' + match.group(1).lower()
+    if paper.get('doi'):
+        return 'doi:' + paper['doi'].lower()
+    if paper.get('url'):
+        return 'url:' + paper['url']
+    title = re.sub(r'\s+', ' ', paper.get('title') or '').strip().lower()
+    return f"{source}:" + hashlib.sha1(title.encode('utf-8')).hexdigest()
+
+
+def _field_text(value) -> str:
+    if isinstance(value, (list, tuple)):
+        return ' '.join(str(item) for item in value)
+    return str(value or '')
+
+
+def _paper_fields(paper: Dict) -> Dict[str, str]:
+    """提取索引字段的原文（arXiv的摘要字段为summary）"""
+    return {
+        'title': _field_text(paper.get('title')),
+        'keywords': _field_text(paper.get('keywords')),
+        'abstract': _field_text(paper.get('abstract') or paper.get('summary')),
+        'authors': _field_text(paper.get('authors')),
+    }
+
+
+def _paper_year(paper: Dict) -> Optional[int]:
+    for field in ('year', 'published'):
+        match = _YEAR_PATTERN.search(str(paper.get(field) or ''))
+        if match:
+            return int(match.group(0))
+    return None
+
+
+class LiteratureIndex:
+    """
+    基于SQLite FTS5的文献全文索引（线程安全）
+
+    分词在锁外进行；写入时在同一事务内重新查询已有文献，多个线程同时写入
+    同一文献时只有一次插入，全文索引与分类行对应最终写入的文档id。
+
+    Args:
+        db_path: 索引数据库文件路径
+        tokenizer: 分词服务，None时使用进程内共享的分词服务
+    """
+
+    def __init__(self, db_path: str, tokenizer: Optional[TokenizationService] = None):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.tokenizer = tokenizer or get_tokenizer()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                CREATE TABLE IF NOT EXISTS documents (
+                    id INTEGER PRIMARY KEY,
+                    doc_key TEXT NOT NULL UNIQUE,
+                    source TEXT NOT NULL,
+                    year INTEGER,
+                    content_hash TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    indexed_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_documents_year ON documents (year);
+                CREATE INDEX IF NOT EXISTS idx_documents_source ON documents (source);
+                CREATE TABLE IF NOT EXISTS document_categories (
+                    doc_id INTEGER NOT NULL,
+                    category TEXT NOT NULL,
+                    PRIMARY KEY (category, doc_id)
+                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+                    title, keywords, abstract, authors,
+                    tokenize = 'porter unicode61 remove_diacritics 2'
+                );
+                """
+            )
+            self._conn.commit()
+
+    def add_papers(self, papers: Iterable[Dict], source: str) -> Dict[str, int]:
+        """
+        增量写入文献：新文献插入，内容变化的文献更新，未变化的跳过
+
+        Args:
+            papers: 文献字典
+            source: 来源名称（如arxiv、pubscholar）
+
+        Returns:
+            {"added", "updated", "unchanged"}计数
+        """
+        source = source.lower()
+        entries = {}
+        for paper in papers:
+            # index是检索结果中的序号，与文献内容无关
+            payload = {key: value for key, value in paper.items() if key != 'index'}
+            serialized = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+            entries[document_key(paper, source)] = (
+                payload, serialized, hashlib.sha1(serialized.encode('utf-8')).hexdigest()
+            )
+
+        counts = {'added': 0, 'updated': 0, 'unchanged': 0}
+        if not entries:
+            return counts
+
+        with self._lock:
+            existing = self._existing_documents(list(entries))
+
+        changed = {}
+        for doc_key, (payload, serialized, content_hash) in entries.items():
+            if doc_key in existing and existing[doc_key][1] == content_hash:
+                counts['unchanged'] += 1
+            else:
+                changed[doc_key] = (payload, serialized, content_hash)
+        if not changed:
+            return counts
+
+        # 分词在锁外批量进行，四个字段展开为一个列表；不含汉字的文本由FTS5直接切分
+        texts = [text for payload, _, _ in changed.values() for text in _paper_fields(payload).values()]
+        segmented = [text.lower() for text in texts]
+        han_positions = [i for i, text in enumerate(texts) if _HAN_PATTERN.search(text)]
+        if han_positions:
+            tokenized = self.tokenizer.tokenize_many([texts[i] for i in han_positions])
+            for i, tokens in zip(han_positions, tokenized):
+                segmented[i] = self._segment(tokens)
+
+        now = time.time()
+        with self._lock:
+            with self._conn:
+                # 分词期间其他线程可能已写入同一文献，在写事务内重新查询
+                existing = self._existing_documents(list(changed))
+                for position, (doc_key, (payload, serialized, content_hash)) in enumerate(changed.items()):
+                    if doc_key in existing and existing[doc_key][1] == content_hash:
+                        counts['unchanged'] += 1
+                        continue
+                    fields = segmented[position * len(INDEXED_FIELDS):(position + 1) * len(INDEXED_FIELDS)]
+                    year = _paper_year(payload)
+                    if doc_key in existing:
+                        doc_id = existing[doc_key][0]
+                        self._conn.execute(
+                            'UPDATE documents SET source = ?, year = ?, content_hash = ?, payload = ?, '
+                            'indexed_at = ? WHERE id = ?',
+                            (source, year, content_hash, serialized, now, doc_id)
+                        )
+                        self._conn.execute('DELETE FROM documents_fts WHERE rowid = ?', (doc_id,))
+                        self._conn.execute('DELETE FROM document_categories WHERE doc_id = ?', (doc_id,))
+                        counts['updated'] += 1
+                    else:
+                        doc_id = self._conn.execute(
+                            'INSERT INTO documents (doc_key, source, year, content_hash, payload, indexed_at) '
+                            'VALUES (?, ?, ?, ?, ?, ?)',
+                            (doc_key, source, year, content_hash, serialized, now)
+                        ).lastrowid
+                        counts['added'] += 1
+                    self._conn.execute(
+                        'INSERT INTO documents_fts (rowid, title, keywords, abstract, authors) '
+                        'VALUES (?, ?, ?, ?, ?)',
+                        (doc_id, *fields)
+                    )
+                    self._conn.executemany(
+                        'INSERT OR IGNORE INTO document_categories VALUES (?, ?)',
+                        [(doc_id, category) for category in payload.get('categories') or []]
+                    )
+        return counts
+
+    def _existing_documents(self, keys: List[str]) -> Dict[str, tuple]:
+        """查询已索引文献的(id, content_hash)，调用方需持有锁"""
+        existing = {}
+        for start in range(0, len(keys), 500):
+            batch = keys[start:start + 500]
+            placeholders = ','.join('?' * len(batch))
+            for doc_key, doc_id, content_hash in self._conn.execute(
+                f'SELECT doc_key, id, content_hash FROM documents WHERE doc_key IN ({placeholders})', batch
+            ):
+                existing[doc_key] = (doc_id, content_hash)
+        return existing
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        match_all: bool = True
+    ) -> List[Dict]:
+        """
+        关键词检索，按BM25相关度排序
+
+        查询先经分词；双引号内的内容作为短语匹配，其余词语按match_all取交集或并集。
+        查询为空时只按过滤条件列出文献（按年份倒序）。
+
+        Args:
+            query: 查询字符串，如'双重差分 "difference in differences"'
+            limit: 最多返回的条数
+            year_from: 起始年份（含）
+            year_to: 截止年份（含）
+            category: 分类（如cs.AI）
+            source: 来源（如arxiv、pubscholar）
+            match_all: True表示所有词语都须出现，False表示出现任一即可
+
+        Returns:
+            [{"doc_key", "source", "year", "score", "paper"}]，score越大越相关
+        """
+        conditions, params = [], []
+        if year_from is not None:
+            conditions.append('d.year >= ?')
+            params.append(year_from)
+        if year_to is not None:
+            conditions.append('d.year <= ?')
+            params.append(year_to)
+        if source:
+            conditions.append('d.source = ?')
+            params.append(source.lower())
+        if category:
+            conditions.append('d.id IN (SELECT doc_id FROM document_categories WHERE category = ?)')
+            params.append(category)
+
+        expression = self._match_expression(query, match_all)
+        if expression:
+            weights = ', '.join(str(weight) for weight in FIELD_WEIGHTS)
+            sql = (
+                f'SELECT d.doc_key, d.source, d.year, d.payload, -bm25(documents_fts, {weights}) AS score '
+                'FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid '
+                'WHERE documents_fts MATCH ?'
+                + ''.join(f' AND {condition}' for condition in conditions)
+                + ' ORDER BY bm25(documents_fts, ' + weights + ') LIMIT ?'
+            )
+            params = [expression] + params
+        elif query.strip():
+            # 查询只包含虚词或标点
+            return []
+        else:
+            sql = (
+                'SELECT d.doc_key, d.source, d.year, d.payload, 0.0 AS score FROM documents d'
+                + (' WHERE ' + ' AND '.join(conditions) if conditions else '')
+                + ' ORDER BY d.year DESC, d.id DESC LIMIT ?'
+            )
+
+        with self._lock:
+            rows = self._conn.execute(sql, params + [limit]).fetchall()
+        return [
+            {'doc_key': doc_key, 'source': row_source, 'year': year, 'score': score, 'paper': json.loads(payload)}
+            for doc_key, row_source, year, payload, score in rows
+        ]
+
+    def count(self, source: Optional[str] = None) -> int:
+        """已索引的文献数"""
+        with self._lock:
+            if source:
+                return self._conn.execute(
+                    'SELECT COUNT(*) FROM documents WHERE source = ?', (source.lower(),)
+                ).fetchone()[0]
+            return self._conn.execute('SELECT COUNT(*) FROM documents').fetchone()[0]
+
+    def optimize(self):
+        """合并FTS5索引段，大批量写入后执行可加快查询"""
+        with self._lock:
+            self._conn.execute("INSERT INTO documents_fts(documents_fts) VALUES ('optimize')")
+            self._conn.commit()
+
+    def close(self):
+        """关闭索引数据库"""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _segment(tokens: List[str]) -> str:
+        """将分词结果以空格连接，去掉空白与纯标点"""
+        return ' '.join(token.lower() for token in tokens if _WORD_PATTERN.search(token))
+
+    def _match_expression(self, query: str, match_all: bool) -> str:
+        """将查询字符串转换为FTS5 MATCH表达式，词语均加引号以避免语法字符冲突"""
+        parts = []
+        for phrase, word in _QUERY_PART_PATTERN.findall(query):
+            text = phrase or word
+            if _HAN_PATTERN.search(text):
+                tokens = [token.lower() for token in self.tokenizer.tokenize(text) if _WORD_PATTERN.search(token)]
+            else:
+                tokens = _WORDS_PATTERN.findall(text.lower())
+            if phrase:
+                if tokens:
+                    parts.append('"' + ' '.join(token.replace('"', '""') for token in tokens) + '"')
+            else:
+                parts.extend(
+                    '"' + token.replace('"', '""') + '"'
+                    for token in tokens if token not in QUERY_STOPWORDS
+                )
+        return (' AND ' if match_all else ' OR ').join(parts)
+
+
+_indexes: Dict[str, LiteratureIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_literature_index(db_path: Optional[str] = None) -> Optional[LiteratureIndex]:
+    """
+    获取进程内共享的索引实例
+
+    Args:
+        db_path: 索引文件路径，None时读取SSCI_LITERATURE_INDEX环境变量
+
+    Returns:
+        文献索引，未指定路径且未设置环境变量时返回None
+    """
+    db_path = db_path or os.environ.get(INDEX_PATH_ENV)
+    if not db_path:
+        return None
+    key = os.path.abspath(db_path)
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = LiteratureIndex(key)
+        return _indexes[key]
+
+
+def _load_export(path: str) -> List[Dict]:
+    """读取JSON或JSON Lines格式的检索结果导出文件"""
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.jsonl'):
+            return [json.loads(line) for line in f if line.strip()]
+        data = json.load(f)
+    return data if isinstance(data, list) else data.get('papers', [])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='本地文献全文索引：导入检索结果或离线检索')
+    parser.add_argument('--index', default=None, help=f'索引文件路径（默认读取{INDEX_PATH_ENV}环境变量）')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    add_parser = subparsers.add_parser('add', help='导入JSON/JSON Lines格式的检索结果')
+    add_parser.add_argument('files', nargs='+', help='导出文件')
+    add_parser.add_argument('--source', required=True, help='来源名称（如arxiv、pubscholar）')
+
+    search_parser = subparsers.add_parser('search', help='关键词检索')
+    search_parser.add_argument('query', nargs='?', default='', help='查询字符串，双引号内为短语')
+    search_parser.add_argument('--limit', type=int, default=20, help='返回条数')
+    search_parser.add_argument('--year-from', type=int, default=None, help='起始年份')
+    search_parser.add_argument('--year-to', type=int, default=None, help='截止年份')
+    search_parser.add_argument('--category', default=None, help='分类（如cs.AI）')
+    search_parser.add_argument('--source', default=None, help='来源')
+    search_parser.add_argument('--any', action='store_true', help='匹配任一词语（默认须匹配全部词语）')
+    args = parser.parse_args()
+
+    index = get_literature_index(args.index)
+    if index is None:
+        print(f"错误：请通过--index或{INDEX_PATH_ENV}环境变量指定索引文件", file=sys.stderr)
+        sys.exit(1)
+
+    if args.command == 'add':
+        for path in args.files:
+            counts = index.add_papers(_load_export(path), args.source)
+            print(f"✓ {path}: 新增 {counts['added']}，更新 {counts['updated']}，未变化 {counts['unchanged']}")
+        index.optimize()
+        print(f"索引共 {index.count()} 篇文献")
+        return
+
+    start = time.perf_counter()
+    hits = index.search(args.query, limit=args.limit, year_from=args.year_from, year_to=args.year_to,
+                        category=args.category, source=args.source, match_all=not args.any)
+    elapsed = (time.perf_counter() - start) * 1000
+    for rank, hit in enumerate(hits, 1):
+        paper = hit['paper']
+        print(f"{rank}. [{hit['source']} {hit['year'] or '-'}] {paper.get('title', '')}  ({hit['score']:.2f})")
+    print(f"共 {len(hits)} 条，耗时 {elapsed:.1f} 毫秒")
+
+
+if __name__ == '__main__':
+    main()
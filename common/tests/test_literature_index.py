@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+单元测试 - 本地文献全文索引
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from common.literature_index import LiteratureIndex
+from common.text_tokenizer import TokenizationService
+
+
+def make_papers(count: int, revision: int = 0):
+    return [
+        {
+            'title': f'数字劳动与平台资本主义研究{i}',
+            'abstract': f'本文运用双重差分方法分析平台劳动者的异化状况，第{revision}版',
+            'authors': [f'作者{i}'],
+            'url': f'https://arxiv.org/abs/2401.{i:05d}',
+            'published': '2024-01-15',
+            'categories': ['cs.CY', 'econ.GN'],
+        }
+        for i in range(count)
+    ]
+
+
+def run_concurrently(index: LiteratureIndex, batches):
+    """各线程同时开始写入，返回各线程的计数与异常"""
+    barrier = threading.Barrier(len(batches))
+    results, errors = [], []
+
+    def worker(papers):
+        barrier.wait()
+        try:
+            results.append(index.add_papers(papers, 'arxiv'))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(papers,)) for papers in batches]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def index_rows(index: LiteratureIndex):
+    conn = index._conn
+    doc_ids = {row[0] for row in conn.execute('SELECT id FROM documents')}
+    fts_ids = [row[0] for row in conn.execute('SELECT rowid FROM documents_fts')]
+    category_ids = {row[0] for row in conn.execute('SELECT doc_id FROM document_categories')}
+    return doc_ids, fts_ids, category_ids
+
+
+class TestConcurrentWriters:
+    """测试多个线程同时写入同一批文献"""
+
+    def test_same_new_papers(self, tmp_path):
+        """同时写入相同的新文献：每篇只插入一次，全文索引与分类行对应实际写入的文档"""
+        index = LiteratureIndex(str(tmp_path / 'lit.sqlite3'), tokenizer=TokenizationService())
+        results, errors = run_concurrently(index, [make_papers(300) for _ in range(4)])
+
+        assert errors == []
+        assert sum(result['added'] for result in results) == 300
+        assert sum(result['unchanged'] for result in results) == 300 * 3
+        doc_ids, fts_ids, category_ids = index_rows(index)
+        assert len(doc_ids) == 300
+        assert sorted(fts_ids) == sorted(doc_ids)
+        assert category_ids == doc_ids
+        assert len(index.search('平台资本主义', limit=500)) == 300
+        index.close()
+
+    def test_same_changed_papers(self, tmp_path):
+        """同时更新相同的文献：每篇只更新一次，不残留旧的全文索引行"""
+        index = LiteratureIndex(str(tmp_path / 'lit.sqlite3'), tokenizer=TokenizationService())
+        index.add_papers(make_papers(100), 'arxiv')
+        results, errors = run_concurrently(index, [make_papers(100, revision=1) for _ in range(4)])
+
+        assert errors == []
+        assert sum(result['updated'] for result in results) == 100
+        assert sum(result['added'] for result in results) == 0
+        doc_ids, fts_ids, _ = index_rows(index)
+        assert len(doc_ids) == 100
+        assert sorted(fts_ids) == sorted(doc_ids)
+        assert len(index.search('第1版', limit=500)) == 100
+        index.close()
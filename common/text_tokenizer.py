@@ -0,0 +1,226 @@
+"""
+共享分词服务模块
+
+为韦伯、涂尔干、马克思及开放编码等文本分析技能提供统一的分词层：
+每篇文档只分词一次，分词结果与词性标注按内容哈希缓存（内存LRU + 可选的
+磁盘SQLite存储），并支持多进程批量分词以处理大规模语料。
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import jieba
+import jieba.analyse
+import jieba.posseg as pseg
+
+# 磁盘缓存目录的环境变量，未设置时仅使用内存缓存
+CACHE_DIR_ENV = 'SSCI_TOKEN_CACHE_DIR'
+
+# 分词模式：cut为jieba精确模式，pos为词性标注，han为连续汉字片段
+TOKENIZE_MODES = ('cut', 'pos', 'han')
+
+_HAN_PATTERN = re.compile(r'[\u4e00-\u9fff]+')
+
+
+def _tokenize(text: str, mode: str) -> list:
+    """按模式对单篇文本分词（模块级函数，便于多进程序列化）"""
+    if mode == 'cut':
+        return jieba.lcut(text)
+    if mode == 'pos':
+        return [(pair.word, pair.flag) for pair in pseg.cut(text)]
+    if mode == 'han':
+        return _HAN_PATTERN.findall(text)
+    raise ValueError(f"不支持的分词模式: {mode}")
+
+
+def _tokenize_chunk(args: Tuple[List[str], str]) -> List[list]:
+    """子进程中批量分词"""
+    texts, mode = args
+    return [_tokenize(text, mode) for text in texts]
+
+
+def content_key(text: str, mode: str) -> str:
+    """计算文本在指定分词模式下的缓存键"""
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16)
+    digest.update(mode.encode('ascii'))
+    return digest.hexdigest()
+
+
+class _DiskTokenStore:
+    """基于SQLite的分词结果持久化存储"""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS tokens (key TEXT PRIMARY KEY, payload TEXT NOT NULL)'
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: List[str]) -> Dict[str, list]:
+        found = {}
+        with self._lock:
+            # SQLite默认的变量数上限为999，分批查询
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ','.join('?' * len(batch))
+                rows = self._conn.execute(
+                    f'SELECT key, payload FROM tokens WHERE key IN ({placeholders})', batch
+                )
+                for key, payload in rows:
+                    found[key] = json.loads(payload)
+        return found
+
+    def put_many(self, items: Dict[str, list]):
+        if not items:
+            return
+        rows = [(key, json.dumps(value, ensure_ascii=False)) for key, value in items.items()]
+        with self._lock:
+            self._conn.executemany('INSERT OR REPLACE INTO tokens VALUES (?, ?)', rows)
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class TokenizationService:
+    """带缓存的中文分词服务
+
+    Args:
+        cache_size: 内存LRU缓存的最大条目数
+        cache_dir: 磁盘缓存目录，None表示仅使用内存缓存
+        workers: 批量分词时的进程数，0或1表示在当前进程中分词
+        parallel_threshold: 未命中文档数达到该值时才启用多进程
+    """
+
+    def __init__(self, cache_size: int = 4096, cache_dir: Optional[str] = None,
+                 workers: int = 0, parallel_threshold: int = 64):
+        self.cache_size = cache_size
+        self.workers = workers
+        self.parallel_threshold = parallel_threshold
+        self._memory: 'OrderedDict[str, list]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = _DiskTokenStore(Path(cache_dir) / 'tokens.sqlite3') if cache_dir else None
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+
+    def tokenize(self, text: str, mode: str = 'cut') -> List:
+        """对单篇文本分词，返回缓存的分词结果（调用方不应修改返回的列表）"""
+        return self.tokenize_many([text], mode)[0]
+
+    def pos_tag(self, text: str) -> List[Tuple[str, str]]:
+        """词性标注，返回(词, 词性)列表"""
+        return [tuple(pair) for pair in self.tokenize(text, 'pos')]
+
+    def tokenize_many(self, texts: Iterable[str], mode: str = 'cut') -> List[List]:
+        """批量分词，相同内容只分词一次，未命中缓存的文档可多进程处理"""
+        if mode not in TOKENIZE_MODES:
+            raise ValueError(f"不支持的分词模式: {mode}")
+
+        texts = list(texts)
+        keys = [content_key(text, mode) for text in texts]
+        results: Dict[str, list] = {}
+
+        with self._lock:
+            for key in keys:
+                if key in self._memory and key not in results:
+                    self._memory.move_to_end(key)
+                    results[key] = self._memory[key]
+                    self._stats['memory_hits'] += 1
+
+        pending = {key: text for key, text in zip(keys, texts) if key not in results}
+        if pending and self._disk is not None:
+            from_disk = self._disk.get_many(list(pending))
+            with self._lock:
+                self._stats['disk_hits'] += len(from_disk)
+            for key, tokens in from_disk.items():
+                results[key] = tokens
+                del pending[key]
+            self._remember(from_disk)
+
+        if pending:
+            with self._lock:
+                self._stats['misses'] += len(pending)
+            computed = dict(zip(pending, self._compute(list(pending.values()), mode)))
+            results.update(computed)
+            self._remember(computed)
+            if self._disk is not None:
+                self._disk.put_many(computed)
+
+        return [results[key] for key in keys]
+
+    def extract_tags(self, text: str, topK: int = 20, withWeight: bool = False) -> List:
+        """基于缓存分词结果的TF-IDF关键词提取，结果与jieba.analyse.extract_tags一致"""
+        tfidf = jieba.analyse.default_tfidf
+        freq: Dict[str, float] = {}
+        for word in self.tokenize(text):
+            if len(word.strip()) < 2 or word.lower() in tfidf.stop_words:
+                continue
+            freq[word] = freq.get(word, 0.0) + 1.0
+
+        total = sum(freq.values())
+        for word in freq:
+            freq[word] *= tfidf.idf_freq.get(word, tfidf.median_idf) / total
+
+        if withWeight:
+            tags = sorted(freq.items(), key=itemgetter(1), reverse=True)
+        else:
+            tags = sorted(freq, key=freq.__getitem__, reverse=True)
+        return tags[:topK] if topK else tags
+
+    def cache_info(self) -> Dict[str, int]:
+        """返回缓存命中统计"""
+        with self._lock:
+            return dict(self._stats, memory_size=len(self._memory))
+
+    def clear(self):
+        """清空内存缓存"""
+        with self._lock:
+            self._memory.clear()
+
+    def close(self):
+        """关闭磁盘存储"""
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+    def _remember(self, items: Dict[str, list]):
+        with self._lock:
+            for key, tokens in items.items():
+                self._memory[key] = tokens
+                self._memory.move_to_end(key)
+            while len(self._memory) > self.cache_size:
+                self._memory.popitem(last=False)
+
+    def _compute(self, texts: List[str], mode: str) -> List[list]:
+        if self.workers <= 1 or len(texts) < self.parallel_threshold or mode == 'han':
+            return [_tokenize(text, mode) for text in texts]
+
+        # 与jieba并行模式相同采用多进程，但按文档分块以保留文档边界
+        chunk_size = max(1, len(texts) // (self.workers * 4))
+        chunks = [(texts[i:i + chunk_size], mode) for i in range(0, len(texts), chunk_size)]
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            return [tokens for chunk in executor.map(_tokenize_chunk, chunks) for tokens in chunk]
+
+
+_default_service: Optional[TokenizationService] = None
+_default_lock = threading.Lock()
+
+
+def get_tokenizer() -> TokenizationService:
+    """获取进程内共享的分词服务，磁盘缓存目录由SSCI_TOKEN_CACHE_DIR环境变量指定"""
+    global _default_service
+    with _default_lock:
+        if _default_service is None:
+            _default_service = TokenizationService(cache_dir=os.environ.get(CACHE_DIR_ENV))
+        return _default_service
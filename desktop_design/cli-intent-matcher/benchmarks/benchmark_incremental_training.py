@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+增量训练基准测试
+
+按小批量向交互日志写入合成的交互记录，比较随着历史增长：
+1. 完整重训（AdaptiveTrainer的TF-IDF + 随机森林配置）在全部历史上的训练耗时与准确率
+2. IncrementalTrainer每个小批量的更新延迟与准确率
+3. IncrementalTrainer完整重训（漂移或定期触发时）的耗时
+
+准确率在同分布、不含标签噪声的固定测试集上计算。
+
+示例：python benchmarks/benchmark_incremental_training.py --sizes 1000 4000 16000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.multioutput import MultiOutputClassifier
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from src.incremental_trainer import IncrementalTrainer
+from src.interaction_log import InteractionLog
+from src.model_manager import ModelManager
+
+TOOL_PHRASES = {
+    "claude": ["debug", "refactor", "code review", "unit test", "explain function", "fix bug", "type error"],
+    "qwen": ["generate code", "algorithm", "optimize loop", "system design", "data structure"],
+    "gemini": ["research", "summarize paper", "translate", "literature", "survey", "find sources"],
+    "codebuddy": ["best practice", "lint", "programming tip", "code style", "naming"],
+    "stigmergy": ["skill", "workflow", "coordinate agents", "pipeline", "multi agent"],
+}
+FILLERS = ["please", "help me", "can you", "quickly", "for my project", "today", "in python", "the report",
+           "this file", "my data", "again", "with examples"]
+
+
+def make_sample(rng: random.Random, label_noise: float):
+    tool = rng.choice(list(TOOL_PHRASES))
+    words = rng.sample(FILLERS, 2) + [rng.choice(TOOL_PHRASES[tool])] + rng.sample(FILLERS, 1)
+    rng.shuffle(words)
+    label = rng.choice(list(TOOL_PHRASES)) if rng.random() < label_noise else tool
+    return " ".join(words), label
+
+
+def full_retrain(texts, labels, test_texts, test_labels):
+    """与AdaptiveTrainer.train_model相同的向量化与分类器配置"""
+    start = time.perf_counter()
+    vectorizer = TfidfVectorizer(max_features=5000, stop_words='english', ngram_range=(1, 2))
+    classifier = MultiOutputClassifier(RandomForestClassifier(n_estimators=100, random_state=42))
+    classifier.fit(vectorizer.fit_transform(texts), np.column_stack([labels]))
+    seconds = time.perf_counter() - start
+    predictions = classifier.predict(vectorizer.transform(test_texts))[:, 0]
+    return seconds, float(np.mean(predictions == np.asarray(test_labels)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='增量训练基准测试')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 4000, 16000],
+                        help='测量时的历史记录条数（默认1000 4000 16000）')
+    parser.add_argument('--batch-size', type=int, default=64, help='增量更新的小批量大小（默认64）')
+    parser.add_argument('--label-noise', type=float, default=0.1, help='训练记录的标签噪声比例（默认0.1）')
+    parser.add_argument('--skip-full', action='store_true', help='跳过随机森林完整重训（较慢）')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    test = [make_sample(rng, 0.0) for _ in range(2000)]
+    test_texts = [text for text, _ in test]
+    test_labels = [label for _, label in test]
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        interaction_log = InteractionLog(os.path.join(tmp_dir, 'interactions.sqlite3'))
+        # 关闭定期与漂移重训，单独测量增量更新；快照间隔设为很大，只计算更新本身
+        trainer = IncrementalTrainer(
+            batch_size=args.batch_size, refit_interval=10 ** 9, drift_threshold=1.0, snapshot_interval=10 ** 9,
+            labels=list(TOOL_PHRASES), model_manager=ModelManager(os.path.join(tmp_dir, 'models')),
+            interaction_log=interaction_log
+        )
+        history = []
+        for size in sorted(args.sizes):
+            latencies = []
+            while len(history) < size:
+                batch = [make_sample(rng, args.label_noise) for _ in range(min(args.batch_size, size - len(history)))]
+                for text, label in batch:
+                    interaction_log.append("usage", {"user_input": text, "actual_tool": label, "success": True})
+                history.extend(batch)
+                start = time.perf_counter()
+                trainer.update()
+                latencies.append(time.perf_counter() - start)
+            # 只统计最近的更新，反映当前历史规模下的延迟
+            recent = latencies[-20:]
+            incremental_accuracy = float(np.mean(np.asarray(trainer.predict(test_texts)) == np.asarray(test_labels)))
+
+            refit_trainer = IncrementalTrainer(
+                batch_size=args.batch_size, labels=list(TOOL_PHRASES),
+                model_manager=ModelManager(os.path.join(tmp_dir, f'refit_models_{size}')),
+                interaction_log=interaction_log
+            )
+            refit_info = refit_trainer.full_refit("manual")
+            refit_accuracy = float(np.mean(np.asarray(refit_trainer.predict(test_texts)) == np.asarray(test_labels)))
+
+            full_seconds, full_accuracy = (None, None)
+            if not args.skip_full:
+                full_seconds, full_accuracy = full_retrain(
+                    [text for text, _ in history], [label for _, label in history], test_texts, test_labels
+                )
+            rows.append((size, statistics.median(recent) * 1000, max(recent) * 1000, incremental_accuracy,
+                         refit_info["seconds"], refit_accuracy, full_seconds, full_accuracy))
+        interaction_log.close()
+
+    print(f"\n小批量大小 {args.batch_size}，标签噪声 {args.label_noise:.0%}，测试集 {len(test)} 条")
+    print(f"{'历史条数':>8}{'增量更新中位(ms)':>18}{'增量更新最大(ms)':>18}{'增量准确率':>12}"
+          f"{'SGD重训(s)':>12}{'SGD重训准确率':>14}{'RF完整重训(s)':>15}{'RF准确率':>10}")
+    for size, median_ms, max_ms, inc_acc, refit_s, refit_acc, full_s, full_acc in rows:
+        full_s_text = f"{full_s:>15.2f}" if full_s is not None else f"{'-':>15}"
+        full_acc_text = f"{full_acc:>10.3f}" if full_acc is not None else f"{'-':>10}"
+        print(f"{size:>8}{median_ms:>18.2f}{max_ms:>18.2f}{inc_acc:>12.3f}"
+              f"{refit_s:>12.2f}{refit_acc:>14.3f}{full_s_text}{full_acc_text}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+交互日志写入基准测试
+
+比较旧版“读取整个JSON数组→追加→整体重写”的记录方式与InteractionLog
+追加写入的吞吐量，并测量历史记录较多时启动加载全部记录的耗时。
+
+示例：python benchmarks/benchmark_interaction_log.py --history 5000 --writes 500
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from src.interaction_log import InteractionLog
+
+
+def make_record(index: int):
+    return {
+        "id": f"conv_{index}",
+        "timestamp": datetime.now().isoformat(),
+        "user_input": f"帮我分析第{index}组访谈数据的编码结果",
+        "predicted_tool": "grounded-theory-expert",
+        "success": index % 7 != 0
+    }
+
+
+def legacy_append(path: str, record):
+    """旧版写法：每条记录都重新读取并整体写回JSON文件"""
+    records = []
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            records = json.load(f)
+    records.append(record)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(records, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='交互日志写入基准测试')
+    parser.add_argument('--history', type=int, default=5000, help='预先写入的历史记录数（默认5000）')
+    parser.add_argument('--writes', type=int, default=500, help='计时的写入次数（默认500）')
+    args = parser.parse_args()
+
+    history = [make_record(i) for i in range(args.history)]
+    new_records = [make_record(args.history + i) for i in range(args.writes)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_path = os.path.join(tmp_dir, 'conversations.json')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(history, f, indent=2, ensure_ascii=False)
+        start = time.perf_counter()
+        for record in new_records:
+            legacy_append(json_path, record)
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with open(json_path, 'r', encoding='utf-8') as f:
+            legacy_loaded = len(json.load(f))
+        legacy_load = time.perf_counter() - start
+
+        log = InteractionLog(os.path.join(tmp_dir, 'interactions.sqlite3'))
+        log.replace('conversations', history, key_field='id')
+        start = time.perf_counter()
+        for record in new_records:
+            log.append('conversations', record, key=record['id'])
+        log_seconds = time.perf_counter() - start
+        log.close()
+
+        start = time.perf_counter()
+        log = InteractionLog(os.path.join(tmp_dir, 'interactions.sqlite3'))
+        log_loaded = len(log.load('conversations'))
+        log_load = time.perf_counter() - start
+        log.close()
+
+    print(f"历史记录 {args.history} 条，计时写入 {args.writes} 条")
+    print(f"{'方式':<16}{'写入/秒':>12}{'单条(ms)':>12}{'启动加载(ms)':>16}{'记录数':>10}")
+    for name, seconds, load, loaded in [
+        ('JSON整体重写', legacy_seconds, legacy_load, legacy_loaded),
+        ('InteractionLog', log_seconds, log_load, log_loaded),
+    ]:
+        print(f"{name:<16}{args.writes / seconds:>12.0f}{seconds / args.writes * 1000:>12.3f}"
+              f"{load * 1000:>16.1f}{loaded:>10}")
+    print(f"写入加速比: {legacy_seconds / log_seconds:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
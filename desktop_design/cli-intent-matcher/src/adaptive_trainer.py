@@ -2,7 +2,6 @@
 
 import json
 import os
-import subprocess
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +14,10 @@ from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, classification_report
 import numpy as np
 
+from .environment_scanner import EnvironmentScanner
+from .incremental_trainer import INTERACTION_STREAMS, IncrementalTrainer, interaction_to_sample
+from .interaction_log import InteractionLog
+
 
 class AdaptiveTrainer:
     """自适应训练模块 - 根据用户环境和使用数据训练模型"""
@@ -37,50 +40,8 @@ class AdaptiveTrainer:
         Path(self.training_history_path).mkdir(parents=True, exist_ok=True)
     
     def scan_environment(self) -> Dict[str, Any]:
-        """扫描用户本地环境"""
-        environment_info = {
-            "timestamp": datetime.now().isoformat(),
-            "cli_tools": {},
-            "skills": {},
-            "available_models": []
-        }
-        
-        # 扫描CLI工具
-        cli_list = ["stigmergy", "claude", "qwen", "gemini", "codebuddy", "iflow", "codex", "qodercli", "copilot"]
-        
-        for cli_name in cli_list:
-            try:
-                result = subprocess.run([cli_name, "--help"], 
-                                      capture_output=True, text=True, timeout=10, shell=True,
-                                      encoding='utf-8', errors='ignore')
-                if result.returncode == 0 or result.returncode == 1:
-                    environment_info["cli_tools"][cli_name] = {
-                        "available": True,
-                        "parameters": self._extract_parameters(result.stdout or "")
-                    }
-                else:
-                    environment_info["cli_tools"][cli_name] = {"available": False}
-            except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-                environment_info["cli_tools"][cli_name] = {"available": False}
-        
-        # 扫描技能
-        try:
-            result = subprocess.run(["stigmergy", "skill", "list"], 
-                                  capture_output=True, text=True, timeout=10, shell=True)
-            if result.returncode == 0:
-                skills = self._parse_skills_list(result.stdout)
-                environment_info["skills"] = skills
-        except Exception:
-            # 如果命令失败，尝试从本地目录加载
-            environment_info["skills"] = self._load_skills_from_directory()
-        
-        # 保存环境配置
-        env_config_path = "cli-intent-matcher/config/environment_config.json"
-        Path(env_config_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(env_config_path, 'w', encoding='utf-8') as f:
-            json.dump(environment_info, f, indent=2, ensure_ascii=False)
-        
-        return environment_info
+        """扫描用户本地环境（并行探测CLI工具，可执行文件未变化时复用缓存的探测结果）"""
+        return EnvironmentScanner().scan_all()
     
     def _extract_parameters(self, help_text: str) -> List[str]:
         """从帮助文本中提取参数"""
@@ -160,6 +121,17 @@ class AdaptiveTrainer:
             except Exception:
                 continue
         
+        # DataCollector写入的交互日志
+        log_path = logs_dir / "interactions.sqlite3"
+        if log_path.exists():
+            interaction_log = InteractionLog(str(log_path))
+            try:
+                for stream in INTERACTION_STREAMS:
+                    user_logs.extend(sample for sample in map(interaction_to_sample, interaction_log.iter(stream))
+                                     if sample)
+            finally:
+                interaction_log.close()
+        
         return user_logs
     
     def create_training_data(self, environment_info: Dict[str, Any], user_data: List[Dict[str, Any]]) -> pd.DataFrame:
@@ -420,6 +392,32 @@ class AdaptiveTrainer:
         with open(history_file, 'w') as f:
             json.dump(history_data, f, indent=2)
     
+    def create_incremental_trainer(self, **kwargs) -> IncrementalTrainer:
+        """创建增量训练器，以环境扫描生成的样本作为完整重训的基础样本"""
+        environment_info = self.scan_environment()
+        base_df = self.create_training_data(environment_info, [])
+        return IncrementalTrainer(
+            model_path=self.model_path,
+            logs_dir=self.user_logs_path,
+            base_samples=base_df.to_dict('records'),
+            labels=list(environment_info.get("cli_tools", {}).keys()),
+            **kwargs
+        )
+    
+    def run_incremental_training(self, trainer: Optional[IncrementalTrainer] = None) -> Dict[str, Any]:
+        """
+        增量训练：只用上次训练之后的新交互记录按小批量更新模型，
+        漂移或定期时自动完整重训，并保存版本化快照
+        """
+        print("开始增量训练...")
+        trainer = trainer or self.create_incremental_trainer()
+        stats = trainer.update()
+        if trainer.updates_since_snapshot:
+            stats["snapshot"] = trainer.snapshot()
+        print(f"增量训练完成：{stats['samples']} 个新样本，{stats['batches']} 个小批量，"
+              f"完整重训 {len(stats['refits'])} 次，耗时 {stats['seconds']:.3f} 秒")
+        return dict(stats, status="success", model_name=trainer.snapshot_name)
+    
     def run_adaptive_training(self) -> Dict[str, Any]:
         """运行完整的自适应训练流程"""
         print("开始自适应训练流程...")
@@ -461,8 +459,13 @@ class AdaptiveTrainer:
 
 
 def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='自适应训练')
+    parser.add_argument('--incremental', action='store_true', help='只用新的交互记录增量更新模型')
+    args = parser.parse_args()
+    
     trainer = AdaptiveTrainer()
-    result = trainer.run_adaptive_training()
+    result = trainer.run_incremental_training() if args.incremental else trainer.run_adaptive_training()
     print(f"训练结果: {result}")
 
 
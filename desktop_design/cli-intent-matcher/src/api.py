@@ -1,9 +1,10 @@
 # API接口
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, g
 from typing import Dict, Any
 import sys
 import os
+import time
 
 # 添加src目录到Python路径
 sys.path.append(os.path.join(os.path.dirname(__file__)))
@@ -12,15 +13,39 @@ from src.intent_classifier import CLIIntentClassifier
 from src.cli_matcher import CLIMatcher
 from src.satisfaction_tracker import SatisfactionFeedbackInterface
 from src.intelligent_satisfaction_detector import IntelligentSatisfactionDetector
+from src.classification_service import ClassificationService, LatencyHistogram
 
+# 单次/classify请求允许的最大输入条数
+MAX_BATCH_SIZE = 256
 
-def create_app():
+
+def create_app(cache_size: int = 1024):
     app = Flask(__name__)
     
     # 初始化组件
     intent_classifier = CLIIntentClassifier()
     cli_matcher = CLIMatcher()
     
+    # 批量分类、结果缓存与异步记录
+    classification_service = ClassificationService(intent_classifier, cache_size=cache_size)
+    
+    # 按端点统计请求延迟
+    latency_histograms: Dict[str, LatencyHistogram] = {}
+    
+    @app.before_request
+    def start_timer():
+        g.request_start = time.perf_counter()
+    
+    @app.after_request
+    def record_latency(response):
+        start = g.get('request_start')
+        if start is not None and request.endpoint:
+            histogram = latency_histograms.get(request.endpoint)
+            if histogram is None:
+                histogram = latency_histograms.setdefault(request.endpoint, LatencyHistogram())
+            histogram.record(time.perf_counter() - start)
+        return response
+    
     # 初始化满意度跟踪组件
     satisfaction_interface = SatisfactionFeedbackInterface(intent_classifier.satisfaction_tracker)
     satisfaction_detector = IntelligentSatisfactionDetector(intent_classifier.satisfaction_tracker)
@@ -35,15 +60,29 @@ def create_app():
     
     @app.route('/classify', methods=['POST'])
     def classify_intent():
-        """分类用户意图"""
+        """分类用户意图（user_input为单条输入，user_inputs为批量输入）"""
         try:
             data = request.get_json()
+            user_inputs = data.get('user_inputs')
+            
+            if user_inputs is not None:
+                if (not isinstance(user_inputs, list) or not user_inputs or
+                        not all(isinstance(item, str) and item for item in user_inputs)):
+                    return jsonify({"error": "user_inputs must be a non-empty list of non-empty strings"}), 400
+                if len(user_inputs) > MAX_BATCH_SIZE:
+                    return jsonify({"error": f"user_inputs accepts at most {MAX_BATCH_SIZE} items"}), 400
+                
+                return jsonify({
+                    "success": True,
+                    "data": classification_service.classify_batch(user_inputs)
+                })
+            
             user_input = data.get('user_input', '')
             
             if not user_input:
                 return jsonify({"error": "user_input is required"}), 400
             
-            recommendations = intent_classifier.get_recommendations(user_input)
+            recommendations = classification_service.classify_batch([user_input])[0]
             
             return jsonify({
                 "success": True,
@@ -186,7 +225,8 @@ def create_app():
             if satisfaction_score < 1 or satisfaction_score > 5:
                 return jsonify({"error": "satisfaction_score must be between 1 and 5"}), 400
             
-            # 添加满意度反馈
+            # 等待异步记录的对话写入后再添加满意度反馈
+            classification_service.recorder.flush()
             intent_classifier.satisfaction_tracker.add_satisfaction_feedback(
                 conversation_id, satisfaction_score, feedback_text
             )
@@ -214,6 +254,7 @@ def create_app():
                 return jsonify({"error": "conversation_id and follow_up_input are required"}), 400
             
             # 处理后续对话
+            classification_service.recorder.flush()
             intent_classifier.process_follow_up(conversation_id, follow_up_input)
             
             return jsonify({
@@ -231,6 +272,7 @@ def create_app():
     def get_satisfaction_insights():
         """获取满意度洞察"""
         try:
+            classification_service.recorder.flush()
             insights = intent_classifier.get_satisfaction_insights()
             overall_satisfaction = intent_classifier.satisfaction_tracker.calculate_overall_satisfaction()
             
@@ -252,6 +294,7 @@ def create_app():
     def get_conversation_satisfaction(conversation_id: str):
         """获取特定对话的满意度信息"""
         try:
+            classification_service.recorder.flush()
             feedback = intent_classifier.get_conversation_feedback(conversation_id)
             
             return jsonify({
@@ -268,6 +311,27 @@ def create_app():
                 "error": str(e)
             }), 500
     
+    @app.route('/metrics/latency', methods=['GET'])
+    def get_latency_metrics():
+        """获取各端点的请求延迟分布（p50/p90/p99）及分类缓存状态"""
+        try:
+            return jsonify({
+                "success": True,
+                "data": {
+                    "endpoints": {
+                        endpoint: histogram.snapshot()
+                        for endpoint, histogram in sorted(latency_histograms.items())
+                    },
+                    "classification": classification_service.stats()
+                }
+            })
+        
+        except Exception as e:
+            return jsonify({
+                "success": False,
+                "error": str(e)
+            }), 500
+    
     return app
 
 
@@ -278,12 +342,13 @@ def main():
     print("API将在 http://localhost:5000 上运行")
     print("可用端点:")
     print("  GET  /health - 健康检查")
-    print("  POST /classify - 分类用户意图")
+    print("  POST /classify - 分类用户意图（user_inputs支持批量）")
     print("  POST /execute - 执行用户意图")
     print("  POST /plan - 获取执行计划")
     print("  POST /validate - 验证命令")
     print("  GET  /skills - 获取可用技能")
     print("  GET  /cli-tools - 获取可用CLI工具")
+    print("  GET  /metrics/latency - 请求延迟分布")
     
     app.run(debug=True, host='0.0.0.0', port=5000)
 
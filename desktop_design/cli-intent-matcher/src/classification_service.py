@@ -0,0 +1,268 @@
+# 分类服务模块：批量分类、结果缓存、异步记录与延迟统计
+
+import bisect
+import copy
+import math
+import queue
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class LRUCache:
+    """有界LRU缓存（线程安全）"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key) -> Optional[Any]:
+        """读取缓存，命中时移到最近使用的位置"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        """写入缓存，超出容量时淘汰最久未使用的条目"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """缓存命中统计"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+
+class LatencyHistogram:
+    """按对数间隔分桶的延迟直方图（线程安全），百分位数取所在桶的上界"""
+
+    def __init__(self, min_ms: float = 0.05, max_ms: float = 60000.0, growth: float = 1.25):
+        """
+        初始化直方图
+
+        Args:
+            min_ms: 第一个桶的上界（毫秒）
+            max_ms: 最后一个有限桶的上界（毫秒），更大的值计入溢出桶
+            growth: 相邻桶上界的比例，决定百分位数的相对误差
+        """
+        bounds = [min_ms]
+        while bounds[-1] < max_ms:
+            bounds.append(bounds[-1] * growth)
+        self.bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, seconds: float):
+        """记录一次耗时（秒）"""
+        ms = seconds * 1000
+        index = bisect.bisect_left(self.bounds, ms)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total_ms += ms
+            self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> float:
+        """第q百分位数（毫秒），q取0~100"""
+        with self._lock:
+            return self._percentile(q)
+
+    def _percentile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(q / 100 * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                bound = self.bounds[index] if index < len(self.bounds) else self.max_ms
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        """汇总统计，buckets只列出非空桶"""
+        with self._lock:
+            buckets = [
+                {"le_ms": round(self.bounds[index], 3) if index < len(self.bounds) else None, "count": bucket_count}
+                for index, bucket_count in enumerate(self._counts) if bucket_count
+            ]
+            return {
+                "count": self.count,
+                "mean_ms": self.total_ms / self.count if self.count else 0.0,
+                "p50_ms": self._percentile(50),
+                "p90_ms": self._percentile(90),
+                "p99_ms": self._percentile(99),
+                "max_ms": self.max_ms,
+                "buckets": buckets
+            }
+
+
+class BackgroundRecorder:
+    """在后台线程中依次执行日志与满意度记录任务，使其不占用请求处理时间"""
+
+    def __init__(self, maxsize: int = 10000):
+        """
+        初始化记录器
+
+        Args:
+            maxsize: 队列容量，队列满时任务在调用线程中直接执行（不丢弃记录）
+        """
+        self._queue = queue.Queue(maxsize=maxsize)
+        self.failed = 0
+        self._thread = threading.Thread(target=self._worker, name="interaction-recorder", daemon=True)
+        self._thread.start()
+
+    def submit(self, func: Callable, *args, **kwargs):
+        """提交一个记录任务"""
+        try:
+            self._queue.put_nowait((func, args, kwargs))
+        except queue.Full:
+            self._run(func, args, kwargs)
+
+    def flush(self):
+        """等待已提交的任务全部执行完毕（读取记录结果之前调用）"""
+        self._queue.join()
+
+    def pending(self) -> int:
+        """尚未执行的任务数"""
+        return self._queue.qsize()
+
+    def _worker(self):
+        while True:
+            func, args, kwargs = self._queue.get()
+            try:
+                self._run(func, args, kwargs)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, func: Callable, args: Tuple, kwargs: Dict):
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            self.failed += 1
+            print(f"后台记录任务失败: {e}")
+
+
+class ClassificationService:
+    """
+    分类服务：批量分类并缓存结果
+
+    缓存以规范化输入和模型版本为键，只保存与输入原文无关的分类结果；
+    命令建议、对话记录与满意度调整在每次请求时重新生成，
+    对话记录交给后台记录器异步写入。
+    """
+
+    def __init__(self, classifier, cache_size: int = 1024, recorder: Optional[BackgroundRecorder] = None):
+        """
+        初始化分类服务
+
+        Args:
+            classifier: CLIIntentClassifier实例
+            cache_size: 分类结果缓存的最大条目数
+            recorder: 后台记录器，None时内部创建
+        """
+        self.classifier = classifier
+        self.cache = LRUCache(cache_size)
+        self.recorder = recorder or BackgroundRecorder()
+
+    @staticmethod
+    def normalize(user_input: str) -> str:
+        """规范化输入：去除首尾空白、合并连续空白并转为小写（分类器本身不区分大小写）"""
+        return re.sub(r'\s+', ' ', user_input.strip()).lower()
+
+    def classify_batch(self, user_inputs: List[str]) -> List[Dict[str, Any]]:
+        """
+        批量获取推荐结果
+
+        Args:
+            user_inputs: 用户输入列表
+
+        Returns:
+            与输入一一对应的推荐结果（含conversation_id）
+        """
+        classifications = self._classify_cached(user_inputs)
+
+        # 满意度历史对整批请求相同，只计算一次
+        adjuster = self.classifier.adaptive_response_system.adjuster
+        satisfaction_history = adjuster._get_user_satisfaction_history("")
+
+        results = []
+        for user_input, cached in zip(user_inputs, classifications):
+            classification = copy.deepcopy(cached)
+            classification["command_suggestion"] = self.classifier._generate_command_suggestion(
+                user_input, classification["cli_tool"], classification["skills"]
+            )
+
+            timestamp = time.time()
+            conversation_id = f"conv_{int(timestamp)}_{uuid.uuid4().hex[:8]}"
+            self.recorder.submit(
+                self.classifier.satisfaction_tracker.add_conversation,
+                user_input, classification["cli_tool"], classification["command_suggestion"],
+                timestamp=timestamp, conversation_id=conversation_id
+            )
+
+            recommendations = self.classifier.build_recommendations(user_input, classification, conversation_id)
+            results.append(adjuster.adjust_recommendations_by_satisfaction(
+                user_input, recommendations, satisfaction_history
+            ))
+        return results
+
+    def _classify_cached(self, user_inputs: List[str]) -> List[Dict[str, Any]]:
+        """读取缓存，未命中的输入去重后一次性交给分类器"""
+        version = self.classifier.model_version
+        keys = [(self.normalize(user_input), version) for user_input in user_inputs]
+
+        found = {}
+        missing = OrderedDict()
+        for key, user_input in zip(keys, user_inputs):
+            if key in found or key in missing:
+                continue
+            cached = self.cache.get(key)
+            if cached is None:
+                missing[key] = user_input
+            else:
+                found[key] = cached
+
+        if missing:
+            for key, classification in zip(missing, self.classifier.classify_intents(list(missing.values()))):
+                classification = {k: v for k, v in classification.items() if k != "command_suggestion"}
+                self.cache.put(key, classification)
+                found[key] = classification
+
+        return [found[key] for key in keys]
+
+    def stats(self) -> Dict[str, Any]:
+        """缓存与后台记录队列状态"""
+        return {
+            "model_version": self.classifier.model_version,
+            "cache": self.cache.stats(),
+            "recorder": {"pending": self.recorder.pending(), "failed": self.recorder.failed}
+        }
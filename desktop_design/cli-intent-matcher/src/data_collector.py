@@ -1,12 +1,10 @@
 # 数据收集模块
 
-import json
-import os
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List
-import threading
-import time
+
+from .interaction_log import InteractionLog
 
 
 class DataCollector:
@@ -15,9 +13,13 @@ class DataCollector:
     def __init__(self, logs_dir: str = "cli-intent-matcher/data/user_logs"):
         self.logs_dir = Path(logs_dir)
         self.logs_dir.mkdir(parents=True, exist_ok=True)
+        # 旧版整体保存的JSON文件，首次启动时导入交互日志
         self.feedback_file = self.logs_dir / "feedback.json"
         self.usage_log_file = self.logs_dir / "usage_log.json"
-        self.lock = threading.Lock()  # 线程安全
+        # 每条记录追加一行，写入开销与历史长度无关，不再限制条数（存储自身线程安全）
+        self.store = InteractionLog(str(self.logs_dir / "interactions.sqlite3"))
+        self.store.import_legacy_json("usage", str(self.usage_log_file))
+        self.store.import_legacy_json("feedback", str(self.feedback_file))
     
     def log_user_interaction(self, user_input: str, predicted_tool: str, actual_tool: str = None, 
                            success: bool = True, feedback: str = None, timestamp: str = None) -> bool:
@@ -35,27 +37,7 @@ class DataCollector:
         }
         
         try:
-            with self.lock:
-                # 读取现有日志
-                usage_logs = []
-                if self.usage_log_file.exists():
-                    with open(self.usage_log_file, 'r', encoding='utf-8') as f:
-                        try:
-                            usage_logs = json.load(f)
-                        except json.JSONDecodeError:
-                            usage_logs = []
-                
-                # 添加新日志
-                usage_logs.append(interaction)
-                
-                # 限制日志数量，防止文件过大
-                if len(usage_logs) > 1000:  # 保留最近1000条记录
-                    usage_logs = usage_logs[-1000:]
-                
-                # 写入文件
-                with open(self.usage_log_file, 'w', encoding='utf-8') as f:
-                    json.dump(usage_logs, f, indent=2, ensure_ascii=False)
-            
+            self.store.append("usage", interaction)
             return True
         except Exception as e:
             print(f"记录用户交互失败: {e}")
@@ -74,27 +56,7 @@ class DataCollector:
         }
         
         try:
-            with self.lock:
-                # 读取现有反馈
-                feedback_logs = []
-                if self.feedback_file.exists():
-                    with open(self.feedback_file, 'r', encoding='utf-8') as f:
-                        try:
-                            feedback_logs = json.load(f)
-                        except json.JSONDecodeError:
-                            feedback_logs = []
-                
-                # 添加新反馈
-                feedback_logs.append(feedback_entry)
-                
-                # 限制反馈数量
-                if len(feedback_logs) > 500:  # 保留最近500条反馈
-                    feedback_logs = feedback_logs[-500:]
-                
-                # 写入文件
-                with open(self.feedback_file, 'w', encoding='utf-8') as f:
-                    json.dump(feedback_logs, f, indent=2, ensure_ascii=False)
-            
+            self.store.append("feedback", feedback_entry)
             return True
         except Exception as e:
             print(f"记录反馈失败: {e}")
@@ -111,70 +73,45 @@ class DataCollector:
             "avg_feedback_rating": 0.0
         }
         
-        # 获取使用日志统计
-        if self.usage_log_file.exists():
-            with open(self.usage_log_file, 'r', encoding='utf-8') as f:
-                try:
-                    usage_logs = json.load(f)
-                except json.JSONDecodeError:
-                    usage_logs = []
-            
-            stats["total_interactions"] = len(usage_logs)
-            stats["successful_interactions"] = sum(1 for log in usage_logs if log.get("success", False))
-            stats["failed_interactions"] = stats["total_interactions"] - stats["successful_interactions"]
+        # 获取使用日志统计（逐条读取，不一次性载入全部历史）
+        for log in self.store.iter("usage"):
+            stats["total_interactions"] += 1
+            if log.get("success", False):
+                stats["successful_interactions"] += 1
             
             # 统计工具使用情况
-            for log in usage_logs:
-                tool = log.get("predicted_tool", "unknown")
-                if tool in stats["tool_usage"]:
-                    stats["tool_usage"][tool] += 1
-                else:
-                    stats["tool_usage"][tool] = 1
+            tool = log.get("predicted_tool", "unknown")
+            stats["tool_usage"][tool] = stats["tool_usage"].get(tool, 0) + 1
             
             # 时间范围
-            if usage_logs:
-                stats["time_range"]["start"] = min(log["timestamp"] for log in usage_logs)
-                stats["time_range"]["end"] = max(log["timestamp"] for log in usage_logs)
+            timestamp = log["timestamp"]
+            if stats["time_range"]["start"] is None or timestamp < stats["time_range"]["start"]:
+                stats["time_range"]["start"] = timestamp
+            if stats["time_range"]["end"] is None or timestamp > stats["time_range"]["end"]:
+                stats["time_range"]["end"] = timestamp
+        stats["failed_interactions"] = stats["total_interactions"] - stats["successful_interactions"]
         
         # 获取反馈统计
-        if self.feedback_file.exists():
-            with open(self.feedback_file, 'r', encoding='utf-8') as f:
-                try:
-                    feedback_logs = json.load(f)
-                except json.JSONDecodeError:
-                    feedback_logs = []
-            
-            if feedback_logs:
-                total_rating = sum(feedback.get("rating", 0) for feedback in feedback_logs)
-                stats["avg_feedback_rating"] = total_rating / len(feedback_logs) if feedback_logs else 0.0
+        feedback_count = 0
+        total_rating = 0
+        for feedback in self.store.iter("feedback"):
+            feedback_count += 1
+            total_rating += feedback.get("rating", 0)
+        if feedback_count:
+            stats["avg_feedback_rating"] = total_rating / feedback_count
         
         return stats
     
     def get_recent_interactions(self, limit: int = 20) -> List[Dict[str, Any]]:
         """获取最近的交互记录"""
-        if not self.usage_log_file.exists():
-            return []
-        
-        with open(self.usage_log_file, 'r', encoding='utf-8') as f:
-            try:
-                usage_logs = json.load(f)
-            except json.JSONDecodeError:
-                usage_logs = []
-        
-        # 按时间倒序排列并返回最近的记录
+        # 按记录先后倒序取最近的记录，再按时间戳排序（兼容手动指定的时间戳）
+        usage_logs = self.store.tail("usage", limit)
         usage_logs.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-        return usage_logs[:limit]
+        return usage_logs
     
     def get_feedback_summary(self) -> Dict[str, Any]:
         """获取反馈摘要"""
-        if not self.feedback_file.exists():
-            return {"total_feedback": 0, "avg_rating": 0.0, "rating_distribution": {}}
-        
-        with open(self.feedback_file, 'r', encoding='utf-8') as f:
-            try:
-                feedback_logs = json.load(f)
-            except json.JSONDecodeError:
-                feedback_logs = []
+        feedback_logs = self.store.load("feedback")
         
         if not feedback_logs:
             return {"total_feedback": 0, "avg_rating": 0.0, "rating_distribution": {}}
@@ -198,32 +135,9 @@ class DataCollector:
     def clear_logs(self) -> bool:
         """清空日志（保留最近的几条用于演示）"""
         try:
-            # 清空使用日志
-            if self.usage_log_file.exists():
-                with open(self.usage_log_file, 'r', encoding='utf-8') as f:
-                    try:
-                        usage_logs = json.load(f)
-                    except json.JSONDecodeError:
-                        usage_logs = []
-                
-                # 保留最近5条记录用于演示
-                recent_logs = usage_logs[-5:] if len(usage_logs) > 5 else usage_logs
-                with open(self.usage_log_file, 'w', encoding='utf-8') as f:
-                    json.dump(recent_logs, f, indent=2, ensure_ascii=False)
-            
-            # 清空反馈日志
-            if self.feedback_file.exists():
-                with open(self.feedback_file, 'r', encoding='utf-8') as f:
-                    try:
-                        feedback_logs = json.load(f)
-                    except json.JSONDecodeError:
-                        feedback_logs = []
-                
-                # 保留最近5条记录用于演示
-                recent_feedback = feedback_logs[-5:] if len(feedback_logs) > 5 else feedback_logs
-                with open(self.feedback_file, 'w', encoding='utf-8') as f:
-                    json.dump(recent_feedback, f, indent=2, ensure_ascii=False)
-            
+            # 清空使用日志与反馈日志，各保留最近5条记录用于演示
+            self.store.truncate("usage", keep=5)
+            self.store.truncate("feedback", keep=5)
             return True
         except Exception as e:
             print(f"清空日志失败: {e}")
@@ -2,36 +2,83 @@
 
 import subprocess
 import json
+import shutil
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import os
 
+# 需要探测的CLI工具
+DEFAULT_CLI_TOOLS = ["stigmergy", "claude", "qwen", "gemini", "codebuddy", "iflow", "codex", "qodercli", "copilot"]
+
+# 探测结果缓存格式版本，探测逻辑变化时递增使旧缓存失效
+PROBE_CACHE_VERSION = 1
+
 
 class EnvironmentScanner:
     """扫描用户本地CLI环境"""
     
-    def __init__(self):
+    def __init__(self, cache_path: str = "cli-intent-matcher/config/cli_probe_cache.json",
+                 max_workers: int = 8, timeout: float = 10, cli_tools: Optional[List[str]] = None):
+        """
+        初始化扫描器
+        
+        Args:
+            cache_path: 探测结果缓存文件，按可执行文件的路径、大小与修改时间判断是否需要重新探测
+                （技能列表另按本地技能目录的修改时间判断）
+            max_workers: 并行探测的最大数量
+            timeout: 单次探测的超时时间（秒）
+            cli_tools: 需要探测的CLI工具名称，默认DEFAULT_CLI_TOOLS
+        """
         self.scan_results = {}
+        self.cache_path = Path(cache_path)
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.cli_list = list(cli_tools or DEFAULT_CLI_TOOLS)
+        self.scan_stats = {}
     
-    def scan_all(self) -> Dict[str, Any]:
-        """扫描所有环境信息"""
+    def scan_all(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        扫描所有环境信息
+        
+        Args:
+            refresh: 是否忽略缓存重新探测全部CLI工具
+        """
         print("开始扫描本地环境...")
+        start_time = time.time()
+        
+        cache = {"tools": {}, "skills": None} if refresh else self._load_probe_cache()
+        self._cache_updated = False
+        
+        # 技能列表与CLI工具探测同时进行（两者写入缓存的不同部分）
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='env-scan') as executor:
+            skills_future = executor.submit(self._scan_skills, cache)
+            cli_tools = self._scan_cli_tools(executor, cache)
+            skills = skills_future.result()
+        
+        if self._cache_updated:
+            self._save_probe_cache(cache)
         
         environment_info = {
             "timestamp": datetime.now().isoformat(),
             "system_info": self._get_system_info(),
-            "cli_tools": self._scan_cli_tools(),
-            "skills": self._scan_skills(),
+            "cli_tools": cli_tools,
+            "skills": skills,
             "available_models": []
         }
         
         self.scan_results = environment_info
+        self.scan_stats["seconds"] = time.time() - start_time
         
         # 保存扫描结果
         self._save_scan_results(environment_info)
         
-        print(f"环境扫描完成！找到 {len(environment_info['cli_tools'])} 个CLI工具和 {len(environment_info['skills'])} 个技能")
+        print(f"环境扫描完成！找到 {len(environment_info['cli_tools'])} 个CLI工具和 {len(environment_info['skills'])} 个技能"
+              f"（探测 {self.scan_stats['probed']} 个，缓存命中 {self.scan_stats['cached']} 个，"
+              f"耗时 {self.scan_stats['seconds']:.2f} 秒）")
         return environment_info
     
     def _get_system_info(self) -> Dict[str, str]:
@@ -44,40 +91,131 @@ class EnvironmentScanner:
             "architecture": platform.architecture()[0]
         }
     
-    def _scan_cli_tools(self) -> Dict[str, Any]:
-        """扫描CLI工具"""
-        cli_list = ["stigmergy", "claude", "qwen", "gemini", "codebuddy", "iflow", "codex", "qodercli", "copilot"]
+    def _scan_cli_tools(self, executor: ThreadPoolExecutor, cache: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        扫描CLI工具：先在PATH中查找可执行文件，未找到的工具不启动子进程；
+        可执行文件未变化的工具直接使用缓存，其余工具并行探测
+        """
+        tool_cache = cache["tools"]
         cli_tools = {}
+        futures = {}
+        fingerprints = {}
+        self.scan_stats = {"probed": 0, "cached": 0, "missing": 0}
+        
+        for cli_name in self.cli_list:
+            fingerprint = self._binary_fingerprint(cli_name)
+            if fingerprint is None:
+                cli_tools[cli_name] = {"available": False, "error": "Command not found"}
+                self.scan_stats["missing"] += 1
+                continue
+            
+            fingerprints[cli_name] = fingerprint
+            entry = tool_cache.get(cli_name)
+            if entry and entry.get("fingerprint") == list(fingerprint):
+                cli_tools[cli_name] = entry["info"]
+                self.scan_stats["cached"] += 1
+            else:
+                futures[cli_name] = executor.submit(self._probe_cli_tool, fingerprint[0])
+        
+        for cli_name, future in futures.items():
+            info, cacheable = future.result()
+            cli_tools[cli_name] = info
+            self.scan_stats["probed"] += 1
+            if cacheable:
+                tool_cache[cli_name] = {"fingerprint": list(fingerprints[cli_name]), "info": info}
+                self._cache_updated = True
         
-        for cli_name in cli_list:
+        # 按工具列表顺序返回
+        return {cli_name: cli_tools[cli_name] for cli_name in self.cli_list}
+    
+    @staticmethod
+    def _binary_fingerprint(cli_name: str) -> Optional[Tuple[str, int, int]]:
+        """在PATH中查找可执行文件，返回(路径, 大小, 修改时间)，未找到时返回None"""
+        path = shutil.which(cli_name)
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return os.path.realpath(path), stat.st_size, stat.st_mtime_ns
+    
+    def _probe_cli_tool(self, path: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        运行CLI获取帮助信息（不经过shell）
+        
+        Returns:
+            (工具信息, 结果是否可缓存)，启动失败的结果不缓存，下次启动重新探测；
+            超时的结果会缓存，可执行文件不变时再次探测同样会超时
+        """
+        try:
+            # 获取CLI帮助信息
+            returncode, stdout = self._run_probe([path, "--help"], self.timeout)
+            if returncode == 0 or returncode == 1:
+                return {
+                    "available": True,
+                    "parameters": self._extract_parameters(stdout),
+                    "help_preview": stdout[:500]  # 仅保存前500个字符作为预览
+                }, True
+            
+            # 尝试不带参数的命令
+            returncode, stdout = self._run_probe([path], min(self.timeout, 5))
+            if returncode != 2:  # 通常2表示命令不存在
+                return {
+                    "available": True,
+                    "parameters": self._extract_parameters(stdout),
+                    "help_preview": stdout[:500]
+                }, True
+            return {"available": False, "error": f"Exited with code {returncode}"}, True
+        except subprocess.TimeoutExpired as e:
+            return {"available": False, "error": str(e)}, True
+        except OSError as e:
+            return {"available": False, "error": str(e)}, False
+    
+    @staticmethod
+    def _run_probe(args: List[str], timeout: float) -> Tuple[int, str]:
+        """运行探测命令并返回(退出码, 标准输出)，超时时结束整个进程组"""
+        popen_kwargs = {}
+        if os.name == 'posix':
+            # 独立进程组，超时时一并结束CLI启动的子进程（如node脚本）
+            popen_kwargs["start_new_session"] = True
+        with subprocess.Popen(args, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              text=True, encoding='utf-8', errors='ignore', **popen_kwargs) as process:
             try:
-                # 获取CLI帮助信息
-                result = subprocess.run([cli_name, "--help"], 
-                                      capture_output=True, text=True, timeout=10, shell=True,
-                                      encoding='utf-8', errors='ignore')
-                if result.returncode == 0 or result.returncode == 1:
-                    cli_tools[cli_name] = {
-                        "available": True,
-                        "parameters": self._extract_parameters(result.stdout or ""),
-                        "help_preview": (result.stdout or "")[:500]  # 仅保存前500个字符作为预览
-                    }
+                stdout, _ = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                if os.name == 'posix':
+                    try:
+                        os.killpg(process.pid, signal.SIGKILL)
+                    except OSError:
+                        process.kill()
                 else:
-                    # 尝试不带参数的命令
-                    result2 = subprocess.run([cli_name], 
-                                           capture_output=True, text=True, timeout=5, shell=True,
-                                           encoding='utf-8', errors='ignore')
-                    if result2.returncode != 2:  # 通常2表示命令不存在
-                        cli_tools[cli_name] = {
-                            "available": True,
-                            "parameters": self._extract_parameters(result2.stdout or ""),
-                            "help_preview": (result2.stdout or "")[:500]
-                        }
-                    else:
-                        cli_tools[cli_name] = {"available": False, "error": "Command not found"}
-            except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as e:
-                cli_tools[cli_name] = {"available": False, "error": str(e)}
-        
-        return cli_tools
+                    process.kill()
+                process.communicate()
+                raise
+        return process.returncode, stdout or ""
+    
+    def _load_probe_cache(self) -> Dict[str, Any]:
+        """加载探测结果缓存"""
+        empty = {"tools": {}, "skills": None}
+        if not self.cache_path.exists():
+            return empty
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return empty
+        if cache.get("version") != PROBE_CACHE_VERSION:
+            return empty
+        return {"tools": cache.get("tools", {}), "skills": cache.get("skills")}
+    
+    def _save_probe_cache(self, cache: Dict[str, Any]):
+        """保存探测结果缓存（先写临时文件再替换）"""
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": PROBE_CACHE_VERSION, **cache}, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.cache_path)
     
     def _extract_parameters(self, help_text: str) -> List[str]:
         """从帮助文本中提取参数"""
@@ -95,26 +233,37 @@ class EnvironmentScanner:
                             parameters.append(param)
         return parameters
     
-    def _scan_skills(self) -> Dict[str, Any]:
-        """扫描可用的技能"""
+    def _scan_skills(self, cache: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """扫描可用的技能（stigmergy与本地技能目录均未变化时使用缓存）"""
         skills = {}
         
+        skill_dir = Path.home() / ".stigmergy" / "skills"
+        stigmergy = self._binary_fingerprint("stigmergy")
+        fingerprint = [list(stigmergy) if stigmergy else None,
+                       skill_dir.stat().st_mtime_ns if skill_dir.exists() else None]
+        if cache is not None and cache.get("skills") and cache["skills"].get("fingerprint") == fingerprint:
+            return cache["skills"]["skills"]
+        
         try:
             # 使用stigmergy命令获取技能列表
-            result = subprocess.run(["stigmergy", "skill", "list"], 
-                                  capture_output=True, text=True, timeout=10, shell=True)
-            if result.returncode == 0:
-                skills = self._parse_skills_list(result.stdout)
+            if stigmergy is None:
+                raise FileNotFoundError("stigmergy")
+            stigmergy_path = stigmergy[0]
+            returncode, stdout = self._run_probe([stigmergy_path, "skill", "list"], self.timeout)
+            if returncode == 0:
+                skills = self._parse_skills_list(stdout)
             else:
                 # 尝试使用另一个命令
-                result2 = subprocess.run(["stigmergy", "skill-l"], 
-                                       capture_output=True, text=True, timeout=10, shell=True)
-                if result2.returncode == 0:
-                    skills = self._parse_skills_list(result2.stdout)
+                returncode, stdout = self._run_probe([stigmergy_path, "skill-l"], self.timeout)
+                if returncode == 0:
+                    skills = self._parse_skills_list(stdout)
         except Exception:
             # 如果命令行方式失败，尝试直接从stigmergy目录读取
             skills = self._load_skills_from_directory()
         
+        if cache is not None:
+            cache["skills"] = {"fingerprint": fingerprint, "skills": skills}
+            self._cache_updated = True
         return skills
     
     def _parse_skills_list(self, skills_text: str) -> Dict[str, Any]:
@@ -206,8 +355,13 @@ class EnvironmentScanner:
 
 
 def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='扫描本地CLI环境')
+    parser.add_argument('--refresh', action='store_true', help='忽略缓存重新探测全部CLI工具')
+    args = parser.parse_args()
+    
     scanner = EnvironmentScanner()
-    results = scanner.scan_all()
+    results = scanner.scan_all(refresh=args.refresh)
     print("扫描结果:")
     print(f"系统信息: {results['system_info']}")
     print(f"CLI工具: {list(results['cli_tools'].keys())}")
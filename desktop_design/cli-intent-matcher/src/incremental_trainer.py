@@ -0,0 +1,337 @@
+# 增量训练模块
+
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.model_selection import train_test_split
+
+from .environment_scanner import DEFAULT_CLI_TOOLS
+from .interaction_log import InteractionLog
+from .model_manager import ModelManager
+
+# 增量模型快照的名称前缀
+SNAPSHOT_BASE_NAME = "incremental_model"
+
+# 新交互记录所在的记录流
+INTERACTION_STREAMS = ("usage", "feedback")
+
+
+def interaction_to_sample(record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    将交互记录转换为训练样本
+
+    usage记录以实际使用的工具（或预测成功的工具）为标签，feedback记录以用户期望的工具为标签，
+    兼容旧版直接包含user_intent/cli_tool的记录；无法确定标签的记录返回None
+    """
+    if "user_intent" in record and "cli_tool" in record:
+        text, label = record["user_intent"], record["cli_tool"]
+    elif "expected_tool" in record:
+        text, label = record.get("user_input"), record["expected_tool"]
+    else:
+        label = record.get("actual_tool") or (record.get("predicted_tool") if record.get("success") else None)
+        text = record.get("user_input")
+    if not text or not label:
+        return None
+    return {
+        "user_intent": text,
+        "cli_tool": label,
+        "skill_used": record.get("skill_used", ""),
+        "parameters": record.get("parameters", ""),
+        "expected_output_format": record.get("expected_output_format", "text")
+    }
+
+
+class IncrementalTrainer:
+    """
+    增量训练器 - 哈希向量化 + 支持partial_fit的线性分类器
+
+    新的交互记录按小批量更新模型（先用该批评估再训练），单次更新的耗时只与批大小有关；
+    预测准确率明显低于上次完整训练时的水平（漂移）、出现新的工具标签或累计更新次数达到
+    refit_interval时，在全部历史上完整重训。模型通过ModelManager保存为版本化快照
+    （每snapshot_interval次更新及每次完整重训后），快照元数据中记录已消费的交互序号，
+    重启后从最近的快照继续。
+    """
+
+    def __init__(
+        self,
+        model_path: str = "cli-intent-matcher/data/models",
+        logs_dir: str = "cli-intent-matcher/data/user_logs",
+        base_samples: Optional[List[Dict[str, Any]]] = None,
+        labels: Optional[List[str]] = None,
+        batch_size: int = 64,
+        refit_interval: int = 200,
+        drift_threshold: float = 0.15,
+        drift_window: int = 256,
+        snapshot_interval: int = 10,
+        keep_snapshots: int = 5,
+        n_features: int = 2 ** 16,
+        refit_epochs: int = 5,
+        refit_window: Optional[int] = None,
+        model_manager: Optional[ModelManager] = None,
+        interaction_log: Optional[InteractionLog] = None
+    ):
+        """
+        初始化增量训练器
+
+        Args:
+            model_path: 模型目录
+            logs_dir: 交互日志目录（DataCollector写入的interactions.sqlite3所在目录）
+            base_samples: 基础训练样本（如由环境扫描生成），完整重训时与全部交互样本一起使用
+            labels: 已知的工具标签，出现未知标签时触发完整重训
+            batch_size: 增量更新的小批量大小
+            refit_interval: 累计多少次增量更新后定期完整重训
+            drift_threshold: 近期预测准确率比完整训练时低多少视为漂移
+            drift_window: 计算近期准确率的样本窗口
+            snapshot_interval: 每隔多少次增量更新保存一次快照
+            keep_snapshots: 保留的快照数量
+            n_features: 哈希特征维度
+            refit_epochs: 完整重训时遍历数据的轮数
+            refit_window: 完整重训时每个记录流最多使用的最近交互条数，None表示全部历史
+                （概念漂移时只用近期记录可更快适应新的意图分布）
+            model_manager: 模型管理器，None时按model_path创建
+            interaction_log: 交互日志，None时打开logs_dir下的日志
+        """
+        self.model_manager = model_manager or ModelManager(model_path)
+        self.interaction_log = interaction_log or InteractionLog(str(Path(logs_dir) / "interactions.sqlite3"))
+        self.base_samples = list(base_samples or [])
+        self.batch_size = batch_size
+        self.refit_interval = refit_interval
+        self.drift_threshold = drift_threshold
+        self.snapshot_interval = snapshot_interval
+        self.keep_snapshots = keep_snapshots
+        self.refit_epochs = refit_epochs
+        self.refit_window = refit_window
+
+        # 与原TfidfVectorizer相同的分词配置；哈希向量化无需拟合，新词不需要重建词表
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            stop_words='english',
+            ngram_range=(1, 2),
+            alternate_sign=False
+        )
+        self.classifier = None
+        self.classes = sorted(set(labels or DEFAULT_CLI_TOOLS) |
+                              {sample["cli_tool"] for sample in self.base_samples})
+
+        # 训练状态（随快照保存）
+        self.cursors = {stream: 0 for stream in INTERACTION_STREAMS}
+        self.reference_accuracy = None
+        self.updates_since_refit = 0
+        self.updates_since_snapshot = 0
+        self.recent_correct = deque(maxlen=drift_window)
+        self.snapshot_name = None
+
+        self._restore_latest_snapshot()
+
+    def _restore_latest_snapshot(self):
+        """从最新快照恢复模型与消费进度"""
+        model_data = self.model_manager.load_latest_snapshot(SNAPSHOT_BASE_NAME)
+        if not model_data:
+            return
+        metadata = model_data['metadata']
+        self.classifier = model_data['classifier']
+        self.classes = list(self.classifier.classes_)
+        self.cursors.update(metadata.get('cursors', {}))
+        self.reference_accuracy = metadata.get('reference_accuracy')
+        self.updates_since_refit = metadata.get('updates_since_refit', 0)
+        self.snapshot_name = model_data['model_name']
+
+    def _new_classifier(self) -> SGDClassifier:
+        # log_loss提供predict_proba，CLIIntentClassifier据此给出置信度
+        return SGDClassifier(loss='log_loss', alpha=1e-5, random_state=42)
+
+    def update(self) -> Dict[str, Any]:
+        """
+        消费上次更新之后的新交互记录，按小批量增量更新模型
+
+        Returns:
+            本次更新的统计信息
+        """
+        start_time = time.perf_counter()
+        stats = {"samples": 0, "batches": 0, "refits": [], "snapshot": None}
+        if self.classifier is None:
+            stats["refits"].append(self.full_refit("initial"))
+
+        pending = []
+        for stream in INTERACTION_STREAMS:
+            while True:
+                rows = self.interaction_log.read_since(stream, self.cursors[stream], self.batch_size * 16)
+                if not rows:
+                    break
+                self.cursors[stream] = rows[-1][0]
+                pending.extend(sample for sample in map(interaction_to_sample, (record for _, record in rows))
+                               if sample)
+                while len(pending) >= self.batch_size:
+                    if self._consume_batch(pending[:self.batch_size], stats):
+                        # 完整重训已包含游标之前的全部记录
+                        pending = []
+                    else:
+                        pending = pending[self.batch_size:]
+        if pending:
+            self._consume_batch(pending, stats)
+
+        stats["seconds"] = time.perf_counter() - start_time
+        stats["recent_accuracy"] = self.recent_accuracy()
+        return stats
+
+    def _consume_batch(self, samples: List[Dict[str, Any]], stats: Dict[str, Any]) -> bool:
+        """更新一个小批量，返回是否触发了完整重训"""
+        refit = self.partial_update(samples)
+        stats["samples"] += len(samples)
+        stats["batches"] += 1
+        if refit:
+            stats["refits"].append(refit)
+        elif self.updates_since_snapshot >= self.snapshot_interval:
+            stats["snapshot"] = self.snapshot()
+        return refit is not None
+
+    def partial_update(self, samples: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        用一个小批量样本更新模型：先评估（用于漂移检测）再训练
+
+        Args:
+            samples: 训练样本（user_intent、cli_tool），应已写入交互日志，完整重训时从日志读取
+
+        Returns:
+            触发完整重训时返回重训信息，否则返回None
+        """
+        labels = [sample["cli_tool"] for sample in samples]
+        unknown = set(labels) - set(self.classes)
+        if unknown or self.classifier is None:
+            # 线性模型的类别在首次训练时固定，新的工具标签需要完整重训
+            self.classes = sorted(set(self.classes) | unknown)
+            return self.full_refit("new_labels" if unknown else "initial")
+
+        X = self.vectorizer.transform([sample["user_intent"] for sample in samples])
+        y = np.asarray(labels)
+        self.recent_correct.extend(self.classifier.predict(X) == y)
+        self.classifier.partial_fit(X, y)
+        self.updates_since_refit += 1
+        self.updates_since_snapshot += 1
+
+        if self._drift_detected():
+            return self.full_refit("drift")
+        if self.updates_since_refit >= self.refit_interval:
+            return self.full_refit("periodic")
+        return None
+
+    def recent_accuracy(self) -> Optional[float]:
+        """最近drift_window个样本的预测准确率（训练前评估）"""
+        if not self.recent_correct:
+            return None
+        return float(np.mean(self.recent_correct))
+
+    def _drift_detected(self) -> bool:
+        # 窗口积累到一半以上才判断，避免少量样本造成误报
+        if self.reference_accuracy is None or len(self.recent_correct) < self.recent_correct.maxlen // 2:
+            return False
+        return self.reference_accuracy - self.recent_accuracy() > self.drift_threshold
+
+    def collect_history(self, upto: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+        """
+        基础样本与全部（或最近refit_window条）交互记录转换的样本
+
+        Args:
+            upto: 各记录流读取的最大序号，None表示读到最新
+        """
+        samples = list(self.base_samples)
+        for stream in INTERACTION_STREAMS:
+            max_seq = upto.get(stream) if upto else None
+            if self.refit_window is None:
+                records = self.interaction_log.iter(stream, max_seq=max_seq)
+            else:
+                records = reversed(self.interaction_log.tail(stream, self.refit_window, max_seq=max_seq))
+            samples.extend(sample for sample in map(interaction_to_sample, records) if sample)
+        return samples
+
+    def full_refit(self, reason: str) -> Dict[str, Any]:
+        """
+        在全部历史上重新训练模型，并以留出集准确率作为漂移检测的参照
+
+        Args:
+            reason: 重训原因（initial/new_labels/drift/periodic/manual）
+
+        Returns:
+            重训信息
+        """
+        start_time = time.perf_counter()
+        # 先固定游标，只读取游标之前的历史；读取期间新写入的记录留给下次更新，每条记录只使用一次
+        cursors = {stream: self.interaction_log.last_seq(stream) for stream in INTERACTION_STREAMS}
+        samples = self.collect_history(cursors)
+        self.cursors.update(cursors)
+        labels = [sample["cli_tool"] for sample in samples]
+        self.classes = sorted(set(self.classes) | set(labels))
+
+        classifier = self._new_classifier()
+        accuracy = None
+        if samples:
+            X = self.vectorizer.transform([sample["user_intent"] for sample in samples])
+            y = np.asarray(labels)
+            if len(samples) >= 10:
+                X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+            else:
+                X_train, X_test, y_train, y_test = X, X, y, y
+            self._fit_epochs(classifier, X_train, y_train)
+            accuracy = float(np.mean(classifier.predict(X_test) == y_test))
+            # 评估后用全部数据补充训练一轮
+            classifier.partial_fit(X_test, y_test)
+        else:
+            # 没有任何样本时仍需确定类别，供之后的partial_fit使用
+            classifier.partial_fit(self.vectorizer.transform([""]), [self.classes[0]], classes=self.classes)
+
+        self.classifier = classifier
+        self.reference_accuracy = accuracy
+        self.recent_correct.clear()
+        self.updates_since_refit = 0
+
+        refit_info = {
+            "reason": reason,
+            "training_size": len(samples),
+            "accuracy": accuracy,
+            "seconds": time.perf_counter() - start_time
+        }
+        print(f"完整重训（{reason}）：{len(samples)} 个样本，"
+              f"留出集准确率 {accuracy if accuracy is not None else 0:.3f}，耗时 {refit_info['seconds']:.2f} 秒")
+        refit_info["snapshot"] = self.snapshot(refit_info)
+        return refit_info
+
+    def _fit_epochs(self, classifier: SGDClassifier, X, y):
+        """按小批量多轮调用partial_fit（类别固定为全部已知标签）"""
+        rng = np.random.RandomState(42)
+        for epoch in range(self.refit_epochs):
+            order = rng.permutation(X.shape[0])
+            for start in range(0, len(order), self.batch_size * 4):
+                index = order[start:start + self.batch_size * 4]
+                classifier.partial_fit(X[index], y[index], classes=self.classes)
+
+    def predict(self, texts: List[str]) -> List[str]:
+        """预测工具标签"""
+        return list(self.classifier.predict(self.vectorizer.transform(texts)))
+
+    def snapshot(self, refit_info: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """通过ModelManager保存版本化快照"""
+        metadata = {
+            'model_version': 'incremental-v1',
+            'training_date': datetime.now().isoformat(),
+            'accuracy': self.reference_accuracy,
+            'recent_accuracy': self.recent_accuracy(),
+            'reference_accuracy': self.reference_accuracy,
+            'cursors': dict(self.cursors),
+            'updates_since_refit': self.updates_since_refit,
+            'classes': list(self.classes),
+            'feature_count': self.vectorizer.n_features
+        }
+        if refit_info:
+            metadata['last_refit'] = {key: value for key, value in refit_info.items() if key != "snapshot"}
+        self.snapshot_name = self.model_manager.save_snapshot(
+            {'vectorizer': self.vectorizer, 'classifier': self.classifier, 'metadata': metadata},
+            SNAPSHOT_BASE_NAME, keep=self.keep_snapshots
+        )
+        self.updates_since_snapshot = 0
+        return self.snapshot_name
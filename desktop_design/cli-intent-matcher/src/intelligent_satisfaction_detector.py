@@ -117,11 +117,7 @@ class FollowUpAnalyzer:
         """
         Process a sequence of follow-up conversations and update satisfaction if needed.
         """
-        conversation = None
-        for conv in self.tracker.conversation_data:
-            if conv["id"] == original_conversation_id:
-                conversation = conv
-                break
+        conversation = self.tracker.get_conversation(original_conversation_id)
         
         if not conversation:
             return False
@@ -139,7 +135,7 @@ class FollowUpAnalyzer:
             reason = f"Auto-detected from follow-up conversation sequence (score: {satisfaction_score})"
             self.tracker.add_satisfaction_feedback(original_conversation_id, satisfaction_score, reason)
             conversation["follow_up_analyzed"] = True
-            self.tracker.save_conversation_data()
+            self.tracker.update_conversation(conversation)
             return True
         
         return False
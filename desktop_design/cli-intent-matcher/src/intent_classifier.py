@@ -15,6 +15,14 @@ from .response_adjuster import SatisfactionBasedResponseAdjuster, AdaptiveRespon
 class CLIIntentClassifier:
     """CLI意图分类器 - 根据用户输入匹配最合适的CLI工具和参数"""
     
+    # 一些常见的技能关键词匹配
+    SKILL_KEYWORDS = {
+        "frontend-design": ["ui", "interface", "web", "design", "button", "component", "frontend", "html", "css"],
+        "docx": ["document", "word", "doc", "format", "write", "edit"],
+        "pdf": ["pdf", "extract", "merge", "split", "fill", "form"],
+        "xlsx": ["excel", "spreadsheet", "data", "table", "formula", "chart"]
+    }
+    
     def __init__(self, model_path: str = "cli-intent-matcher/data/models"):
         self.model_path = model_path
         self.vectorizer = None
@@ -30,6 +38,7 @@ class CLIIntentClassifier:
         
         self._load_models()
         self._load_cli_info()
+        self._build_skill_index()
     
     def _load_models(self):
         """加载训练好的模型"""
@@ -46,6 +55,7 @@ class CLIIntentClassifier:
                 with open(metadata_path, 'r') as f:
                     self.metadata = json.load(f)
             
+            self.model_version = self._describe_model_version()
             print("模型加载成功")
         except Exception as e:
             print(f"模型加载失败: {e}")
@@ -55,9 +65,17 @@ class CLIIntentClassifier:
     def _init_rule_based_classifier(self):
         """初始化基于规则的分类器（当ML模型不可用时）"""
         print("使用基于规则的分类器")
+        self.model_version = "rules"
         # 这里可以实现基于关键词匹配的规则
         pass
     
+    def _describe_model_version(self) -> str:
+        """模型版本标识，用于区分不同模型产生的缓存结果"""
+        if not (self.vectorizer and self.classifier):
+            return "rules"
+        metadata = self.metadata or {}
+        return "ml:" + str(metadata.get("save_time") or metadata.get("training_date") or "unversioned")
+    
     def _load_cli_info(self):
         """加载CLI工具信息"""
         raw_data_path = Path("cli-intent-matcher/data/raw/cli_info.json")
@@ -99,38 +117,49 @@ class CLIIntentClassifier:
     
     def classify_intent(self, user_input: str) -> Dict[str, any]:
         """分类用户意图并返回最佳匹配的CLI配置"""
+        return self.classify_intents([user_input])[0]
+    
+    def classify_intents(self, user_inputs: List[str]) -> List[Dict[str, any]]:
+        """批量分类用户意图（ML模型对全部输入只做一次向量化和预测）"""
         if self.vectorizer and self.classifier:
-            return self._ml_classify_intent(user_input)
+            return self._ml_classify_intents(user_inputs)
         else:
-            return self._rule_based_classify_intent(user_input)
+            return [self._rule_based_classify_intent(user_input) for user_input in user_inputs]
     
-    def _ml_classify_intent(self, user_input: str) -> Dict[str, any]:
-        """使用机器学习模型分类意图"""
+    def _ml_classify_intents(self, user_inputs: List[str]) -> List[Dict[str, any]]:
+        """使用机器学习模型批量分类意图"""
         try:
-            # 向量化输入
-            input_vector = self.vectorizer.transform([user_input])
-            
-            # 预测
-            prediction = self.classifier.predict(input_vector)
-            probabilities = self.classifier.predict_proba(input_vector)
-            
-            # 提取预测结果
-            cli_tool = prediction[0][0] if len(prediction[0]) > 0 else "stigmergy"
+            # 向量化全部输入为一个稀疏矩阵
+            input_vectors = self.vectorizer.transform(user_inputs)
             
-            # 获取置信度
-            confidence = max([max(prob) for prob in probabilities]) if probabilities else 0.0
+            # 预测（多输出分类器的predict_proba返回每个输出一个概率矩阵）
+            predictions = self.classifier.predict(input_vectors)
+            probabilities = self.classifier.predict_proba(input_vectors)
+            if not isinstance(probabilities, list):
+                probabilities = [probabilities]
             
-            return {
-                "cli_tool": cli_tool,
-                "confidence": float(confidence),
-                "recommended_params": self._get_default_params(cli_tool),
-                "skills": self._match_skills(user_input),
-                "command_suggestion": self._generate_command_suggestion(user_input, cli_tool)
-            }
+            results = []
+            for i, user_input in enumerate(user_inputs):
+                # 提取预测结果
+                prediction = np.atleast_1d(predictions[i])
+                cli_tool = str(prediction[0]) if len(prediction) > 0 else "stigmergy"
+                
+                # 获取置信度
+                confidence = max(prob[i].max() for prob in probabilities) if probabilities else 0.0
+                
+                skills = self._match_skills(user_input)
+                results.append({
+                    "cli_tool": cli_tool,
+                    "confidence": float(confidence),
+                    "recommended_params": self._get_default_params(cli_tool),
+                    "skills": skills,
+                    "command_suggestion": self._generate_command_suggestion(user_input, cli_tool, skills)
+                })
+            return results
         except Exception as e:
             print(f"ML分类失败: {e}")
             # 回退到规则基础分类
-            return self._rule_based_classify_intent(user_input)
+            return [self._rule_based_classify_intent(user_input) for user_input in user_inputs]
     
     def _rule_based_classify_intent(self, user_input: str) -> Dict[str, any]:
         """基于规则的意图分类"""
@@ -177,27 +206,27 @@ class CLIIntentClassifier:
             "command_suggestion": self._generate_command_suggestion(user_input, primary_tool, matched_skills)
         }
     
+    def _build_skill_index(self):
+        """预先计算技能名称、描述及其关键词的小写形式，匹配时不再逐次转换"""
+        self._skill_index = [
+            (skill_name, skill_name.lower(), skill_info.get("description", "").lower(),
+             tuple(skill_name.lower().split('-')))
+            for skill_name, skill_info in self.cli_info.get("skills", {}).items()
+        ]
+    
     def _match_skills(self, user_input: str) -> List[str]:
         """匹配相关的技能"""
         user_lower = user_input.lower()
         matched_skills = []
         
-        for skill_name, skill_info in self.cli_info.get("skills", {}).items():
+        for skill_name, name_lower, description_lower, name_keywords in self._skill_index:
             # 检查技能名称和描述是否与用户输入匹配
-            if (skill_name.lower() in user_lower or 
-                skill_info["description"].lower() in user_lower or
-                any(keyword in user_lower for keyword in skill_name.lower().split('-'))):
+            if (name_lower in user_lower or
+                (description_lower and description_lower in user_lower) or
+                any(keyword in user_lower for keyword in name_keywords)):
                 matched_skills.append(skill_name)
         
-        # 一些常见的技能关键词匹配
-        skill_keywords = {
-            "frontend-design": ["ui", "interface", "web", "design", "button", "component", "frontend", "html", "css"],
-            "docx": ["document", "word", "doc", "format", "write", "edit"],
-            "pdf": ["pdf", "extract", "merge", "split", "fill", "form"],
-            "xlsx": ["excel", "spreadsheet", "data", "table", "formula", "chart"]
-        }
-        
-        for skill, keywords in skill_keywords.items():
+        for skill, keywords in self.SKILL_KEYWORDS.items():
             if any(keyword in user_lower for keyword in keywords):
                 if skill not in matched_skills:
                     matched_skills.append(skill)
@@ -239,6 +268,11 @@ class CLIIntentClassifier:
             cli_command=classification["command_suggestion"]
         )
         
+        return self.build_recommendations(user_input, classification, conversation_id)
+    
+    def build_recommendations(self, user_input: str, classification: Dict[str, any],
+                              conversation_id: str) -> Dict[str, any]:
+        """由分类结果组装推荐结果（不包含满意度调整）"""
         result = {
             "primary_recommendation": classification,
             "alternative_recommendations": self._get_alternatives(user_input, classification["cli_tool"]),
@@ -299,10 +333,8 @@ class CLIIntentClassifier:
     
     def get_conversation_feedback(self, conversation_id: str) -> Optional[Dict]:
         """获取特定对话的反馈"""
-        for conv in self.satisfaction_tracker.conversation_data:
-            if conv["id"] == conversation_id:
-                return conv.get("feedback")
-        return None
+        conversation = self.satisfaction_tracker.get_conversation(conversation_id)
+        return conversation.get("feedback") if conversation else None
 
 
 def main():
@@ -0,0 +1,227 @@
+# 交互日志存储模块
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class InteractionLog:
+    """
+    基于SQLite WAL模式的追加式交互日志（线程安全）
+
+    每条记录写入一行，记录一次交互的开销与历史长度无关，不再需要限制条数。
+    记录按流（stream）分组，如conversations、feedback、usage；带key的记录
+    可以原地更新（如为对话补充满意度反馈）。
+    """
+
+    def __init__(self, db_path: str):
+        """
+        初始化日志存储
+
+        Args:
+            db_path: SQLite数据库文件路径
+        """
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            # WAL模式下追加只写日志文件末尾；synchronous=NORMAL在WAL模式下断电最多丢失最后几次提交
+            self._conn.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                CREATE TABLE IF NOT EXISTS records (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    stream TEXT NOT NULL,
+                    key TEXT,
+                    payload TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_records_stream ON records (stream, seq);
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_records_key ON records (stream, key) WHERE key IS NOT NULL;
+                CREATE TABLE IF NOT EXISTS meta (
+                    name TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                """
+            )
+            self._conn.commit()
+
+    def append(self, stream: str, record: Dict[str, Any], key: Optional[str] = None) -> int:
+        """
+        追加一条记录
+
+        Args:
+            stream: 记录流名称
+            record: 记录内容
+            key: 记录键，提供时可通过update更新
+
+        Returns:
+            记录序号
+        """
+        payload = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            with self._conn:
+                return self._conn.execute(
+                    'INSERT INTO records (stream, key, payload) VALUES (?, ?, ?)', (stream, key, payload)
+                ).lastrowid
+
+    def update(self, stream: str, key: str, record: Dict[str, Any]) -> bool:
+        """
+        更新带key的记录（保持原有顺序）
+
+        Args:
+            stream: 记录流名称
+            key: 记录键
+            record: 新的记录内容
+
+        Returns:
+            是否找到并更新了记录
+        """
+        payload = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            with self._conn:
+                cursor = self._conn.execute(
+                    'UPDATE records SET payload = ? WHERE stream = ? AND key = ?', (payload, stream, key)
+                )
+        return cursor.rowcount > 0
+
+    def load(self, stream: str) -> List[Dict[str, Any]]:
+        """按写入顺序读取记录流中的全部记录"""
+        return list(self.iter(stream))
+
+    def iter(self, stream: str, batch_size: int = 5000, max_seq: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        按写入顺序逐条读取记录
+
+        Args:
+            stream: 记录流名称
+            batch_size: 每次从数据库读取的条数
+            max_seq: 只读取序号不超过该值的记录，None表示读到最新
+
+        Returns:
+            记录字典
+        """
+        last_seq = 0
+        bound, bound_args = ('AND seq <= ? ', (max_seq,)) if max_seq is not None else ('', ())
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f'SELECT seq, payload FROM records WHERE stream = ? AND seq > ? {bound}ORDER BY seq LIMIT ?',
+                    (stream, last_seq) + bound_args + (batch_size,)
+                ).fetchall()
+            if not rows:
+                return
+            for _, payload in rows:
+                yield json.loads(payload)
+            last_seq = rows[-1][0]
+
+    def read_since(self, stream: str, after_seq: int = 0, limit: int = 1000) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        读取序号大于after_seq的记录（用于按游标增量消费新记录）
+
+        Args:
+            stream: 记录流名称
+            after_seq: 已消费的最大序号
+            limit: 最多读取的条数
+
+        Returns:
+            (序号, 记录)列表，按写入顺序排列
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT seq, payload FROM records WHERE stream = ? AND seq > ? ORDER BY seq LIMIT ?',
+                (stream, after_seq, limit)
+            ).fetchall()
+        return [(seq, json.loads(payload)) for seq, payload in rows]
+
+    def tail(self, stream: str, limit: int, max_seq: Optional[int] = None) -> List[Dict[str, Any]]:
+        """读取最近写入的limit条记录（最新的在前），max_seq限定只读取序号不超过该值的记录"""
+        bound, bound_args = ('AND seq <= ? ', (max_seq,)) if max_seq is not None else ('', ())
+        with self._lock:
+            rows = self._conn.execute(
+                f'SELECT payload FROM records WHERE stream = ? {bound}ORDER BY seq DESC LIMIT ?',
+                (stream,) + bound_args + (limit,)
+            ).fetchall()
+        return [json.loads(payload) for payload, in rows]
+
+    def last_seq(self, stream: str) -> int:
+        """记录流中最新记录的序号，没有记录时返回0"""
+        with self._lock:
+            row = self._conn.execute('SELECT MAX(seq) FROM records WHERE stream = ?', (stream,)).fetchone()
+        return row[0] or 0
+
+    def count(self, stream: str) -> int:
+        """记录流中的记录数"""
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM records WHERE stream = ?', (stream,)).fetchone()[0]
+
+    def replace(self, stream: str, records: List[Dict[str, Any]], key_field: Optional[str] = None):
+        """
+        以给定记录整体替换记录流（用于兼容整体保存的旧接口）
+
+        Args:
+            stream: 记录流名称
+            records: 新的全部记录
+            key_field: 作为记录键的字段名
+        """
+        rows = [
+            (stream, record.get(key_field) if key_field else None, json.dumps(record, ensure_ascii=False))
+            for record in records
+        ]
+        with self._lock:
+            with self._conn:
+                self._conn.execute('DELETE FROM records WHERE stream = ?', (stream,))
+                self._conn.executemany('INSERT INTO records (stream, key, payload) VALUES (?, ?, ?)', rows)
+
+    def truncate(self, stream: str, keep: int = 0):
+        """删除记录流中除最近keep条以外的记录"""
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    'DELETE FROM records WHERE stream = ? AND seq NOT IN '
+                    '(SELECT seq FROM records WHERE stream = ? ORDER BY seq DESC LIMIT ?)',
+                    (stream, stream, keep)
+                )
+
+    def import_legacy_json(self, stream: str, path: str, key_field: Optional[str] = None) -> int:
+        """
+        导入旧版整体保存的JSON数组文件（每个文件只导入一次，原文件保留不动）
+
+        Args:
+            stream: 导入到的记录流
+            path: JSON文件路径
+            key_field: 作为记录键的字段名
+
+        Returns:
+            导入的记录数
+        """
+        marker = f'imported:{stream}:{os.path.abspath(path)}'
+        with self._lock:
+            if self._conn.execute('SELECT 1 FROM meta WHERE name = ?', (marker,)).fetchone():
+                return 0
+        records = []
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    records = json.load(f)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                records = []
+        rows = [
+            (stream, record.get(key_field) if key_field else None, json.dumps(record, ensure_ascii=False))
+            for record in records if isinstance(record, dict)
+        ]
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    'INSERT OR IGNORE INTO records (stream, key, payload) VALUES (?, ?, ?)', rows
+                )
+                self._conn.execute('INSERT INTO meta VALUES (?, ?)', (marker, str(len(rows))))
+        return len(rows)
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
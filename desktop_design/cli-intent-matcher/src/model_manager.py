@@ -4,8 +4,9 @@ import joblib
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import os
+import re
 
 
 class ModelManager:
@@ -170,6 +171,48 @@ class ModelManager:
     def restore_model(self, backup_name: str) -> bool:
         """从备份恢复模型"""
         return self.switch_model(backup_name)
+    
+    def list_snapshots(self, base_name: str) -> List[str]:
+        """列出base_name的版本化快照（按版本号升序）"""
+        pattern = re.compile(rf"^{re.escape(base_name)}_v(\d+)$")
+        versions = []
+        for model_name in self.get_available_models():
+            match = pattern.match(model_name)
+            if match:
+                versions.append((int(match.group(1)), model_name))
+        return [model_name for _, model_name in sorted(versions)]
+    
+    def save_snapshot(self, model_data: Dict[str, Any], base_name: str, keep: int = 5) -> Optional[str]:
+        """
+        保存版本化快照（base_name_v0001、base_name_v0002……），只保留最近keep个
+        
+        Args:
+            model_data: 模型数据（vectorizer、classifier、metadata）
+            base_name: 快照名称前缀
+            keep: 保留的快照数量，0表示全部保留
+        
+        Returns:
+            快照名称，保存失败时返回None
+        """
+        snapshots = self.list_snapshots(base_name)
+        version = int(snapshots[-1].rsplit('_v', 1)[1]) + 1 if snapshots else 1
+        snapshot_name = f"{base_name}_v{version:04d}"
+        
+        metadata = dict(model_data.get('metadata', {}))
+        metadata['snapshot_version'] = version
+        if not self.save_model(dict(model_data, metadata=metadata), snapshot_name):
+            return None
+        
+        if keep > 0:
+            for old_name in self.list_snapshots(base_name)[:-keep]:
+                if old_name != self.current_model_name:
+                    self.delete_model(old_name)
+        return snapshot_name
+    
+    def load_latest_snapshot(self, base_name: str) -> Optional[Dict[str, Any]]:
+        """加载base_name的最新快照"""
+        snapshots = self.list_snapshots(base_name)
+        return self.load_model(snapshots[-1]) if snapshots else None
 
 
 def main():
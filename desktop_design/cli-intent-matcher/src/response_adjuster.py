@@ -12,12 +12,14 @@ class SatisfactionBasedResponseAdjuster:
         self.classifier = classifier
         self.tracker = tracker
     
-    def adjust_recommendations_by_satisfaction(self, user_input: str, original_recommendations: Dict) -> Dict:
+    def adjust_recommendations_by_satisfaction(self, user_input: str, original_recommendations: Dict,
+                                               user_satisfaction_history: Optional[Dict] = None) -> Dict:
         """
-        根据历史满意度数据调整推荐结果
+        根据历史满意度数据调整推荐结果（批量调整时可传入预先计算的满意度历史）
         """
         # 获取用户的满意度历史
-        user_satisfaction_history = self._get_user_satisfaction_history(user_input)
+        if user_satisfaction_history is None:
+            user_satisfaction_history = self._get_user_satisfaction_history(user_input)
         
         # 如果用户历史满意度较低，提供更多替代方案
         if user_satisfaction_history["avg_satisfaction"] < 3.0:
@@ -1,9 +1,10 @@
-import json
 import os
 import time
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+from .interaction_log import InteractionLog
+
 
 class SatisfactionTracker:
     """
@@ -12,52 +13,56 @@ class SatisfactionTracker:
     
     def __init__(self, data_dir: str = "data"):
         self.data_dir = data_dir
+        # Legacy whole-file JSON stores, imported once into the interaction log
         self.feedback_file = os.path.join(data_dir, "satisfaction_feedback.json")
         self.conversation_file = os.path.join(data_dir, "conversations.json")
         
         # Ensure data directory exists
         os.makedirs(data_dir, exist_ok=True)
         
+        # Each event is one appended row, so recording cost does not grow with history
+        self.store = InteractionLog(os.path.join(data_dir, "interactions.sqlite3"))
+        self.store.import_legacy_json("conversations", self.conversation_file, key_field="id")
+        self.store.import_legacy_json("feedback", self.feedback_file)
+        
         # Initialize feedback and conversation data
         self.feedback_data = self._load_feedback_data()
         self.conversation_data = self._load_conversation_data()
+        self._conversations_by_id = {conv["id"]: conv for conv in self.conversation_data}
     
     def _load_feedback_data(self) -> List[Dict]:
         """Load existing satisfaction feedback data."""
-        if os.path.exists(self.feedback_file):
-            try:
-                with open(self.feedback_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                return []
-        return []
+        return self.store.load("feedback")
     
     def _load_conversation_data(self) -> List[Dict]:
         """Load existing conversation data."""
-        if os.path.exists(self.conversation_file):
-            try:
-                with open(self.conversation_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                return []
-        return []
+        return self.store.load("conversations")
     
     def save_feedback_data(self):
-        """Save satisfaction feedback data to file."""
-        with open(self.feedback_file, 'w', encoding='utf-8') as f:
-            json.dump(self.feedback_data, f, ensure_ascii=False, indent=2)
+        """Rewrite the whole feedback log from memory (events are already persisted as they happen)."""
+        self.store.replace("feedback", self.feedback_data)
     
     def save_conversation_data(self):
-        """Save conversation data to file."""
-        with open(self.conversation_file, 'w', encoding='utf-8') as f:
-            json.dump(self.conversation_data, f, ensure_ascii=False, indent=2)
+        """Rewrite the whole conversation log from memory (prefer update_conversation for single changes)."""
+        self.store.replace("conversations", self.conversation_data, key_field="id")
+        self._conversations_by_id = {conv["id"]: conv for conv in self.conversation_data}
+    
+    def update_conversation(self, conversation: Dict):
+        """Persist changes made to a single conversation entry."""
+        self.store.update("conversations", conversation["id"], conversation)
     
-    def add_conversation(self, user_input: str, cli_intent: str, cli_command: str, timestamp: Optional[float] = None) -> str:
-        """Add a conversation entry with a unique ID."""
+    def get_conversation(self, conversation_id: str) -> Optional[Dict]:
+        """Look up a conversation entry by ID."""
+        return self._conversations_by_id.get(conversation_id)
+    
+    def add_conversation(self, user_input: str, cli_intent: str, cli_command: str, timestamp: Optional[float] = None,
+                         conversation_id: Optional[str] = None) -> str:
+        """Add a conversation entry with a unique ID (callers recording asynchronously may assign the ID up front)."""
         if timestamp is None:
             timestamp = time.time()
         
-        conversation_id = f"conv_{int(timestamp)}_{len(self.conversation_data)}"
+        if conversation_id is None:
+            conversation_id = f"conv_{int(timestamp)}_{len(self.conversation_data)}"
         
         conversation_entry = {
             "id": conversation_id,
@@ -72,7 +77,8 @@ class SatisfactionTracker:
         }
         
         self.conversation_data.append(conversation_entry)
-        self.save_conversation_data()
+        self._conversations_by_id[conversation_id] = conversation_entry
+        self.store.append("conversations", conversation_entry, key=conversation_id)
         
         return conversation_id
     
@@ -82,11 +88,7 @@ class SatisfactionTracker:
             raise ValueError("Satisfaction score must be between 1 and 5")
         
         # Find the conversation
-        conversation = None
-        for conv in self.conversation_data:
-            if conv["id"] == conversation_id:
-                conversation = conv
-                break
+        conversation = self._conversations_by_id.get(conversation_id)
         
         if not conversation:
             raise ValueError(f"Conversation with ID {conversation_id} not found")
@@ -105,8 +107,8 @@ class SatisfactionTracker:
         
         # Add to feedback data
         self.feedback_data.append(feedback_entry)
-        self.save_feedback_data()
-        self.save_conversation_data()
+        self.store.append("feedback", feedback_entry)
+        self.update_conversation(conversation)
     
     def get_recent_conversations(self, limit: int = 10) -> List[Dict]:
         """Get recent conversations sorted by timestamp."""
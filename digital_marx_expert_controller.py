@@ -12,13 +12,19 @@ Digital Marx Expert Main Controller
 日期: 2025-12-21
 """
 
+import copy
+import hashlib
 import json
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Tuple
 import numpy as np
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 import traceback
 
 # 导入核心分析模块
@@ -66,11 +72,19 @@ class AnalysisResult:
     execution_time: float
     success: bool = True
     error_message: str = None
+    skill_timings: Dict[str, float] = field(default_factory=dict)  # 各技能耗时（秒）
+    cached_skills: List[str] = field(default_factory=list)  # 命中缓存的技能
 
 class DigitalMarxExpertController:
-    """数字马克思智能体主控制器"""
+    """数字马克思智能体主控制器
     
-    def __init__(self):
+    Args:
+        max_workers: 并发执行技能与异化分析脚本的线程数
+        skill_timeout: 单个技能或脚本的超时时间（秒），None表示不限时
+        cache_size: 技能结果缓存的最大条目数，0表示不缓存
+    """
+    
+    def __init__(self, max_workers: int = 4, skill_timeout: Optional[float] = 120.0, cache_size: int = 128):
         # 初始化各个分析模块
         self.quality_system = QualityAssuranceSystem()
         self.class_analyzer = MarxistClassAnalyzer()
@@ -93,6 +107,19 @@ class DigitalMarxExpertController:
             'comprehensive_with_alienation': ['historical_materialist', 'class_structure', 'alienation_analysis', 'dialectical_synthesis']
         }
         
+        # 并发执行配置：技能与脚本使用独立线程池，避免异化技能在技能线程中等待脚本时占满线程池
+        self.max_workers = max_workers
+        self.skill_timeout = skill_timeout
+        self._skill_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='marx-skill')
+        self._script_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='marx-script')
+        
+        # 技能结果缓存，键为(技能名, 规范化请求数据哈希)
+        self.cache_size = cache_size
+        self._skill_cache: 'OrderedDict[Tuple[str, str], Dict[str, Any]]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._script_modules: Dict[str, Any] = {}
+        self._module_lock = threading.Lock()
+        
         logger.info("数字马克思智能体主控制器初始化完成")
     
     def process_analysis_request(self, request: AnalysisRequest) -> AnalysisResult:
@@ -107,12 +134,8 @@ class DigitalMarxExpertController:
             # 2. 确定分析流程
             workflow = self._determine_analysis_workflow(processed_request)
             
-            # 3. 执行分析流程
-            analysis_results = {}
-            for skill_name in workflow:
-                logger.info(f"执行分析技能: {skill_name}")
-                skill_result = self._execute_analysis_skill(skill_name, processed_request)
-                analysis_results[skill_name] = skill_result
+            # 3. 执行分析流程（各技能相互独立，并发执行）
+            analysis_results, skill_timings, cached_skills = self._execute_workflow(workflow, processed_request)
             
             # 4. 综合分析结果
             synthesis_report = self._synthesize_analysis_results(analysis_results, processed_request)
@@ -139,7 +162,9 @@ class DigitalMarxExpertController:
                 practical_guidance=practical_guidance,
                 theoretical_contributions=theoretical_contributions,
                 execution_time=execution_time,
-                success=quality_check['meets_requirements']
+                success=quality_check['meets_requirements'],
+                skill_timings=skill_timings,
+                cached_skills=cached_skills
             )
             
             if not quality_check['meets_requirements']:
@@ -166,6 +191,110 @@ class DigitalMarxExpertController:
                 error_message=str(e)
             )
     
+    def _execute_workflow(self, workflow: List[str], 
+                        request: AnalysisRequest) -> Tuple[Dict[str, Any], Dict[str, float], List[str]]:
+        """并发执行分析流程中的技能，返回按流程顺序排列的结果、各技能耗时及命中缓存的技能"""
+        request_key = self._request_fingerprint(request)
+        analysis_results = {}
+        skill_timings = {}
+        cached_skills = []
+        
+        pending = []
+        for skill_name in workflow:
+            cached = self._get_cached_result(skill_name, request_key)
+            if cached is not None:
+                logger.info(f"技能 {skill_name} 命中缓存")
+                analysis_results[skill_name] = cached
+                skill_timings[skill_name] = 0.0
+                cached_skills.append(skill_name)
+            else:
+                logger.info(f"执行分析技能: {skill_name}")
+                pending.append(skill_name)
+        
+        outcomes = self._run_concurrently(
+            self._skill_executor, pending, lambda skill_name: self._execute_analysis_skill(skill_name, request)
+        )
+        for skill_name, (skill_result, elapsed) in outcomes.items():
+            if skill_result is None:
+                logger.error(f"技能 {skill_name} 执行超时（{self.skill_timeout}秒）")
+                skill_result = {
+                    'skill_name': skill_name,
+                    'error': f'执行超时: {self.skill_timeout}秒',
+                    'success': False,
+                    'quality_score': 0.0
+                }
+            elif skill_result.get('success', True):
+                self._store_cached_result(skill_name, request_key, skill_result)
+            analysis_results[skill_name] = skill_result
+            skill_timings[skill_name] = elapsed
+        
+        ordered_results = {skill_name: analysis_results[skill_name] for skill_name in workflow}
+        ordered_timings = {skill_name: skill_timings[skill_name] for skill_name in workflow}
+        return ordered_results, ordered_timings, cached_skills
+    
+    def _run_concurrently(self, executor: ThreadPoolExecutor, names: List[str],
+                          task: Callable[[str], Dict[str, Any]]) -> Dict[str, Tuple[Optional[Dict[str, Any]], float]]:
+        """在线程池中并发执行任务，返回名称到(结果, 耗时)的映射，超时的任务结果为None"""
+        def timed(name):
+            started = time.perf_counter()
+            result = task(name)
+            return result, time.perf_counter() - started
+        
+        submitted = time.perf_counter()
+        futures = [(name, executor.submit(timed, name)) for name in names]
+        outcomes = {}
+        for name, future in futures:
+            # 所有任务同时提交，超时从提交时刻起算
+            remaining = None
+            if self.skill_timeout is not None:
+                remaining = max(0.0, self.skill_timeout - (time.perf_counter() - submitted))
+            try:
+                outcomes[name] = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                # 线程无法被强制终止，超时任务在后台结束后其结果被丢弃
+                future.cancel()
+                outcomes[name] = (None, time.perf_counter() - submitted)
+        return outcomes
+    
+    def _request_fingerprint(self, request: AnalysisRequest) -> str:
+        """计算请求中影响技能输出部分的规范化哈希"""
+        payload = {
+            'problem_description': request.problem_description,
+            'analysis_type': request.analysis_type,
+            'data_sources': request.data_sources
+        }
+        normalized = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+    
+    def _get_cached_result(self, skill_name: str, request_key: str) -> Optional[Dict[str, Any]]:
+        """读取缓存的技能结果，返回副本以免调用方修改缓存"""
+        with self._cache_lock:
+            cached = self._skill_cache.get((skill_name, request_key))
+            if cached is None:
+                return None
+            self._skill_cache.move_to_end((skill_name, request_key))
+        return copy.deepcopy(cached)
+    
+    def _store_cached_result(self, skill_name: str, request_key: str, result: Dict[str, Any]):
+        """缓存技能结果"""
+        if not self.cache_size:
+            return
+        with self._cache_lock:
+            self._skill_cache[(skill_name, request_key)] = copy.deepcopy(result)
+            self._skill_cache.move_to_end((skill_name, request_key))
+            while len(self._skill_cache) > self.cache_size:
+                self._skill_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """清空技能结果缓存"""
+        with self._cache_lock:
+            self._skill_cache.clear()
+    
+    def close(self):
+        """关闭线程池"""
+        self._skill_executor.shutdown(wait=False)
+        self._script_executor.shutdown(wait=False)
+    
     def _preprocess_request(self, request: AnalysisRequest) -> AnalysisRequest:
         """预处理分析请求"""
         # 数据清洗和标准化
@@ -271,23 +400,23 @@ class DigitalMarxExpertController:
                 'digital_wellbeing_evaluation.py': 'digital_wellbeing_evaluation'
             }
             
-            # 执行核心分析
-            for script_name in core_scripts:
-                script_result = self._execute_alienation_script(script_name, request)
-                analysis_results[script_name] = script_result
-            
             # 基于数据内容选择专门分析
-            if 'work_related' in str(request.data_sources):
-                analysis_results.update(self._execute_specialized_scripts(['workplace_satisfaction_analysis.py', 'career_development_evaluation.py'], request))
+            scripts = list(core_scripts)
+            data_text = str(request.data_sources)
+            if 'work_related' in data_text:
+                scripts.extend(['workplace_satisfaction_analysis.py', 'career_development_evaluation.py'])
             
-            if 'social_related' in str(request.data_sources):
-                analysis_results.update(self._execute_specialized_scripts(['social_network_analysis.py', 'relationship_quality_assessment.py'], request))
+            if 'social_related' in data_text:
+                scripts.extend(['social_network_analysis.py', 'relationship_quality_assessment.py'])
             
-            if 'consumption_related' in str(request.data_sources):
-                analysis_results.update(self._execute_specialized_scripts(['consumer_behavior_analysis.py', 'materialism_assessment.py'], request))
+            if 'consumption_related' in data_text:
+                scripts.extend(['consumer_behavior_analysis.py', 'materialism_assessment.py'])
             
-            if 'technology_related' in str(request.data_sources):
-                analysis_results.update(self._execute_specialized_scripts(['technology_dependency_analysis.py', 'digital_wellbeing_evaluation.py'], request))
+            if 'technology_related' in data_text:
+                scripts.extend(['technology_dependency_analysis.py', 'digital_wellbeing_evaluation.py'])
+            
+            # 核心分析与专门分析相互独立，一并并发执行
+            analysis_results.update(self._execute_specialized_scripts(scripts, request))
             
             # 综合所有分析结果
             synthesis_result = self._synthesize_multi_script_results(analysis_results)
@@ -304,10 +433,20 @@ class DigitalMarxExpertController:
             }
     
     def _execute_specialized_scripts(self, script_names: List[str], request: AnalysisRequest) -> Dict[str, Any]:
-        """执行专门的脚本"""
+        """并发执行专门的脚本，结果按脚本顺序排列"""
+        outcomes = self._run_concurrently(
+            self._script_executor, script_names, lambda script_name: self._execute_alienation_script(script_name, request)
+        )
         results = {}
-        for script_name in script_names:
-            script_result = self._execute_alienation_script(script_name, request)
+        for script_name, (script_result, elapsed) in outcomes.items():
+            if script_result is None:
+                logger.error(f"执行脚本超时 {script_name}")
+                script_result = {
+                    'script_name': script_name,
+                    'error': f'执行超时: {self.skill_timeout}秒',
+                    'success': False
+                }
+            script_result['execution_seconds'] = elapsed
             results[script_name] = script_result
         return results
     
@@ -352,11 +491,7 @@ class DigitalMarxExpertController:
             class_name, method_name = script_mapping[script_name]
             
             # 动态导入脚本模块
-            import importlib.util
-            script_path = f"skills/alienation-analysis/scripts/{script_name}"
-            spec = importlib.util.spec_from_file_location(script_name.replace('.py', ''), script_path)
-            script_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(script_module)
+            script_module = self._load_alienation_script(script_name)
             
             # 创建类实例并调用方法
             script_class = getattr(script_module, class_name)
@@ -408,6 +543,19 @@ class DigitalMarxExpertController:
                 'success': False
             }
     
+    def _load_alienation_script(self, script_name: str):
+        """按路径加载异化分析脚本模块，同一脚本只加载一次"""
+        with self._module_lock:
+            script_module = self._script_modules.get(script_name)
+            if script_module is None:
+                import importlib.util
+                script_path = f"skills/alienation-analysis/scripts/{script_name}"
+                spec = importlib.util.spec_from_file_location(script_name.replace('.py', ''), script_path)
+                script_module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(script_module)
+                self._script_modules[script_name] = script_module
+        return script_module
+    
     def _calculate_integration_score(self, qualitative_results: Dict[str, Any], 
                                    quantitative_results: Dict[str, Any]) -> float:
         """计算定性与定量分析的整合分数"""
@@ -778,6 +926,8 @@ class DigitalMarxExpertController:
             'metadata': {
                 'analysis_time': datetime.now().isoformat(),
                 'execution_time': result.execution_time,
+                'skill_timings': result.skill_timings,
+                'cached_skills': result.cached_skills,
                 'success': result.success,
                 'error_message': result.error_message
             },
@@ -831,6 +981,7 @@ def main():
     print(f"分析成功: {result.success}")
     print(f"执行时间: {result.execution_time:.2f}秒")
     print(f"质量分数: {result.quality_metrics.overall_quality:.3f}")
+    print("技能耗时: " + ", ".join(f"{name} {seconds:.3f}秒" for name, seconds in result.skill_timings.items()))
     
     if result.error_message:
         print(f"错误信息: {result.error_message}")
@@ -840,6 +991,7 @@ def main():
     # 导出结果
     output_file = controller.export_analysis_result(result)
     print(f"\n分析结果已保存到: {output_file}")
+    controller.close()
 
 if __name__ == "__main__":
     main()
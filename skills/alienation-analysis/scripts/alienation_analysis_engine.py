@@ -15,8 +15,9 @@ Alienation Analysis Core Engine
 import json
 import math
 import statistics
+import time
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import warnings
@@ -36,6 +37,13 @@ except ImportError:
     HAS_PANDAS = False
 
 
+# 数值越高异化越严重的指标，其余指标按(1 - 指标值)计入异化分数
+DIRECT_INDICATORS = ('materialism_level', 'debt_level', 'technology_dependency')
+
+# 列式批量分析的默认分块行数
+DEFAULT_CHUNK_SIZE = 100_000
+
+
 class AlienationType(Enum):
     """异化类型枚举"""
     LABOR = "labor"
@@ -86,6 +94,77 @@ class AlienationResult:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
+class ColumnarAlienationBatch:
+    """
+    列式批量分析结果
+    
+    以数组保存每个个体的四类异化分数、主要异化类型与异化程度，
+    个体的完整叙述性结果（维度分析、风险因素、干预优先级）仅在调用
+    individual_result时才生成。
+    """
+    
+    def __init__(self, engine: 'AlienationAnalysisEngine', source: Any,
+                 type_scores: 'np.ndarray', primary_index: 'np.ndarray', level_index: 'np.ndarray'):
+        self._engine = engine
+        self._source = source
+        self.type_scores = type_scores
+        self.primary_index = primary_index
+        self.level_index = level_index
+        self.alienation_types = list(engine.alienation_weights)
+        self.level_labels = list(engine.level_labels)
+    
+    def __len__(self) -> int:
+        return len(self.primary_index)
+    
+    @property
+    def alienation_score(self) -> 'np.ndarray':
+        """每个个体主要异化类型的分数"""
+        return self.type_scores[np.arange(len(self)), self.primary_index]
+    
+    @property
+    def primary_alienation_type(self) -> 'np.ndarray':
+        return np.asarray(self.alienation_types, dtype=object)[self.primary_index]
+    
+    @property
+    def alienation_level(self) -> 'np.ndarray':
+        return np.asarray(self.level_labels, dtype=object)[self.level_index]
+    
+    def individual_result(self, index: int) -> AlienationResult:
+        """按需生成单个个体的完整分析结果"""
+        result = self._engine.analyze_alienation(self._engine._row_from_columns(self._source, index))
+        result.individual_id = f"individual_{index + 1}"
+        return result
+    
+    def to_dataframe(self) -> 'pd.DataFrame':
+        """转换为DataFrame，每类异化分数一列"""
+        if not HAS_PANDAS:
+            raise ImportError("to_dataframe需要安装pandas")
+        frame = pd.DataFrame(self.type_scores, columns=[f'{t}_score' for t in self.alienation_types])
+        frame['alienation_score'] = self.alienation_score
+        frame['primary_alienation_type'] = self.primary_alienation_type
+        frame['alienation_level'] = self.alienation_level
+        return frame
+    
+    def summary_statistics(self) -> Dict[str, Any]:
+        """汇总统计，字段与batch_analyze一致"""
+        scores = self.alienation_score
+        type_counts = np.bincount(self.primary_index, minlength=len(self.alienation_types))
+        level_counts = np.bincount(self.level_index, minlength=len(self.level_labels))
+        return {
+            'total_analyzed': len(self),
+            'successful_analysis': len(self),
+            'failure_count': 0,
+            'mean_alienation_score': float(scores.mean()) if len(self) else 0,
+            'median_alienation_score': float(np.median(scores)) if len(self) else 0,
+            'alienation_type_distribution': {
+                atype: int(count) for atype, count in zip(self.alienation_types, type_counts) if count
+            },
+            'alienation_level_distribution': {
+                level: int(count) for level, count in zip(self.level_labels, level_counts) if count
+            }
+        }
+
+
 class AlienationAnalysisEngine:
     """异化分析核心引擎"""
     
@@ -129,6 +208,9 @@ class AlienationAnalysisEngine:
             'moderate': 0.60,
             'severe': 0.80
         }
+        
+        # 异化程度标签，按严重程度从低到高排列
+        self.level_labels = ("正常状态", "微度异化", "轻度异化", "中度异化", "严重异化")
     
     def analyze_alienation(self, metrics_data: Dict[str, Any]) -> AlienationResult:
         """
@@ -458,6 +540,97 @@ class AlienationAnalysisEngine:
             'engine_version': self.version
         }
     
+    def batch_analyze_columnar(self, data: Union['pd.DataFrame', Dict[str, Any], 'np.ndarray'],
+                               chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+        """
+        列式批量异化分析，适用于大规模面板调查
+        
+        以向量化加权和计算四类异化分数，以argmax确定主要异化类型，
+        分块处理以控制内存峰值，个体的叙述性结果按需生成。
+        
+        Args:
+            data: 指标列数据，可为DataFrame、列名到数组的字典，
+                或列顺序与indicator_columns一致的二维数组；缺失列与NaN按0.5处理
+            chunk_size: 每块处理的行数
+            
+        Returns:
+            包含batch（ColumnarAlienationBatch）与summary_statistics的字典
+        """
+        if self.minimal_mode:
+            # 无NumPy时退回逐个体分析
+            return self.batch_analyze([self._row_from_columns(data, i) for i in range(self._count_rows(data))])
+        
+        n_rows = self._count_rows(data)
+        type_scores = np.empty((n_rows, len(self.alienation_weights)), dtype=np.float64)
+        
+        for start in range(0, n_rows, chunk_size):
+            stop = min(start + chunk_size, n_rows)
+            type_scores[start:stop] = self._score_chunk(self._extract_columns(data, start, stop))
+        
+        # argmax在并列时取第一个类型，与max(scores, key=scores.get)一致
+        primary_index = type_scores.argmax(axis=1) if n_rows else np.empty(0, dtype=np.int64)
+        primary_scores = type_scores[np.arange(n_rows), primary_index]
+        thresholds = [self.alienation_thresholds[key] for key in ('minimal', 'mild', 'moderate', 'severe')]
+        level_index = np.searchsorted(thresholds, primary_scores, side='right')
+        
+        batch = ColumnarAlienationBatch(self, data, type_scores, primary_index, level_index)
+        return {
+            'batch': batch,
+            'summary_statistics': batch.summary_statistics(),
+            'analysis_timestamp': datetime.now().isoformat(),
+            'engine_version': self.version
+        }
+    
+    @property
+    def indicator_columns(self) -> List[str]:
+        """全部指标列名，按异化类型与权重配置顺序排列"""
+        return [column for weights in self.alienation_weights.values() for column in weights]
+    
+    def _score_chunk(self, columns: Dict[str, 'np.ndarray']) -> 'np.ndarray':
+        """计算一块数据的四类异化分数"""
+        scores = []
+        for weights in self.alienation_weights.values():
+            # 与_calculate_alienation_scores按相同顺序累加，保证结果逐位一致
+            total = None
+            for indicator, weight in weights.items():
+                values = columns[indicator]
+                term = (values if indicator in DIRECT_INDICATORS else 1 - values) * weight
+                total = term if total is None else total + term
+            scores.append(np.minimum(1.0, total))
+        return np.column_stack(scores)
+    
+    def _count_rows(self, data: Any) -> int:
+        if HAS_NUMPY and isinstance(data, np.ndarray):
+            return data.shape[0]
+        if HAS_PANDAS and isinstance(data, pd.DataFrame):
+            return len(data)
+        lengths = {len(values) for values in data.values()}
+        if len(lengths) > 1:
+            raise ValueError("各指标列的长度不一致")
+        return lengths.pop() if lengths else 0
+    
+    def _extract_columns(self, data: Any, start: int, stop: int) -> Dict[str, 'np.ndarray']:
+        """取出[start, stop)行的各指标列，缺失列与NaN按默认值0.5处理"""
+        columns = {}
+        for position, indicator in enumerate(self.indicator_columns):
+            if isinstance(data, np.ndarray):
+                values = data[start:stop, position]
+            elif indicator in data:
+                values = data[indicator][start:stop]
+            else:
+                columns[indicator] = np.full(stop - start, 0.5)
+                continue
+            values = np.asarray(values, dtype=np.float64)
+            columns[indicator] = np.where(np.isnan(values), 0.5, values)
+        return columns
+    
+    def _row_from_columns(self, data: Any, index: int) -> Dict[str, float]:
+        """取出单个个体的指标字典"""
+        if HAS_NUMPY:
+            return {indicator: float(values[0]) for indicator, values in
+                    self._extract_columns(data, index, index + 1).items()}
+        return {indicator: data[indicator][index] for indicator in self.indicator_columns if indicator in data}
+    
     def get_analysis_template(self) -> Dict[str, Any]:
         """获取分析模板"""
         return {
@@ -537,8 +710,50 @@ class AlienationAnalysisEngine:
             return "\n".join(lines)
 
 
+def benchmark_batch_analysis(n_respondents: int = 500_000, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                             object_sample: int = 20_000, seed: int = 42) -> Dict[str, Any]:
+    """
+    比较逐个体批量分析与列式批量分析的吞吐量
+    
+    逐个体模式只在object_sample个个体上计时，再按比例推算全部个体的耗时。
+    """
+    engine = AlienationAnalysisEngine()
+    rng = np.random.default_rng(seed)
+    columns = {indicator: rng.random(n_respondents) for indicator in engine.indicator_columns}
+    
+    start = time.perf_counter()
+    columnar = engine.batch_analyze_columnar(columns, chunk_size=chunk_size)
+    columnar_seconds = time.perf_counter() - start
+    
+    sample_size = min(object_sample, n_respondents)
+    sample = [engine._row_from_columns(columns, i) for i in range(sample_size)]
+    start = time.perf_counter()
+    engine.batch_analyze(sample)
+    object_seconds = (time.perf_counter() - start) * n_respondents / max(sample_size, 1)
+    
+    return {
+        'respondents': n_respondents,
+        'chunk_size': chunk_size,
+        'columnar_seconds': round(columnar_seconds, 3),
+        'object_seconds_estimated': round(object_seconds, 3),
+        'speedup': round(object_seconds / columnar_seconds, 1) if columnar_seconds else None,
+        'columnar_rows_per_second': int(n_respondents / columnar_seconds) if columnar_seconds else None,
+        'summary_statistics': columnar['summary_statistics']
+    }
+
+
 def main():
     """主函数 - 测试用例"""
+    import argparse
+    parser = argparse.ArgumentParser(description='异化分析核心引擎')
+    parser.add_argument('--benchmark', type=int, metavar='N', help='对N个模拟个体运行批量分析基准测试')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='列式批量分析的分块行数')
+    args = parser.parse_args()
+    
+    if args.benchmark:
+        print(json.dumps(benchmark_batch_analysis(args.benchmark, args.chunk_size), ensure_ascii=False, indent=2))
+        return
+    
     # 创建分析引擎
     engine = AlienationAnalysisEngine()
     
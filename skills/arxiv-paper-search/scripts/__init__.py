@@ -0,0 +1,3 @@
+"""
+arXiv论文检索与下载技能脚本模块
+"""
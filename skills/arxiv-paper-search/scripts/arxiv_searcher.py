@@ -8,11 +8,13 @@ arXiv论文检索与下载技能 - 核心实现
 2. 摘要批量下载（支持10/20/50/100篇）
 3. PDF全文下载（单篇/批量）
 4. 结果导出（JSON/CSV）
+5. 分页流式采集（断点续采，结果保存到本地SQLite）
+6. 本地全文索引（导出与采集的结果增量写入，可离线检索）
 
 依赖（最小化）:
 - requests: HTTP请求
 - feedparser: 解析arXiv API的Atom/RSS响应
-- 标准库: time, json, csv, pathlib, typing, datetime, urllib
+- 标准库: time, json, csv, pathlib, typing, datetime, urllib, sqlite3, concurrent.futures
 
 作者: socienceAI.com
 版本: 1.0.0
@@ -23,11 +25,38 @@ import feedparser
 import time
 import json
 import csv
+import argparse
+import os
+import sys
 import urllib.parse
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional
 from datetime import datetime
 
+try:
+    from .arxiv_store import ArxivResultStore, make_query_key
+    from .pdf_downloader import ConcurrentPDFDownloader, DownloadJob
+except ImportError:
+    # 作为脚本直接运行时没有包上下文
+    from arxiv_store import ArxivResultStore, make_query_key
+    from pdf_downloader import ConcurrentPDFDownloader, DownloadJob
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+try:
+    from common.literature_index import get_literature_index
+except ImportError:
+    # 分词依赖（jieba）未安装时不建立本地全文索引
+    get_literature_index = None
+
+
+class HarvestInterrupted(Exception):
+    """分页采集因请求失败或持续空页而中断，已采集的部分保存在本地结果库中"""
+
+    def __init__(self, start: int, yielded: int):
+        super().__init__(f"采集中断于 start={start}")
+        self.start = start
+        self.yielded = yielded
+
 
 class ArxivPaperSearcher:
     """arXiv论文检索与下载器"""
@@ -42,15 +71,37 @@ class ArxivPaperSearcher:
     # 请求延迟（遵守arXiv API条款）
     REQUEST_DELAY = 3  # 秒
 
-    def __init__(self, debug: bool = False):
+    # 分页采集时每页的条目数（arXiv API单次请求上限为2000）
+    HARVEST_PAGE_SIZE = 200
+
+    # arXiv API偶尔返回空页或不足一页，重试次数（间隔按REQUEST_DELAY逐次加倍）
+    EMPTY_PAGE_RETRIES = 3
+
+    def __init__(
+        self,
+        debug: bool = False,
+        api_url: Optional[str] = None,
+        store_path: Optional[str] = None,
+        index_path: Optional[str] = None
+    ):
         """
         初始化搜索器
 
         Args:
             debug: 是否启用调试模式
+            api_url: arXiv API地址（以?结尾），默认ARXIV_API_URL
+            store_path: 本地结果库（SQLite）路径，提供时检索结果保存到磁盘，
+                重复查询直接从磁盘读取，分页采集可断点续采
+            index_path: 本地全文索引路径，None时读取SSCI_LITERATURE_INDEX环境变量，
+                两者都未提供时不建立索引
         """
         self.debug = debug
         self.last_request_time = 0
+        self.api_url = api_url or self.ARXIV_API_URL
+        self.store = ArxivResultStore(store_path) if store_path else None
+        self._session: Optional[requests.Session] = None
+        self.last_download_report: List[Dict] = []
+        self.index = get_literature_index(index_path) if get_literature_index else None
 
     def _log(self, message: str):
         """打印调试日志"""
@@ -58,6 +109,13 @@ class ArxivPaperSearcher:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             print(f"[{timestamp}] {message}")
 
+    def _index_papers(self, papers: List[Dict]):
+        """将论文增量写入本地全文索引（未配置索引时跳过）"""
+        if self.index is None or not papers:
+            return
+        counts = self.index.add_papers(papers, 'arxiv')
+        self._log(f"✓ 全文索引: 新增 {counts['added']}，更新 {counts['updated']}")
+
     def _respect_rate_limit(self):
         """遵守API请求频率限制"""
         current_time = time.time()
@@ -105,6 +163,13 @@ class ArxivPaperSearcher:
             query, categories, date_range
         )
 
+        # 本地结果库已覆盖所需条数时直接读取
+        query_key = make_query_key(search_query, sort_by)
+        checkpoint = self.store.get_checkpoint(query_key) if self.store else None
+        if checkpoint and (checkpoint['completed'] or checkpoint['stored'] >= max_results):
+            self._log(f"从本地结果库读取 {min(checkpoint['stored'], max_results)} 篇论文")
+            return list(self.store.iter_query_results(query_key, limit=max_results))
+
         # 构建URL
         url_params = {
             "search_query": search_query,
@@ -114,7 +179,7 @@ class ArxivPaperSearcher:
             "sortOrder": "descending"
         }
 
-        url = self.ARXIV_API_URL + urllib.parse.urlencode(url_params)
+        url = self.api_url + urllib.parse.urlencode(url_params)
         self._log(f"请求URL: {url}")
 
         # 发送请求（遵守频率限制）
@@ -139,8 +204,175 @@ class ArxivPaperSearcher:
             if paper:
                 papers.append(paper)
 
+        if self.store and checkpoint is None:
+            # 作为该查询的第一页保存，后续harvest从此处续采；
+            # 短页可能只是API的瞬时问题，是否采集完毕只依据totalResults判断
+            total_results = self._total_results(feed)
+            self.store.save_page(
+                query_key, search_query, sort_by, "descending", papers,
+                next_start=len(feed.entries),
+                total_results=total_results,
+                completed=total_results is not None and len(feed.entries) >= total_results
+            )
+
         return papers
 
+    def harvest(
+        self,
+        query: str,
+        max_records: Optional[int] = None,
+        sort_by: str = "submittedDate",
+        categories: Optional[List[str]] = None,
+        date_range: Optional[Dict[str, str]] = None,
+        page_size: Optional[int] = None,
+        refresh: bool = False
+    ) -> Iterator[Dict]:
+        """
+        分页流式采集检索结果
+
+        逐页请求arXiv API并逐篇产出论文，不受MAX_RESULTS_OPTIONS限制。
+        配置了本地结果库时，每页在产出前先保存并推进断点：已采集的部分
+        直接从磁盘读取，中断后再次调用会从上次停止的位置继续。
+
+        Args:
+            query: 搜索关键词
+            max_records: 最多产出的论文数，None表示采集全部结果
+            sort_by: 排序方式，默认submittedDate（分页结果更稳定）
+            categories: arXiv分类列表
+            date_range: 日期范围
+            page_size: 每页条目数，默认HARVEST_PAGE_SIZE
+            refresh: 是否忽略本地断点重新采集
+
+        Returns:
+            逐篇产出的论文，index为其在检索结果中的序号
+
+        Raises:
+            HarvestInterrupted: 某页重试后仍请求失败或为空页，再次调用可从断点续采
+        """
+        page_size = page_size or self.HARVEST_PAGE_SIZE
+        search_query = self._build_search_query(query, categories, date_range)
+        query_key = make_query_key(search_query, sort_by)
+
+        yielded = 0
+        start = 0
+        total_results = None
+        if self.store:
+            if refresh:
+                self.store.reset_query(query_key)
+            checkpoint = self.store.get_checkpoint(query_key)
+            if checkpoint:
+                for paper in self.store.iter_query_results(query_key, limit=max_records):
+                    yield paper
+                    yielded += 1
+                if checkpoint['completed'] or (max_records is not None and yielded >= max_records):
+                    return
+                start = checkpoint['next_start']
+                total_results = checkpoint['total_results']
+                self._log(f"从断点继续采集: start={start}")
+
+        while max_records is None or yielded < max_records:
+            if total_results is not None and start >= total_results:
+                break
+
+            page = self._fetch_page(search_query, sort_by, start, page_size, total_results)
+            if page is None:
+                self._log(f"采集中断于 start={start}，可稍后续采")
+                raise HarvestInterrupted(start, yielded)
+            entries, total_results = page
+
+            papers = []
+            for offset, entry in enumerate(entries):
+                paper = self._parse_entry(entry, start + offset + 1)
+                if paper:
+                    papers.append(paper)
+
+            # 按实际收到的条目数推进；总数未知时以空页作为结束标志
+            next_start = start + len(entries)
+            completed = next_start >= total_results if total_results is not None else not entries
+            if self.store:
+                self.store.save_page(
+                    query_key, search_query, sort_by, "descending", papers,
+                    next_start=next_start, total_results=total_results, completed=completed
+                )
+            self._index_papers(papers)
+            self._log(f"已采集 {next_start}/{total_results if total_results is not None else '?'} 条")
+
+            for paper in papers:
+                if max_records is not None and yielded >= max_records:
+                    return
+                yield paper
+                yielded += 1
+
+            if completed:
+                break
+            start = next_start
+
+    def _fetch_page(
+        self,
+        search_query: str,
+        sort_by: str,
+        start: int,
+        page_size: int,
+        total_results: Optional[int]
+    ) -> Optional[tuple]:
+        """
+        请求一页结果
+
+        请求失败、空页或条目数少于totalResults所表明的数量时按退避间隔重试；
+        重试后仍不足一页则返回收到条目最多的一次，调用方按实际条数推进start。
+
+        Returns:
+            (条目列表, 总结果数)，重试后仍请求失败或为空页时返回None
+        """
+        url = self.api_url + urllib.parse.urlencode({
+            "search_query": search_query,
+            "start": start,
+            "max_results": page_size,
+            "sortBy": sort_by,
+            "sortOrder": "descending"
+        })
+        if self._session is None:
+            self._session = requests.Session()
+
+        best = None
+        for attempt in range(self.EMPTY_PAGE_RETRIES + 1):
+            if attempt:
+                time.sleep(self.REQUEST_DELAY * 2 ** (attempt - 1))
+            self._respect_rate_limit()
+            try:
+                response = self._session.get(url, timeout=30)
+                response.raise_for_status()
+            except requests.RequestException as e:
+                self._log(f"请求失败: {e}，重试 {attempt + 1}/{self.EMPTY_PAGE_RETRIES}")
+                continue
+
+            feed = feedparser.parse(response.content)
+            total = self._total_results(feed)
+            if total is None:
+                total = total_results
+            # 总数未知时无法判断短页，直接返回
+            if total is None:
+                return feed.entries, total
+            expected = min(page_size, max(total - start, 0))
+            if len(feed.entries) >= expected:
+                return feed.entries, total
+            if best is None or len(feed.entries) > len(best[0]):
+                best = (feed.entries, total)
+            self._log(f"start={start} 返回 {len(feed.entries)}/{expected} 条，"
+                      f"重试 {attempt + 1}/{self.EMPTY_PAGE_RETRIES}")
+        if best and best[0]:
+            return best
+        return None
+
+    @staticmethod
+    def _total_results(feed) -> Optional[int]:
+        """读取Atom响应中的opensearch:totalResults"""
+        value = feed.feed.get('opensearch_totalresults')
+        try:
+            return int(value) if value is not None else None
+        except (TypeError, ValueError):
+            return None
+
     def _build_search_query(
         self,
         query: str,
@@ -289,42 +521,63 @@ class ArxivPaperSearcher:
         papers: List[Dict],
         output_dir: str = "papers/",
         max_papers: Optional[int] = None,
-        delay: float = 3.0
+        delay: float = 3.0,
+        max_workers: int = 4,
+        burst: int = 1
     ) -> List[str]:
         """
         批量下载论文PDF
 
+        多篇论文并发下载，请求速率由令牌桶控制（平均每delay秒一次请求），
+        而不是在每篇之间固定等待；文件分块写盘，中断的下载保存为.part并在
+        下次调用时用Range请求续传，输出目录的内容清单中已记录的文件直接跳过。
+        每篇的状态与吞吐量保存在self.last_download_report中。
+
         Args:
             papers: 论文列表（来自search方法）
             output_dir: 输出目录
             max_papers: 最大下载数量
-            delay: 每次下载间隔（秒）
+            delay: 平均请求间隔（秒）
+            max_workers: 并发下载数
+            burst: 允许的突发请求数
 
         Returns:
-            成功下载的文件路径列表
+            成功下载（含已存在而跳过）的文件路径列表，顺序与papers一致
         """
         if max_papers:
             papers = papers[:max_papers]
 
-        self._log(f"批量下载 {len(papers)} 篇论文")
-
-        downloaded_files = []
+        self._log(f"批量下载 {len(papers)} 篇论文（并发 {max_workers}）")
 
-        for i, paper in enumerate(papers, 1):
+        jobs = []
+        for paper in papers:
             arxiv_id = paper['arxiv_id']
             filename = f"{arxiv_id.replace('/', '_')}_{paper['title'][:30].replace(' ', '_')}.pdf"
-
-            self._log(f"\n[{i}/{len(papers)}] 下载: {paper['title'][:50]}")
-
-            file_path = self.download_pdf(arxiv_id, output_dir, filename)
-
-            if file_path:
-                downloaded_files.append(file_path)
-
-            # 延迟（最后一次不需要）
-            if i < len(papers):
-                self._log(f"等待 {delay} 秒...")
-                time.sleep(delay)
+            url = paper.get('pdf_url') or f"{self.ARXIV_BASE_URL}pdf/{arxiv_id}.pdf"
+            jobs.append(DownloadJob(arxiv_id, url, str(Path(output_dir) / filename)))
+
+        downloader = ConcurrentPDFDownloader(
+            max_workers=max_workers,
+            rate_per_second=1 / delay if delay > 0 else 1000.0,
+            burst=burst,
+            log=self._log
+        )
+        results = {}
+        for result in downloader.download_all(jobs):
+            results[result.path] = result
+            if result.status == 'failed':
+                self._log(f"✗ 下载失败: {result.arxiv_id} - {result.error}")
+            elif result.status == 'skipped':
+                self._log(f"- 已存在，跳过: {result.path}")
+            else:
+                self._log(
+                    f"✓ {result.arxiv_id}: {result.bytes_downloaded / 1024:.0f} KB，"
+                    f"{result.seconds:.1f} 秒，{result.throughput / 1024:.0f} KB/s"
+                    + ("（续传）" if result.status == 'resumed' else "")
+                )
+
+        self.last_download_report = [results[job.path].to_dict() for job in jobs]
+        downloaded_files = [job.path for job in jobs if results[job.path].status != 'failed']
 
         self._log(f"\n✓ 成功下载 {len(downloaded_files)}/{len(papers)} 篇论文")
 
@@ -349,6 +602,7 @@ class ArxivPaperSearcher:
             json.dump(papers, f, ensure_ascii=False, indent=2)
 
         self._log(f"✓ 摘要已保存到: {output_file}")
+        self._index_papers(papers)
 
     def export_to_csv(
         self,
@@ -383,6 +637,7 @@ class ArxivPaperSearcher:
                 writer.writerow(row)
 
         self._log(f"✓ CSV已导出到: {output_file}")
+        self._index_papers(papers)
 
     def get_recent_ai_papers(
         self,
@@ -429,11 +684,63 @@ class SynchronousArxivSearcher(ArxivPaperSearcher):
     pass
 
 
+def main():
+    """命令行入口：分页采集检索结果并逐行写入JSON Lines文件"""
+    parser = argparse.ArgumentParser(description='arXiv论文检索结果分页采集（支持断点续采）')
+    parser.add_argument('query', nargs='?', help='搜索关键词')
+    parser.add_argument('--max-records', type=int, default=None, help='最多采集的论文数（默认全部）')
+    parser.add_argument('--store', default='arxiv_store.sqlite3', help='本地结果库路径')
+    parser.add_argument('--output', '-o', default=None, help='JSON Lines输出文件（默认不导出）')
+    parser.add_argument('--sort-by', default='submittedDate',
+                        choices=['relevance', 'lastUpdatedDate', 'submittedDate'], help='排序方式')
+    parser.add_argument('--categories', nargs='+', default=None, help='arXiv分类（如cs.AI cs.LG）')
+    parser.add_argument('--page-size', type=int, default=ArxivPaperSearcher.HARVEST_PAGE_SIZE,
+                        help='每页条目数')
+    parser.add_argument('--refresh', action='store_true', help='忽略本地断点重新采集')
+    parser.add_argument('--index', default=None,
+                        help='本地全文索引路径（默认读取SSCI_LITERATURE_INDEX环境变量）')
+    parser.add_argument('--debug', action='store_true', help='输出调试日志')
+    args = parser.parse_args()
+
+    if not args.query:
+        print("arXiv论文检索与下载技能 - 核心模块")
+        print("版本: 1.0.0")
+        print("\n使用示例:")
+        print("from skills.arxiv_paper_search.scripts.arxiv_searcher import ArxivPaperSearcher")
+        print("searcher = ArxivPaperSearcher()")
+        print("results = searcher.search('large language models', max_results=20)")
+        print("\n分页采集: python arxiv_searcher.py 'social network' --max-records 5000 -o papers.jsonl")
+        return
+
+    searcher = ArxivPaperSearcher(debug=args.debug, store_path=args.store, index_path=args.index)
+    output = open(args.output, 'w', encoding='utf-8') if args.output else None
+    count = 0
+    interrupted = None
+    try:
+        for paper in searcher.harvest(
+            args.query,
+            max_records=args.max_records,
+            sort_by=args.sort_by,
+            categories=args.categories,
+            page_size=args.page_size,
+            refresh=args.refresh
+        ):
+            count += 1
+            if output:
+                output.write(json.dumps(paper, ensure_ascii=False) + '\n')
+    except HarvestInterrupted as e:
+        interrupted = e
+    finally:
+        if output:
+            output.close()
+        searcher.store.close()
+
+    if interrupted:
+        print(f"✗ {interrupted}，已采集 {count} 篇论文，本地结果库: {args.store}")
+        print("  使用相同参数再次运行可从断点续采")
+        sys.exit(1)
+    print(f"✓ 共采集 {count} 篇论文，本地结果库: {args.store}")
+
+
 if __name__ == "__main__":
-    # 测试代码
-    print("arXiv论文检索与下载技能 - 核心模块")
-    print("版本: 1.0.0")
-    print("\n使用示例:")
-    print("from skills.arxiv_paper_search.scripts.arxiv_searcher import ArxivPaperSearcher")
-    print("searcher = ArxivPaperSearcher()")
-    print("results = searcher.search('large language models', max_results=20)")
+    main()
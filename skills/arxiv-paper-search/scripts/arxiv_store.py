@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+arXiv检索结果本地存储
+
+以SQLite保存解析后的论文条目（按arXiv ID与版本号索引），并记录每个查询的
+分页采集进度：
+1. 论文表：同一论文的不同版本分别保存，不同查询命中的同一论文只保存一份
+2. 查询表：记录查询条件、总结果数、下一页起点及是否采集完毕（断点）
+3. 查询结果表：按检索顺序记录每个查询命中的论文，重复查询直接从磁盘读取
+
+依赖: 仅标准库（sqlite3, json, hashlib, re, threading）
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+_URL_PREFIX_PATTERN = re.compile(r'^.*?arxiv\.org/(?:abs|pdf)/')
+_ARXIV_ID_PATTERN = re.compile(r'(?P<base>.+?)(?:v(?P<version>\d+))?(?:\.pdf)?')
+
+
+def split_arxiv_id(arxiv_id: str) -> Tuple[str, int]:
+    """
+    拆分arXiv ID与版本号
+
+    Args:
+        arxiv_id: arXiv ID或条目URL（如"2312.11805v2"、"http://arxiv.org/abs/hep-th/9901001v1"）
+
+    Returns:
+        (不含版本号的ID, 版本号)，未标明版本时版本号为0
+    """
+    match = _ARXIV_ID_PATTERN.fullmatch(_URL_PREFIX_PATTERN.sub('', arxiv_id.strip()))
+    base, version = match.group('base'), match.group('version')
+    return base, int(version) if version else 0
+
+
+def paper_key(paper: Dict) -> Tuple[str, int]:
+    """
+    论文条目的存储键
+
+    旧式ID（如hep-th/9901001）的arxiv_id字段只保留了斜杠后的部分，
+    因此优先从包含完整ID的pdf_url中解析。
+    """
+    return split_arxiv_id(paper.get('pdf_url') or paper['arxiv_id'])
+
+
+def make_query_key(search_query: str, sort_by: str, sort_order: str = "descending") -> str:
+    """计算查询条件的存储键"""
+    payload = json.dumps([search_query, sort_by, sort_order], ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class ArxivResultStore:
+    """arXiv论文与采集断点的SQLite存储（线程安全）"""
+
+    def __init__(self, db_path: str = "arxiv_store.sqlite3"):
+        """
+        初始化存储
+
+        Args:
+            db_path: SQLite数据库文件路径
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                CREATE TABLE IF NOT EXISTS papers (
+                    base_id TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    payload TEXT NOT NULL,
+                    updated TEXT,
+                    stored_at REAL NOT NULL,
+                    PRIMARY KEY (base_id, version)
+                );
+                CREATE TABLE IF NOT EXISTS queries (
+                    query_key TEXT PRIMARY KEY,
+                    search_query TEXT NOT NULL,
+                    sort_by TEXT NOT NULL,
+                    sort_order TEXT NOT NULL,
+                    total_results INTEGER,
+                    next_start INTEGER NOT NULL DEFAULT 0,
+                    completed INTEGER NOT NULL DEFAULT 0,
+                    updated_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS query_results (
+                    query_key TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    base_id TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    PRIMARY KEY (query_key, position)
+                );
+                CREATE INDEX IF NOT EXISTS idx_query_results_paper ON query_results (base_id, version);
+                """
+            )
+            self._conn.commit()
+
+    def get_checkpoint(self, query_key: str) -> Optional[Dict]:
+        """
+        读取查询的采集进度
+
+        Args:
+            query_key: 查询存储键
+
+        Returns:
+            {"next_start", "total_results", "completed", "stored"}，未采集过时返回None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT next_start, total_results, completed FROM queries WHERE query_key = ?",
+                (query_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            stored = self._conn.execute(
+                "SELECT COUNT(*) FROM query_results WHERE query_key = ?", (query_key,)
+            ).fetchone()[0]
+        return {
+            "next_start": row[0],
+            "total_results": row[1],
+            "completed": bool(row[2]),
+            "stored": stored
+        }
+
+    def save_page(
+        self,
+        query_key: str,
+        search_query: str,
+        sort_by: str,
+        sort_order: str,
+        papers: List[Dict],
+        next_start: int,
+        total_results: Optional[int],
+        completed: bool
+    ):
+        """
+        在一个事务中保存一页结果并推进断点
+
+        Args:
+            query_key: 查询存储键
+            search_query: arXiv查询字符串
+            sort_by: 排序方式
+            sort_order: 排序方向
+            papers: 本页解析后的论文，index为其在检索结果中的序号（从1开始）
+            next_start: 下一页的起始位置
+            total_results: API报告的总结果数
+            completed: 采集是否已完成
+        """
+        now = time.time()
+        paper_rows, result_rows = [], []
+        for paper in papers:
+            base_id, version = paper_key(paper)
+            payload = {key: value for key, value in paper.items() if key != 'index'}
+            paper_rows.append((base_id, version, json.dumps(payload, ensure_ascii=False),
+                               paper.get('updated', ''), now))
+            result_rows.append((query_key, paper['index'] - 1, base_id, version))
+
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO papers VALUES (?, ?, ?, ?, ?)", paper_rows
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO query_results VALUES (?, ?, ?, ?)", result_rows
+                )
+                self._conn.execute(
+                    """
+                    INSERT INTO queries VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(query_key) DO UPDATE SET
+                        total_results = excluded.total_results,
+                        next_start = excluded.next_start,
+                        completed = excluded.completed,
+                        updated_at = excluded.updated_at
+                    """,
+                    (query_key, search_query, sort_by, sort_order, total_results,
+                     next_start, int(completed), now)
+                )
+
+    def reset_query(self, query_key: str):
+        """清除查询的断点与结果列表（论文条目保留），用于强制重新采集"""
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM query_results WHERE query_key = ?", (query_key,))
+                self._conn.execute("DELETE FROM queries WHERE query_key = ?", (query_key,))
+
+    def iter_query_results(
+        self,
+        query_key: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        batch_size: int = 500
+    ) -> Iterator[Dict]:
+        """
+        按检索顺序逐条读取查询已保存的论文
+
+        Args:
+            query_key: 查询存储键
+            offset: 起始位置
+            limit: 最多读取的条数
+            batch_size: 每次从数据库读取的条数
+
+        Returns:
+            论文字典，index为其在检索结果中的序号（从1开始）
+        """
+        position = offset
+        end = offset + limit if limit is not None else None
+        while end is None or position < end:
+            size = batch_size if end is None else min(batch_size, end - position)
+            with self._lock:
+                rows = self._conn.execute(
+                    """
+                    SELECT r.position, p.payload FROM query_results r
+                    JOIN papers p ON p.base_id = r.base_id AND p.version = r.version
+                    WHERE r.query_key = ? AND r.position >= ?
+                    ORDER BY r.position LIMIT ?
+                    """,
+                    (query_key, position, size)
+                ).fetchall()
+            if not rows:
+                return
+            for row_position, payload in rows:
+                paper = json.loads(payload)
+                paper['index'] = row_position + 1
+                yield paper
+            position = rows[-1][0] + 1
+
+    def get_paper(self, arxiv_id: str) -> Optional[Dict]:
+        """
+        按arXiv ID读取论文，未指定版本时返回已保存的最新版本
+
+        Args:
+            arxiv_id: arXiv ID
+
+        Returns:
+            论文字典，不存在时返回None
+        """
+        base_id, version = split_arxiv_id(arxiv_id)
+        with self._lock:
+            if version:
+                row = self._conn.execute(
+                    "SELECT payload FROM papers WHERE base_id = ? AND version = ?", (base_id, version)
+                ).fetchone()
+            else:
+                row = self._conn.execute(
+                    "SELECT payload FROM papers WHERE base_id = ? ORDER BY version DESC LIMIT 1", (base_id,)
+                ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def count_papers(self) -> int:
+        """已保存的论文条目数（不同版本分别计数）"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+并发PDF下载器
+
+为批量下载论文全文提供：
+1. 有界并发：固定数量的工作线程共享一个keep-alive连接池
+2. 令牌桶限速：按请求速率放行，替代每篇之间固定的time.sleep
+3. 分块流式写盘与断点续传：未完成的文件保存为.part，再次下载时发送Range请求
+4. 内容清单：记录已完成文件的大小与SHA-256，已存在的文件直接跳过
+5. 逐篇吞吐量统计
+
+依赖: requests + 标准库
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+MANIFEST_NAME = ".download_manifest.json"
+
+
+class TokenBucket:
+    """令牌桶限速器（线程安全）"""
+
+    def __init__(self, rate_per_second: float, capacity: int = 1):
+        """
+        初始化限速器
+
+        Args:
+            rate_per_second: 每秒补充的令牌数
+            capacity: 桶容量（允许的突发请求数）
+        """
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second必须为正数")
+        self.rate = rate_per_second
+        self.capacity = max(1, int(capacity))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """取出一个令牌，令牌不足时阻塞等待，返回等待的秒数"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            # 预支令牌后在锁外等待，各线程按取令牌的先后依次放行
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+@dataclass
+class DownloadJob:
+    """单个下载任务"""
+    arxiv_id: str
+    url: str
+    path: str
+
+
+@dataclass
+class DownloadResult:
+    """单个文件的下载结果"""
+    arxiv_id: str
+    url: str
+    path: str
+    status: str              # downloaded / resumed / skipped / failed
+    bytes_downloaded: int    # 本次实际传输的字节数
+    size: int                # 文件总大小
+    seconds: float
+    throughput: float        # 字节/秒
+    sha256: Optional[str] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class DownloadManifest:
+    """输出目录中的内容清单，记录已完成文件的大小与SHA-256（线程安全）"""
+
+    def __init__(self, directory: str):
+        self.path = Path(directory) / MANIFEST_NAME
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                # 清单损坏时重新建立，文件会按大小重新校验
+                self._entries = {}
+
+    def is_complete(self, file_path: Path, verify: bool = False) -> Optional[Dict]:
+        """
+        判断文件是否已完整下载
+
+        Args:
+            file_path: 文件路径
+            verify: 是否重新计算SHA-256校验（默认只比较大小）
+
+        Returns:
+            清单记录，未完成时返回None
+        """
+        with self._lock:
+            entry = self._entries.get(file_path.name)
+        if entry is None or not file_path.exists() or file_path.stat().st_size != entry['size']:
+            return None
+        if verify and _file_sha256(file_path) != entry['sha256']:
+            return None
+        return entry
+
+    def record(self, file_path: Path, arxiv_id: str, url: str, size: int, sha256: str):
+        """记录已完成的文件并写回清单（先写临时文件再替换）"""
+        with self._lock:
+            self._entries[file_path.name] = {
+                "arxiv_id": arxiv_id,
+                "url": url,
+                "size": size,
+                "sha256": sha256,
+                "completed_at": time.strftime("%Y-%m-%d %H:%M:%S")
+            }
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+def _file_sha256(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ConcurrentPDFDownloader:
+    """有界并发、令牌桶限速、支持断点续传的PDF下载器"""
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        rate_per_second: float = 1 / 3,
+        burst: int = 1,
+        chunk_size: int = 64 * 1024,
+        timeout: float = 60,
+        retries: int = 3,
+        verify_existing: bool = False,
+        session: Optional[requests.Session] = None,
+        log=None
+    ):
+        """
+        初始化下载器
+
+        Args:
+            max_workers: 并发下载数
+            rate_per_second: 每秒发起的请求数（含重试与续传请求）
+            burst: 允许的突发请求数
+            chunk_size: 流式写盘的块大小（字节）
+            timeout: 连接与读取超时（秒）
+            retries: 传输中断后的续传次数
+            verify_existing: 跳过已有文件前是否重新计算SHA-256
+            session: 复用的HTTP会话，None时内部创建
+            log: 日志函数
+        """
+        self.max_workers = max(1, max_workers)
+        self.bucket = TokenBucket(rate_per_second, burst)
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+        self.retries = retries
+        self.verify_existing = verify_existing
+        self._log = log or (lambda message: None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+
+    def download_all(self, jobs: List[DownloadJob]) -> Iterator[DownloadResult]:
+        """
+        并发下载全部任务，按完成先后逐个产出结果
+
+        Args:
+            jobs: 下载任务列表
+
+        Returns:
+            逐个产出的下载结果
+        """
+        manifests: Dict[str, DownloadManifest] = {}
+        for job in jobs:
+            directory = str(Path(job.path).parent)
+            if directory not in manifests:
+                Path(directory).mkdir(parents=True, exist_ok=True)
+                manifests[directory] = DownloadManifest(directory)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='pdf-download') as executor:
+            futures = [
+                executor.submit(self._download_one, job, manifests[str(Path(job.path).parent)])
+                for job in jobs
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _download_one(self, job: DownloadJob, manifest: DownloadManifest) -> DownloadResult:
+        start_time = time.time()
+        file_path = Path(job.path)
+        entry = manifest.is_complete(file_path, self.verify_existing)
+        if entry is not None:
+            return DownloadResult(job.arxiv_id, job.url, job.path, 'skipped', 0, entry['size'],
+                                  0.0, 0.0, entry['sha256'])
+
+        part_path = file_path.with_name(file_path.name + '.part')
+        transferred = 0
+        resumed = part_path.exists() and part_path.stat().st_size > 0
+        error = None
+
+        for attempt in range(self.retries + 1):
+            offset = part_path.stat().st_size if part_path.exists() else 0
+            headers = {'Range': f'bytes={offset}-'} if offset else {}
+            self.bucket.acquire()
+            try:
+                with self.session.get(job.url, headers=headers, stream=True, timeout=self.timeout) as response:
+                    if response.status_code == 416 and offset:
+                        # 已有部分即为完整文件
+                        expected = offset
+                    else:
+                        response.raise_for_status()
+                        if response.status_code != 206:
+                            # 服务器不支持Range时从头下载
+                            offset = 0
+                        expected = self._expected_size(response, offset)
+                        with open(part_path, 'ab' if offset else 'wb') as f:
+                            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                                if chunk:
+                                    f.write(chunk)
+                                    transferred += len(chunk)
+
+                size = part_path.stat().st_size
+                if expected is not None and size < expected:
+                    raise requests.RequestException(f"传输不完整: {size}/{expected} 字节")
+                os.replace(part_path, file_path)
+                sha256 = _file_sha256(file_path)
+                manifest.record(file_path, job.arxiv_id, job.url, size, sha256)
+                seconds = time.time() - start_time
+                return DownloadResult(
+                    job.arxiv_id, job.url, job.path, 'resumed' if resumed else 'downloaded',
+                    transferred, size, seconds, transferred / seconds if seconds > 0 else 0.0, sha256
+                )
+            except (requests.RequestException, OSError) as e:
+                error = str(e)
+                resumed = resumed or (part_path.exists() and part_path.stat().st_size > 0)
+                self._log(f"✗ {job.arxiv_id} 第{attempt + 1}次下载失败: {e}")
+
+        seconds = time.time() - start_time
+        return DownloadResult(
+            job.arxiv_id, job.url, job.path, 'failed', transferred,
+            part_path.stat().st_size if part_path.exists() else 0,
+            seconds, transferred / seconds if seconds > 0 else 0.0, error=error
+        )
+
+    @staticmethod
+    def _expected_size(response: requests.Response, offset: int) -> Optional[int]:
+        """由Content-Range或Content-Length推算文件总大小"""
+        content_range = response.headers.get('Content-Range', '')
+        if '/' in content_range:
+            total = content_range.rsplit('/', 1)[1]
+            if total.isdigit():
+                return int(total)
+        length = response.headers.get('Content-Length')
+        if length and length.isdigit() and 'Content-Encoding' not in response.headers:
+            return offset + int(length)
+        return None
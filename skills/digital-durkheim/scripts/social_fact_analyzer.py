@@ -11,6 +11,12 @@ from typing import Dict, List, Tuple, Optional
 import re
 from collections import Counter
 import warnings
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from common.lexicon_matcher import LexiconMatcher
+from common.text_tokenizer import get_tokenizer
 
 
 class SocialFactAnalyzer:
@@ -19,6 +25,75 @@ class SocialFactAnalyzer:
     def __init__(self):
         self.analysis_results = {}
         self.quality_metrics = {}
+        # 共享分词服务，同一文本的汉字片段只切分一次
+        self.tokenizer = get_tokenizer()
+
+        # 各分析维度的指标词汇，统一编译为多模式匹配器，每篇文本只扫描一次
+        self.indicator_vocabulary = {
+            'externality_indicators': [
+                '制度', '法律', '规范', '传统', '文化', '社会', '公共',
+                '集体', '共同', '普遍', '客观', '独立', '外在'
+            ],
+            'coerciveness_indicators': [
+                '必须', '应当', '强制', '约束', '制裁', '惩罚', '规范',
+                '要求', '义务', '责任', '遵守', '执行', '监督'
+            ],
+            'independence_indicators': [
+                '自主', '独立', '稳定', '持续', '历史', '传统',
+                '延续', '传承', '制度', '结构', '体系', '框架'
+            ],
+            'representation_types': {
+                '符号表征': ['旗帜', '标志', '象征', '符号', '仪式'],
+                '语言表征': ['术语', '概念', '话语', '表达', '语言'],
+                '行为表征': ['行为', '行动', '实践', '活动', '做法'],
+                '制度表征': ['制度', '规则', '法律', '政策', '规范']
+            },
+            'value_indicators': {
+                '核心价值': ['自由', '平等', '正义', '民主', '人权'],
+                '社会价值': ['公共利益', '社会责任', '集体利益', '社会福祉'],
+                '群体价值': ['团结', '合作', '互助', '忠诚', '归属'],
+                '个体价值': ['个人发展', '自我实现', '个人权利', '个性']
+            },
+            'norm_types': {
+                '正式规范': ['法律', '法规', '制度', '政策'],
+                '非正式规范': ['道德', '习俗', '传统', '惯例'],
+                '隐性规范': ['文化', '观念', '思维', '模式'],
+                '新兴规范': ['时尚', '潮流', '网络', '流行']
+            },
+            'emotion_indicators': {
+                '积极情感': ['自豪', '信心', '希望', '热情', '认同'],
+                '消极情感': ['焦虑', '恐惧', '愤怒', '不满', '担忧'],
+                '中性情感': ['理性', '客观', '冷静', '审慎', '理性']
+            },
+            'substitute_indicators': ['替代', '取代', '替换', '代替', '互换'],
+            'integration_indicators': ['协调', '配合', '整合', '统一', '和谐'],
+            'conflict_indicators': ['冲突', '矛盾', '对立', '不一致', '冲突'],
+            'mechanical_indicators': [
+                '同质', '相似', '一致', '相同', '统一', '集体', '传统',
+                '习俗', '压制', '约束', '一致', '认同'
+            ],
+            'organic_indicators': [
+                '异质', '差异', '多样', '分工', '专业', '个人', '自主',
+                '独立', '互补', '协作', '合作', '契约'
+            ],
+            'differentiation_indicators': [
+                '分化', '分层', '差异', '多样', '专业', '分工',
+                '分类', '区别', '不同', '多元', '复杂'
+            ],
+            'mechanism_types': {
+                '制度整合': ['法律', '制度', '政策', '法规'],
+                '经济整合': ['市场', '经济', '分工', '交易'],
+                '文化整合': ['文化', '价值', '认同', '传统'],
+                '社会整合': ['社会', '组织', '网络', '群体']
+            },
+            'change_indicators': {
+                '现代化': ['现代', '发展', '进步', '革新'],
+                '传统化': ['传统', '保守', '延续', '稳定'],
+                '多元化': ['多元', '多样', '开放', '包容'],
+                '全球化': ['全球', '国际', '世界', '跨国']
+            }
+        }
+        self.lexicon = LexiconMatcher.from_vocabularies(self.indicator_vocabulary)
         
     def identify_social_facts(self, text_data: str, 
                              context: Dict = None) -> Dict:
@@ -209,37 +284,31 @@ class SocialFactAnalyzer:
     
     def _analyze_externality(self, text_data: str) -> float:
         """分析外在性特征"""
-        externality_indicators = [
-            '制度', '法律', '规范', '传统', '文化', '社会', '公共',
-            '集体', '共同', '普遍', '客观', '独立', '外在'
-        ]
+        externality_indicators = self.indicator_vocabulary['externality_indicators']
         
         score = 0.0
-        words = re.findall(r'[\u4e00-\u9fff]+', text_data)
+        words = self.tokenizer.tokenize(text_data, mode='han')
         total_words = len(words)
         
         if total_words == 0:
             return 0.0
             
         for indicator in externality_indicators:
-            count = text_data.count(indicator)
+            count = self.lexicon.scan(text_data).count(indicator)
             score += count * 1.0
             
         return min(score / total_words * 10, 10.0)
     
     def _analyze_coerciveness(self, text_data: str) -> float:
         """分析强制性特征"""
-        coerciveness_indicators = [
-            '必须', '应当', '强制', '约束', '制裁', '惩罚', '规范',
-            '要求', '义务', '责任', '遵守', '执行', '监督'
-        ]
+        coerciveness_indicators = self.indicator_vocabulary['coerciveness_indicators']
         
         score = 0.0
         for indicator in coerciveness_indicators:
-            count = text_data.count(indicator)
+            count = self.lexicon.scan(text_data).count(indicator)
             score += count * 1.5
             
-        words = re.findall(r'[\u4e00-\u9fff]+', text_data)
+        words = self.tokenizer.tokenize(text_data, mode='han')
         total_words = len(words)
         
         if total_words == 0:
@@ -249,17 +318,14 @@ class SocialFactAnalyzer:
     
     def _analyze_independence(self, text_data: str) -> float:
         """分析独立性特征"""
-        independence_indicators = [
-            '自主', '独立', '稳定', '持续', '历史', '传统',
-            '延续', '传承', '制度', '结构', '体系', '框架'
-        ]
+        independence_indicators = self.indicator_vocabulary['independence_indicators']
         
         score = 0.0
         for indicator in independence_indicators:
-            count = text_data.count(indicator)
+            count = self.lexicon.scan(text_data).count(indicator)
             score += count * 1.2
             
-        words = re.findall(r'[\u4e00-\u9fff]+', text_data)
+        words = self.tokenizer.tokenize(text_data, mode='han')
         total_words = len(words)
         
         if total_words == 0:
@@ -335,16 +401,11 @@ class SocialFactAnalyzer:
     
     def _identify_collective_representations(self, text_data: str) -> Dict:
         """识别集体表征"""
-        representation_types = {
-            '符号表征': ['旗帜', '标志', '象征', '符号', '仪式'],
-            '语言表征': ['术语', '概念', '话语', '表达', '语言'],
-            '行为表征': ['行为', '行动', '实践', '活动', '做法'],
-            '制度表征': ['制度', '规则', '法律', '政策', '规范']
-        }
+        representation_types = self.indicator_vocabulary['representation_types']
         
         representations = {}
         for rep_type, indicators in representation_types.items():
-            count = sum(text_data.count(indicator) for indicator in indicators)
+            count = self.lexicon.scan(text_data).total(indicators)
             representations[rep_type] = {
                 'count': count,
                 'prominence': '高' if count >= 3 else '中' if count >= 1 else '低'
@@ -354,16 +415,11 @@ class SocialFactAnalyzer:
     
     def _analyze_value_system(self, text_data: str) -> Dict:
         """分析价值体系"""
-        value_indicators = {
-            '核心价值': ['自由', '平等', '正义', '民主', '人权'],
-            '社会价值': ['公共利益', '社会责任', '集体利益', '社会福祉'],
-            '群体价值': ['团结', '合作', '互助', '忠诚', '归属'],
-            '个体价值': ['个人发展', '自我实现', '个人权利', '个性']
-        }
+        value_indicators = self.indicator_vocabulary['value_indicators']
         
         value_system = {}
         for value_type, indicators in value_indicators.items():
-            count = sum(text_data.count(indicator) for indicator in indicators)
+            count = self.lexicon.scan(text_data).total(indicators)
             value_system[value_type] = {
                 'frequency': count,
                 'importance': '高' if count >= 2 else '中' if count >= 1 else '低'
@@ -373,16 +429,11 @@ class SocialFactAnalyzer:
     
     def _analyze_social_norms(self, text_data: str) -> Dict:
         """分析社会规范"""
-        norm_types = {
-            '正式规范': ['法律', '法规', '制度', '政策'],
-            '非正式规范': ['道德', '习俗', '传统', '惯例'],
-            '隐性规范': ['文化', '观念', '思维', '模式'],
-            '新兴规范': ['时尚', '潮流', '网络', '流行']
-        }
+        norm_types = self.indicator_vocabulary['norm_types']
         
         social_norms = {}
         for norm_type, indicators in norm_types.items():
-            count = sum(text_data.count(indicator) for indicator in indicators)
+            count = self.lexicon.scan(text_data).total(indicators)
             social_norms[norm_type] = {
                 'presence': count,
                 'strength': '强' if count >= 3 else '中' if count >= 1 else '弱'
@@ -392,15 +443,11 @@ class SocialFactAnalyzer:
     
     def _analyze_collective_emotions(self, text_data: str) -> Dict:
         """分析集体情感"""
-        emotion_indicators = {
-            '积极情感': ['自豪', '信心', '希望', '热情', '认同'],
-            '消极情感': ['焦虑', '恐惧', '愤怒', '不满', '担忧'],
-            '中性情感': ['理性', '客观', '冷静', '审慎', '理性']
-        }
+        emotion_indicators = self.indicator_vocabulary['emotion_indicators']
         
         collective_emotions = {}
         for emotion_type, indicators in emotion_indicators.items():
-            count = sum(text_data.count(indicator) for indicator in indicators)
+            count = self.lexicon.scan(text_data).total(indicators)
             collective_emotions[emotion_type] = {
                 'intensity': count,
                 'dominance': '主导' if count >= 2 else '存在' if count >= 1 else '缺失'
@@ -466,9 +513,9 @@ class SocialFactAnalyzer:
     
     def _analyze_functional_substitutes(self, text_data: str) -> Dict:
         """分析功能替代"""
-        substitute_indicators = ['替代', '取代', '替换', '代替', '互换']
+        substitute_indicators = self.indicator_vocabulary['substitute_indicators']
         
-        substitute_count = sum(text_data.count(indicator) for indicator in substitute_indicators)
+        substitute_count = self.lexicon.scan(text_data).total(substitute_indicators)
         
         return {
             'substitute_potential': substitute_count,
@@ -478,11 +525,11 @@ class SocialFactAnalyzer:
     
     def _analyze_functional_integration(self, text_data: str) -> Dict:
         """分析功能整合"""
-        integration_indicators = ['协调', '配合', '整合', '统一', '和谐']
-        conflict_indicators = ['冲突', '矛盾', '对立', '不一致', '冲突']
+        integration_indicators = self.indicator_vocabulary['integration_indicators']
+        conflict_indicators = self.indicator_vocabulary['conflict_indicators']
         
-        integration_score = sum(text_data.count(indicator) for indicator in integration_indicators)
-        conflict_score = sum(text_data.count(indicator) for indicator in conflict_indicators)
+        integration_score = self.lexicon.scan(text_data).total(integration_indicators)
+        conflict_score = self.lexicon.scan(text_data).total(conflict_indicators)
         
         return {
             'integration_level': integration_score,
@@ -513,18 +560,12 @@ class SocialFactAnalyzer:
     
     def _determine_solidarity_type(self, text_data: str) -> Dict:
         """判断团结类型"""
-        mechanical_indicators = [
-            '同质', '相似', '一致', '相同', '统一', '集体', '传统',
-            '习俗', '压制', '约束', '一致', '认同'
-        ]
+        mechanical_indicators = self.indicator_vocabulary['mechanical_indicators']
         
-        organic_indicators = [
-            '异质', '差异', '多样', '分工', '专业', '个人', '自主',
-            '独立', '互补', '协作', '合作', '契约'
-        ]
+        organic_indicators = self.indicator_vocabulary['organic_indicators']
         
-        mechanical_score = sum(text_data.count(indicator) for indicator in mechanical_indicators)
-        organic_score = sum(text_data.count(indicator) for indicator in organic_indicators)
+        mechanical_score = self.lexicon.scan(text_data).total(mechanical_indicators)
+        organic_score = self.lexicon.scan(text_data).total(organic_indicators)
         
         total_score = mechanical_score + organic_score
         if total_score == 0:
@@ -548,12 +589,9 @@ class SocialFactAnalyzer:
     
     def _analyze_social_differentiation(self, text_data: str) -> Dict:
         """分析社会分化"""
-        differentiation_indicators = [
-            '分化', '分层', '差异', '多样', '专业', '分工',
-            '分类', '区别', '不同', '多元', '复杂'
-        ]
+        differentiation_indicators = self.indicator_vocabulary['differentiation_indicators']
         
-        differentiation_score = sum(text_data.count(indicator) for indicator in differentiation_indicators)
+        differentiation_score = self.lexicon.scan(text_data).total(differentiation_indicators)
         
         return {
             'differentiation_level': differentiation_score,
@@ -563,16 +601,11 @@ class SocialFactAnalyzer:
     
     def _assess_integration_mechanisms(self, text_data: str) -> Dict:
         """评估整合机制"""
-        mechanism_types = {
-            '制度整合': ['法律', '制度', '政策', '法规'],
-            '经济整合': ['市场', '经济', '分工', '交易'],
-            '文化整合': ['文化', '价值', '认同', '传统'],
-            '社会整合': ['社会', '组织', '网络', '群体']
-        }
+        mechanism_types = self.indicator_vocabulary['mechanism_types']
         
         mechanisms = {}
         for mech_type, indicators in mechanism_types.items():
-            count = sum(text_data.count(indicator) for indicator in indicators)
+            count = self.lexicon.scan(text_data).total(indicators)
             mechanisms[mech_type] = {
                 'strength': count,
                 'effectiveness': '强' if count >= 3 else '中' if count >= 1 else '弱'
@@ -582,16 +615,11 @@ class SocialFactAnalyzer:
     
     def _analyze_change_trends(self, text_data: str) -> Dict:
         """分析变迁趋势"""
-        change_indicators = {
-            '现代化': ['现代', '发展', '进步', '革新'],
-            '传统化': ['传统', '保守', '延续', '稳定'],
-            '多元化': ['多元', '多样', '开放', '包容'],
-            '全球化': ['全球', '国际', '世界', '跨国']
-        }
+        change_indicators = self.indicator_vocabulary['change_indicators']
         
         trends = {}
         for trend_type, indicators in change_indicators.items():
-            count = sum(text_data.count(indicator) for indicator in indicators)
+            count = self.lexicon.scan(text_data).total(indicators)
             trends[trend_type] = {
                 'strength': count,
                 'direction': '强' if count >= 3 else '中' if count >= 1 else '弱'
@@ -10,11 +10,14 @@ import numpy as np
 from typing import Dict, List, Optional, Any, Tuple
 import re
 from collections import Counter
-import jieba
-import jieba.analyse
+import os
+import sys
 from dataclasses import dataclass
 from enum import Enum
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from common.text_tokenizer import get_tokenizer
+
 
 class DialecticalLawType(Enum):
     """辩证法规律类型"""
@@ -59,8 +62,8 @@ class DialecticalThinkingAnalyzer:
     """辩证思维分析器"""
     
     def __init__(self):
-        # 初始化jieba分词
-        jieba.initialize()
+        # 共享分词服务，同一文本只分词一次
+        self.tokenizer = get_tokenizer()
         
         # 对立统一规律词汇库
         self.unity_of_opposites_vocabulary = {
@@ -140,7 +143,7 @@ class DialecticalThinkingAnalyzer:
         """分析对立统一规律"""
         
         processed_text = self._preprocess_text(text_data)
-        keywords = jieba.analyse.extract_tags(processed_text, topK=100, withWeight=True)
+        keywords = self.tokenizer.extract_tags(processed_text, topK=100, withWeight=True)
         
         # 识别对立统一体
         contradictions = self._identify_contradictions(processed_text, keywords)
@@ -176,7 +179,7 @@ class DialecticalThinkingAnalyzer:
         """分析量变质变规律"""
         
         processed_text = self._preprocess_text(text_data)
-        keywords = jieba.analyse.extract_tags(processed_text, topK=100, withWeight=True)
+        keywords = self.tokenizer.extract_tags(processed_text, topK=100, withWeight=True)
         
         # 识别量变积累过程
         quantity_accumulation = self._identify_quantity_accumulation(processed_text, keywords)
@@ -212,7 +215,7 @@ class DialecticalThinkingAnalyzer:
         """分析否定之否定规律"""
         
         processed_text = self._preprocess_text(text_data)
-        keywords = jieba.analyse.extract_tags(processed_text, topK=100, withWeight=True)
+        keywords = self.tokenizer.extract_tags(processed_text, topK=100, withWeight=True)
         
         # 识别正题（肯定）
         thesis_elements = self._identify_thesis_elements(processed_text, keywords)
@@ -441,7 +444,7 @@ class DialecticalThinkingAnalyzer:
     
     def _analyze_aspect_dominance(self, text_data: str, aspect: str) -> Dict:
         """分析方面的主导性"""
-        keywords = jieba.analyse.extract_tags(text_data, topK=100, withWeight=True)
+        keywords = self.tokenizer.extract_tags(text_data, topK=100, withWeight=True)
         
         # 计算方面的权重
         aspect_weight = sum(weight for word, weight in keywords if word in aspect)
@@ -10,8 +10,8 @@ import numpy as np
 from typing import Dict, List, Optional, Any, Tuple
 import re
 from collections import Counter
-import jieba
-import jieba.analyse
+import os
+import sys
 from dataclasses import dataclass
 from enum import Enum
 import math
@@ -19,6 +19,9 @@ import math
 # 导入辩证思维分析器
 from dialectical_thinking_analyzer import DialecticalThinkingAnalyzer
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from common.text_tokenizer import get_tokenizer
+
 
 class SocialFormationType(Enum):
     """社会形态类型"""
@@ -97,8 +100,8 @@ class EnhancedHistoricalMaterialismAnalyzer:
         # 初始化辩证思维分析器
         self.dialectical_analyzer = DialecticalThinkingAnalyzer()
         
-        # 初始化jieba分词
-        jieba.initialize()
+        # 共享分词服务，同一文本只分词一次
+        self.tokenizer = get_tokenizer()
         
         # 生产力发展水平词汇库（增强版）
         self.productive_forces_vocabulary = {
@@ -196,7 +199,7 @@ class EnhancedHistoricalMaterialismAnalyzer:
         """分析生产力-生产关系矛盾运动"""
         
         processed_text = self._preprocess_text(text_data)
-        keywords = jieba.analyse.extract_tags(processed_text, topK=150, withWeight=True)
+        keywords = self.tokenizer.extract_tags(processed_text, topK=150, withWeight=True)
         
         # 深度分析生产力发展水平
         productive_forces = self._deep_analyze_productive_forces(processed_text, keywords)
@@ -242,7 +245,7 @@ class EnhancedHistoricalMaterialismAnalyzer:
         """分析经济基础-上层建筑辩证关系"""
         
         processed_text = self._preprocess_text(text_data)
-        keywords = jieba.analyse.extract_tags(processed_text, topK=150, withWeight=True)
+        keywords = self.tokenizer.extract_tags(processed_text, topK=150, withWeight=True)
         
         # 构建经济基础结构
         economic_base = self._construct_economic_base(processed_text, keywords)
@@ -292,7 +295,7 @@ class EnhancedHistoricalMaterialismAnalyzer:
         """分析社会形态发展规律"""
         
         processed_text = self._preprocess_text(text_data)
-        keywords = jieba.analyse.extract_tags(processed_text, topK=150, withWeight=True)
+        keywords = self.tokenizer.extract_tags(processed_text, topK=150, withWeight=True)
         
         # 识别当前社会形态
         current_formation = self._identify_social_formation(processed_text, keywords)
@@ -825,7 +828,7 @@ class EnhancedHistoricalMaterialismAnalyzer:
         positive_indicators = ['促进', '推动', '助力', '支持', '积极']
         negative_indicators = ['阻碍', '制约', '限制', '束缚', '消极']
         
-        keywords = jieba.analyse.extract_tags(text_data, topK=100, withWeight=True)
+        keywords = self.tokenizer.extract_tags(text_data, topK=100, withWeight=True)
         
         positive_score = sum(weight for word, weight in keywords if word in positive_indicators)
         negative_score = sum(weight for word, weight in keywords if word in negative_indicators)
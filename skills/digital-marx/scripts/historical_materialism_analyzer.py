@@ -11,8 +11,12 @@ from typing import Dict, List, Tuple, Optional
 import re
 from collections import Counter
 import warnings
-import jieba
-import jieba.analyse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from common.lexicon_matcher import LexiconMatcher
+from common.text_tokenizer import get_tokenizer
 
 
 class HistoricalMaterialismAnalyzer:
@@ -22,8 +26,8 @@ class HistoricalMaterialismAnalyzer:
         self.analysis_results = {}
         self.quality_metrics = {}
         
-        # 初始化jieba分词
-        jieba.initialize()
+        # 共享分词服务，同一文本只分词一次
+        self.tokenizer = get_tokenizer()
         
         # 生产力发展水平指标
         self.productivity_indicators = {
@@ -91,6 +95,56 @@ class HistoricalMaterialismAnalyzer:
                 'global': ['全球', '国际', '多元', '包容', '开放']
             }
         }
+
+        # 各分析维度的指标词汇，统一编译为多模式匹配器，每篇文本只扫描一次
+        self.indicator_vocabulary = {
+            'class_indicators': {
+                'bourgeoisie': ['资产阶级', '资本家', '资产阶级', '剥削阶级', '统治阶级'],
+                'proletariat': ['无产阶级', '工人', '劳动者', '被剥削阶级', '劳动人民'],
+                'petty_bourgeoisie': ['小资产阶级', '小生产者', '手工业者', '小商人', '农民'],
+                'lumpenproletariat': ['流民', '无业者', '游民', '失业者', '贫困阶层']
+            },
+            'relation_indicators': {
+                'determined': ['决定', '基础', '根本', '决定性', '基础性'],
+                'relative_independence': ['相对独立', '自主性', '独立性', '自身规律'],
+                'reaction': ['反作用', '影响', '作用', '促进', '阻碍'],
+                'adaptation': ['适应', '协调', '配合', '一致', '统一']
+            },
+            'contradiction_indicators': {
+                'productivity_relations': ['生产力', '生产关系', '矛盾', '冲突', '不适应'],
+                'economic_base_superstructure': ['经济基础', '上层建筑', '矛盾', '冲突', '不协调'],
+                'class_contradiction': ['阶级', '矛盾', '斗争', '对立', '冲突'],
+                'social_contradiction': ['社会', '矛盾', '问题', '挑战', '困境']
+            },
+            'condition_indicators': {
+                'objective_conditions': ['客观', '物质', '条件', '基础', '环境'],
+                'subjective_conditions': ['主观', '意识', '思想', '认识', '觉悟'],
+                'historical_conditions': ['历史', '时机', '机遇', '阶段', '时期'],
+                'international_conditions': ['国际', '全球', '外部', '世界', '国际环境']
+            },
+            'driver_indicators': {
+                'class_drivers': ['阶级', '群众', '人民', '劳动者', '被压迫者'],
+                'technological_drivers': ['技术', '科技', '创新', '进步', '发展'],
+                'economic_drivers': ['经济', '生产', '发展', '增长', '利益'],
+                'social_drivers': ['社会', '民生', '公正', '平等', '解放']
+            },
+            'trend_indicators': {
+                'progressive': ['进步', '发展', '前进', '提升', '改善'],
+                'revolutionary': ['革命', '变革', '突破', '飞跃', '跨越'],
+                'reformist': ['改革', '改良', '调整', '完善', '优化'],
+                'conservative': ['保守', '稳定', '维持', '延续', '传统']
+            },
+            'path_indicators': {
+                'revolutionary_path': ['革命', '武装', '斗争', '推翻', '夺取'],
+                'reform_path': ['改革', '改良', '渐进', '逐步', '和平'],
+                'development_path': ['发展', '建设', '创新', '创造', '发展'],
+                'cooperation_path': ['合作', '联合', '团结', '协作', '共同']
+            }
+        }
+        self.lexicon = LexiconMatcher.from_vocabularies(
+            self.productivity_indicators, self.production_relations_indicators,
+            self.superstructure_indicators, self.indicator_vocabulary
+        )
     
     def analyze_productivity_level(self, text_data: str, context: Dict = None) -> Dict:
         """分析生产力发展水平"""
@@ -99,7 +153,7 @@ class HistoricalMaterialismAnalyzer:
         processed_text = self._preprocess_text(text_data)
         
         # 获取关键词和语义特征
-        keywords = jieba.analyse.extract_tags(processed_text, topK=100, withWeight=True)
+        keywords = self.tokenizer.extract_tags(processed_text, topK=100, withWeight=True)
         
         # 分析工具水平
         tool_level_score = self._analyze_tool_level(processed_text, keywords)
@@ -136,7 +190,7 @@ class HistoricalMaterialismAnalyzer:
         """分析生产关系"""
         
         processed_text = self._preprocess_text(text_data)
-        keywords = jieba.analyse.extract_tags(processed_text, topK=100, withWeight=True)
+        keywords = self.tokenizer.extract_tags(processed_text, topK=100, withWeight=True)
         
         # 分析所有制形式
         ownership_score = self._analyze_ownership_form(processed_text, keywords)
@@ -176,7 +230,7 @@ class HistoricalMaterialismAnalyzer:
         """分析上层建筑"""
         
         processed_text = self._preprocess_text(text_data)
-        keywords = jieba.analyse.extract_tags(processed_text, topK=100, withWeight=True)
+        keywords = self.tokenizer.extract_tags(processed_text, topK=100, withWeight=True)
         
         # 分析政治制度
         political_system_score = self._analyze_political_system(processed_text, keywords)
@@ -216,7 +270,7 @@ class HistoricalMaterialismAnalyzer:
         """分析社会变革"""
         
         processed_text = self._preprocess_text(text_data)
-        keywords = jieba.analyse.extract_tags(processed_text, topK=100, withWeight=True)
+        keywords = self.tokenizer.extract_tags(processed_text, topK=100, withWeight=True)
         
         # 分析基本矛盾
         basic_contradictions = self._analyze_basic_contradictions(processed_text, keywords)
@@ -265,7 +319,7 @@ class HistoricalMaterialismAnalyzer:
             keyword_score = sum(weight for word, weight in keywords if word in words)
             
             # 基于文本频率的评分
-            text_score = sum(text_data.count(word) for word in words)
+            text_score = self.lexicon.scan(text_data).total(words)
             
             # 综合评分
             composite_score = keyword_score * 0.6 + text_score * 0.4
@@ -292,7 +346,7 @@ class HistoricalMaterialismAnalyzer:
         complexity_scores = {}
         for complexity, words in indicators.items():
             keyword_score = sum(weight for word, weight in keywords if word in words)
-            text_score = sum(text_data.count(word) for word in words)
+            text_score = self.lexicon.scan(text_data).total(words)
             composite_score = keyword_score * 0.6 + text_score * 0.4
             
             complexity_scores[complexity] = {
@@ -316,7 +370,7 @@ class HistoricalMaterialismAnalyzer:
         efficiency_scores = {}
         for efficiency, words in indicators.items():
             keyword_score = sum(weight for word, weight in keywords if word in words)
-            text_score = sum(text_data.count(word) for word in words)
+            text_score = self.lexicon.scan(text_data).total(words)
             composite_score = keyword_score * 0.6 + text_score * 0.4
             
             efficiency_scores[efficiency] = {
@@ -365,7 +419,7 @@ class HistoricalMaterialismAnalyzer:
         ownership_scores = {}
         for ownership, words in indicators.items():
             keyword_score = sum(weight for word, weight in keywords if word in words)
-            text_score = sum(text_data.count(word) for word in words)
+            text_score = self.lexicon.scan(text_data).total(words)
             composite_score = keyword_score * 0.6 + text_score * 0.4
             
             ownership_scores[ownership] = {
@@ -389,7 +443,7 @@ class HistoricalMaterialismAnalyzer:
         relation_scores = {}
         for relation, words in indicators.items():
             keyword_score = sum(weight for word, weight in keywords if word in words)
-            text_score = sum(text_data.count(word) for word in words)
+            text_score = self.lexicon.scan(text_data).total(words)
             composite_score = keyword_score * 0.6 + text_score * 0.4
             
             relation_scores[relation] = {
@@ -413,7 +467,7 @@ class HistoricalMaterialismAnalyzer:
         distribution_scores = {}
         for distribution, words in indicators.items():
             keyword_score = sum(weight for word, weight in keywords if word in words)
-            text_score = sum(text_data.count(word) for word in words)
+            text_score = self.lexicon.scan(text_data).total(words)
             composite_score = keyword_score * 0.6 + text_score * 0.4
             
             distribution_scores[distribution] = {
@@ -444,17 +498,12 @@ class HistoricalMaterialismAnalyzer:
     
     def _analyze_class_structure(self, text_data: str, keywords: List[Tuple]) -> Dict:
         """分析阶级结构"""
-        class_indicators = {
-            'bourgeoisie': ['资产阶级', '资本家', '资产阶级', '剥削阶级', '统治阶级'],
-            'proletariat': ['无产阶级', '工人', '劳动者', '被剥削阶级', '劳动人民'],
-            'petty_bourgeoisie': ['小资产阶级', '小生产者', '手工业者', '小商人', '农民'],
-            'lumpenproletariat': ['流民', '无业者', '游民', '失业者', '贫困阶层']
-        }
+        class_indicators = self.indicator_vocabulary['class_indicators']
         
         class_scores = {}
         for class_type, words in class_indicators.items():
             keyword_score = sum(weight for word, weight in keywords if word in words)
-            text_score = sum(text_data.count(word) for word in words)
+            text_score = self.lexicon.scan(text_data).total(words)
             composite_score = keyword_score * 0.6 + text_score * 0.4
             
             class_scores[class_type] = {
@@ -489,7 +538,7 @@ class HistoricalMaterialismAnalyzer:
         system_scores = {}
         for system, words in indicators.items():
             keyword_score = sum(weight for word, weight in keywords if word in words)
-            text_score = sum(text_data.count(word) for word in words)
+            text_score = self.lexicon.scan(text_data).total(words)
             composite_score = keyword_score * 0.6 + text_score * 0.4
             
             system_scores[system] = {
@@ -513,7 +562,7 @@ class HistoricalMaterialismAnalyzer:
         ideology_scores = {}
         for ideology, words in indicators.items():
             keyword_score = sum(weight for word, weight in keywords if word in words)
-            text_score = sum(text_data.count(word) for word in words)
+            text_score = self.lexicon.scan(text_data).total(words)
             composite_score = keyword_score * 0.6 + text_score * 0.4
             
             ideology_scores[ideology] = {
@@ -537,7 +586,7 @@ class HistoricalMaterialismAnalyzer:
         culture_scores = {}
         for culture, words in indicators.items():
             keyword_score = sum(weight for word, weight in keywords if word in words)
-            text_score = sum(text_data.count(word) for word in words)
+            text_score = self.lexicon.scan(text_data).total(words)
             composite_score = keyword_score * 0.6 + text_score * 0.4
             
             culture_scores[culture] = {
@@ -568,17 +617,12 @@ class HistoricalMaterialismAnalyzer:
     
     def _analyze_economic_base_relation(self, text_data: str, keywords: List[Tuple]) -> Dict:
         """分析上层建筑与经济基础关系"""
-        relation_indicators = {
-            'determined': ['决定', '基础', '根本', '决定性', '基础性'],
-            'relative_independence': ['相对独立', '自主性', '独立性', '自身规律'],
-            'reaction': ['反作用', '影响', '作用', '促进', '阻碍'],
-            'adaptation': ['适应', '协调', '配合', '一致', '统一']
-        }
+        relation_indicators = self.indicator_vocabulary['relation_indicators']
         
         relation_scores = {}
         for relation, words in relation_indicators.items():
             keyword_score = sum(weight for word, weight in keywords if word in words)
-            text_score = sum(text_data.count(word) for word in words)
+            text_score = self.lexicon.scan(text_data).total(words)
             composite_score = keyword_score * 0.6 + text_score * 0.4
             
             relation_scores[relation] = {
@@ -597,17 +641,12 @@ class HistoricalMaterialismAnalyzer:
     
     def _analyze_basic_contradictions(self, text_data: str, keywords: List[Tuple]) -> Dict:
         """分析基本矛盾"""
-        contradiction_indicators = {
-            'productivity_relations': ['生产力', '生产关系', '矛盾', '冲突', '不适应'],
-            'economic_base_superstructure': ['经济基础', '上层建筑', '矛盾', '冲突', '不协调'],
-            'class_contradiction': ['阶级', '矛盾', '斗争', '对立', '冲突'],
-            'social_contradiction': ['社会', '矛盾', '问题', '挑战', '困境']
-        }
+        contradiction_indicators = self.indicator_vocabulary['contradiction_indicators']
         
         contradiction_scores = {}
         for contradiction, words in contradiction_indicators.items():
             keyword_score = sum(weight for word, weight in keywords if word in words)
-            text_score = sum(text_data.count(word) for word in words)
+            text_score = self.lexicon.scan(text_data).total(words)
             composite_score = keyword_score * 0.6 + text_score * 0.4
             
             contradiction_scores[contradiction] = {
@@ -627,17 +666,12 @@ class HistoricalMaterialismAnalyzer:
     
     def _analyze_change_conditions(self, text_data: str, keywords: List[Tuple]) -> Dict:
         """分析变革条件"""
-        condition_indicators = {
-            'objective_conditions': ['客观', '物质', '条件', '基础', '环境'],
-            'subjective_conditions': ['主观', '意识', '思想', '认识', '觉悟'],
-            'historical_conditions': ['历史', '时机', '机遇', '阶段', '时期'],
-            'international_conditions': ['国际', '全球', '外部', '世界', '国际环境']
-        }
+        condition_indicators = self.indicator_vocabulary['condition_indicators']
         
         condition_scores = {}
         for condition, words in condition_indicators.items():
             keyword_score = sum(weight for word, weight in keywords if word in words)
-            text_score = sum(text_data.count(word) for word in words)
+            text_score = self.lexicon.scan(text_data).total(words)
             composite_score = keyword_score * 0.6 + text_score * 0.4
             
             condition_scores[condition] = {
@@ -658,17 +692,12 @@ class HistoricalMaterialismAnalyzer:
     
     def _analyze_change_drivers(self, text_data: str, keywords: List[Tuple]) -> Dict:
         """分析变革动力"""
-        driver_indicators = {
-            'class_drivers': ['阶级', '群众', '人民', '劳动者', '被压迫者'],
-            'technological_drivers': ['技术', '科技', '创新', '进步', '发展'],
-            'economic_drivers': ['经济', '生产', '发展', '增长', '利益'],
-            'social_drivers': ['社会', '民生', '公正', '平等', '解放']
-        }
+        driver_indicators = self.indicator_vocabulary['driver_indicators']
         
         driver_scores = {}
         for driver, words in driver_indicators.items():
             keyword_score = sum(weight for word, weight in keywords if word in words)
-            text_score = sum(text_data.count(word) for word in words)
+            text_score = self.lexicon.scan(text_data).total(words)
             composite_score = keyword_score * 0.6 + text_score * 0.4
             
             driver_scores[driver] = {
@@ -688,17 +717,12 @@ class HistoricalMaterialismAnalyzer:
     
     def _predict_development_trends(self, text_data: str, keywords: List[Tuple]) -> Dict:
         """预测发展趋势"""
-        trend_indicators = {
-            'progressive': ['进步', '发展', '前进', '提升', '改善'],
-            'revolutionary': ['革命', '变革', '突破', '飞跃', '跨越'],
-            'reformist': ['改革', '改良', '调整', '完善', '优化'],
-            'conservative': ['保守', '稳定', '维持', '延续', '传统']
-        }
+        trend_indicators = self.indicator_vocabulary['trend_indicators']
         
         trend_scores = {}
         for trend, words in trend_indicators.items():
             keyword_score = sum(weight for word, weight in keywords if word in words)
-            text_score = sum(text_data.count(word) for word in words)
+            text_score = self.lexicon.scan(text_data).total(words)
             composite_score = keyword_score * 0.6 + text_score * 0.4
             
             trend_scores[trend] = {
@@ -718,17 +742,12 @@ class HistoricalMaterialismAnalyzer:
     
     def _explore_practice_paths(self, text_data: str, keywords: List[Tuple]) -> Dict:
         """探索实践路径"""
-        path_indicators = {
-            'revolutionary_path': ['革命', '武装', '斗争', '推翻', '夺取'],
-            'reform_path': ['改革', '改良', '渐进', '逐步', '和平'],
-            'development_path': ['发展', '建设', '创新', '创造', '发展'],
-            'cooperation_path': ['合作', '联合', '团结', '协作', '共同']
-        }
+        path_indicators = self.indicator_vocabulary['path_indicators']
         
         path_scores = {}
         for path, words in path_indicators.items():
             keyword_score = sum(weight for word, weight in keywords if word in words)
-            text_score = sum(text_data.count(word) for word in words)
+            text_score = self.lexicon.scan(text_data).total(words)
             composite_score = keyword_score * 0.6 + text_score * 0.4
             
             path_scores[path] = {
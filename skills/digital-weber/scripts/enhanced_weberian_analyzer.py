@@ -11,8 +11,12 @@ from typing import Dict, List, Tuple, Optional
 import re
 from collections import Counter
 import warnings
-import jieba
-import jieba.analyse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from common.lexicon_matcher import LexiconMatcher
+from common.text_tokenizer import get_tokenizer
 
 
 class EnhancedWeberianAnalyzer:
@@ -22,8 +26,8 @@ class EnhancedWeberianAnalyzer:
         self.analysis_results = {}
         self.quality_metrics = {}
         
-        # 初始化jieba分词
-        jieba.initialize()
+        # 共享分词服务，同一文本只分词一次
+        self.tokenizer = get_tokenizer()
         
         # 韦伯理论核心词汇库（增强版）
         self.weber_vocabulary = {
@@ -86,6 +90,28 @@ class EnhancedWeberianAnalyzer:
                 'weight': 1.6
             }
         }
+
+        # 意义结构与理性化冲突的指标词汇
+        self.indicator_vocabulary = {
+            'meaning_indicators': {
+                '工具意义': ['工具', '手段', '方法', '途径', '方式', '策略', '技巧'],
+                '价值意义': ['价值', '意义', '目的', '理想', '追求', '使命', '愿景'],
+                '情感意义': ['感受', '体验', '情感', '心情', '感觉', '情绪', '心境'],
+                '社会意义': ['社会', '群体', '关系', '地位', '角色', '身份', '归属']
+            },
+            'conflict_indicators': {
+                '工具价值冲突': ['工具理性', '价值理性', '冲突', '矛盾', '张力'],
+                '形式实质冲突': ['形式理性', '实质理性', '冲突', '矛盾'],
+                '理性化悖论': ['理性化', '悖论', '困境', '矛盾', '冲突'],
+                '现代性困境': ['现代性', '困境', '问题', '挑战', '危机']
+            }
+        }
+
+        # 全部词汇编译为一个多模式匹配器，每篇文本只扫描一次
+        self.lexicon = LexiconMatcher.from_vocabularies(
+            self.weber_vocabulary, self.rationalization_vocabulary,
+            self.authority_vocabulary, self.indicator_vocabulary
+        )
     
     def analyze_social_action_typology_enhanced(self, text_data: str, 
                                              context: Dict = None) -> Dict:
@@ -93,8 +119,8 @@ class EnhancedWeberianAnalyzer:
         增强版社会行动类型学分析
         """
         # 使用jieba进行分词和关键词提取
-        words = jieba.lcut(text_data)
-        keywords = jieba.analyse.extract_tags(text_data, topK=50, withWeight=True)
+        words = self.tokenizer.tokenize(text_data)
+        keywords = self.tokenizer.extract_tags(text_data, topK=50, withWeight=True)
         
         # 增强的四类行动分析
         action_types = {}
@@ -158,12 +184,10 @@ class EnhancedWeberianAnalyzer:
                 keyword_score += weight
         
         # 基于词频的语义匹配
-        word_count = 0
-        for word in core_words:
-            word_count += text_data.count(word)
+        word_count = self.lexicon.scan(text_data).total(core_words)
         
         # 综合语义分数
-        total_words = len(jieba.lcut(text_data))
+        total_words = len(self.tokenizer.tokenize(text_data))
         if total_words == 0:
             return 0.0
         
@@ -178,7 +202,7 @@ class EnhancedWeberianAnalyzer:
             return 0.0
         
         # 上下文词汇匹配
-        context_count = sum(text_data.count(word) for word in context_words)
+        context_count = self.lexicon.scan(text_data).total(context_words)
         
         # 句子级别的上下文分析
         sentences = re.split(r'[。！？]', text_data)
@@ -244,12 +268,7 @@ class EnhancedWeberianAnalyzer:
     def _analyze_meaning_structure_enhanced(self, text_data: str, 
                                           keywords: List[Tuple]) -> Dict:
         """增强版意义结构分析"""
-        meaning_indicators = {
-            '工具意义': ['工具', '手段', '方法', '途径', '方式', '策略', '技巧'],
-            '价值意义': ['价值', '意义', '目的', '理想', '追求', '使命', '愿景'],
-            '情感意义': ['感受', '体验', '情感', '心情', '感觉', '情绪', '心境'],
-            '社会意义': ['社会', '群体', '关系', '地位', '角色', '身份', '归属']
-        }
+        meaning_indicators = self.indicator_vocabulary['meaning_indicators']
         
         meaning_structure = {}
         for meaning_type, indicators in meaning_indicators.items():
@@ -257,7 +276,7 @@ class EnhancedWeberianAnalyzer:
             keyword_score = sum(weight for word, weight in keywords if word in indicators)
             
             # 基于词频的分析
-            word_count = sum(text_data.count(indicator) for indicator in indicators)
+            word_count = self.lexicon.scan(text_data).total(indicators)
             
             # 综合评分
             composite_score = keyword_score * 0.7 + word_count * 0.3
@@ -371,18 +390,13 @@ class EnhancedWeberianAnalyzer:
     
     def _analyze_rationality_conflicts_enhanced(self, text_data: str) -> Dict:
         """增强版理性化冲突分析"""
-        conflict_indicators = {
-            '工具价值冲突': ['工具理性', '价值理性', '冲突', '矛盾', '张力'],
-            '形式实质冲突': ['形式理性', '实质理性', '冲突', '矛盾'],
-            '理性化悖论': ['理性化', '悖论', '困境', '矛盾', '冲突'],
-            '现代性困境': ['现代性', '困境', '问题', '挑战', '危机']
-        }
+        conflict_indicators = self.indicator_vocabulary['conflict_indicators']
         
         conflict_analysis = {}
         total_conflict_intensity = 0
         
         for conflict_type, indicators in conflict_indicators.items():
-            intensity = sum(text_data.count(indicator) for indicator in indicators)
+            intensity = self.lexicon.scan(text_data).total(indicators)
             conflict_analysis[conflict_type] = {
                 'intensity': intensity,
                 'level': self._score_to_level(min(intensity * 2, 10.0))
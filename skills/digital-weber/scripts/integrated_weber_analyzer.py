@@ -6,11 +6,15 @@
 """
 
 import os
+import sys
 import json
 from typing import Dict, List, Optional, Any
 from weberian_analyzer import WeberianAnalyzer
 import pandas as pd
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from common.lexicon_matcher import LexiconMatcher
+
 
 class IntegratedWeberAnalyzer:
     """数字韦伯集成分析器"""
@@ -19,6 +23,23 @@ class IntegratedWeberAnalyzer:
         self.weberian_analyzer = WeberianAnalyzer()
         self.analysis_state = {}
         self.quality_monitor = WeberQualityMonitor()
+
+        # 主观意义与动机结构的指标词汇，编译为多模式匹配器
+        self.indicator_vocabulary = {
+            'subjective_meaning': {
+                '工具意义': ['工具', '手段', '方法'],
+                '价值意义': ['价值', '意义', '目的'],
+                '情感意义': ['感受', '体验', '情感'],
+                '社会意义': ['社会', '群体', '关系']
+            },
+            'motivation_structure': {
+                '利益动机': ['利益', '收益', '好处', '回报'],
+                '价值动机': ['价值', '信念', '理想', '原则'],
+                '情感动机': ['情感', '情绪', '感受', '体验'],
+                '传统动机': ['传统', '习惯', '惯例', '常规']
+            }
+        }
+        self.lexicon = LexiconMatcher.from_vocabularies(self.indicator_vocabulary)
         
     def execute_comprehensive_analysis(self, 
                                      text_data: str,
@@ -468,16 +489,11 @@ class IntegratedWeberAnalyzer:
     
     def _analyze_subjective_meaning(self, text_data: str) -> Dict:
         """分析主观意义"""
-        meaning_indicators = {
-            '工具意义': ['工具', '手段', '方法'],
-            '价值意义': ['价值', '意义', '目的'],
-            '情感意义': ['感受', '体验', '情感'],
-            '社会意义': ['社会', '群体', '关系']
-        }
+        meaning_indicators = self.indicator_vocabulary['subjective_meaning']
         
         meaning_analysis = {}
         for meaning_type, indicators in meaning_indicators.items():
-            count = sum(text_data.count(indicator) for indicator in indicators)
+            count = self.lexicon.scan(text_data).total(indicators)
             meaning_analysis[meaning_type] = {
                 'frequency': count,
                 'prominence': '高' if count >= 3 else '中' if count >= 1 else '低'
@@ -487,16 +503,11 @@ class IntegratedWeberAnalyzer:
     
     def _analyze_motivation_structure(self, text_data: str) -> Dict:
         """分析动机结构"""
-        motivation_indicators = {
-            '利益动机': ['利益', '收益', '好处', '回报'],
-            '价值动机': ['价值', '信念', '理想', '原则'],
-            '情感动机': ['情感', '情绪', '感受', '体验'],
-            '传统动机': ['传统', '习惯', '惯例', '常规']
-        }
+        motivation_indicators = self.indicator_vocabulary['motivation_structure']
         
         motivation_structure = {}
         for motivation_type, indicators in motivation_indicators.items():
-            count = sum(text_data.count(indicator) for indicator in indicators)
+            count = self.lexicon.scan(text_data).total(indicators)
             motivation_structure[motivation_type] = {
                 'strength': count,
                 'level': '强' if count >= 3 else '中' if count >= 1 else '弱'
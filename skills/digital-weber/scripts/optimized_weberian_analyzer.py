@@ -11,8 +11,12 @@ from typing import Dict, List, Tuple, Optional
 import re
 from collections import Counter
 import warnings
-import jieba
-import jieba.analyse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from common.lexicon_matcher import LexiconMatcher
+from common.text_tokenizer import get_tokenizer
 
 
 class OptimizedWeberianAnalyzer:
@@ -22,8 +26,8 @@ class OptimizedWeberianAnalyzer:
         self.analysis_results = {}
         self.quality_metrics = {}
         
-        # 初始化jieba分词
-        jieba.initialize()
+        # 共享分词服务，同一文本只分词一次
+        self.tokenizer = get_tokenizer()
         
         # 优化的韦伯理论词汇库
         self.weber_vocabulary = {
@@ -96,6 +100,28 @@ class OptimizedWeberianAnalyzer:
                 'base_threshold': 2.0
             }
         }
+
+        # 意义结构与理性化冲突的指标词汇
+        self.indicator_vocabulary = {
+            'meaning_indicators': {
+                '工具意义': ['工具', '手段', '方法', '途径', '方式', '策略', '技巧', '实现', '达成', '获得'],
+                '价值意义': ['价值', '意义', '目的', '理想', '追求', '使命', '愿景', '意义', '重要性', '价值'],
+                '情感意义': ['感受', '体验', '情感', '心情', '感觉', '情绪', '心境', '感触', '体验', '感受'],
+                '社会意义': ['社会', '群体', '关系', '地位', '角色', '身份', '归属', '社会', '集体', '群体']
+            },
+            'conflict_indicators': {
+                '工具价值冲突': ['工具理性', '价值理性', '冲突', '矛盾', '张力', '对立', '冲突'],
+                '形式实质冲突': ['形式理性', '实质理性', '冲突', '矛盾', '对立', '张力'],
+                '理性化悖论': ['理性化', '悖论', '困境', '矛盾', '冲突', '问题', '挑战'],
+                '现代性困境': ['现代性', '困境', '问题', '挑战', '危机', '铁笼', '束缚']
+            }
+        }
+
+        # 全部词汇编译为一个多模式匹配器，每篇文本只扫描一次
+        self.lexicon = LexiconMatcher.from_vocabularies(
+            self.weber_vocabulary, self.rationalization_vocabulary,
+            self.authority_vocabulary, self.indicator_vocabulary
+        )
     
     def analyze_social_action_typology_optimized(self, text_data: str, 
                                                 context: Dict = None) -> Dict:
@@ -105,7 +131,7 @@ class OptimizedWeberianAnalyzer:
         processed_text = self._preprocess_text(text_data)
         
         # 获取关键词和语义特征
-        keywords = jieba.analyse.extract_tags(processed_text, topK=100, withWeight=True)
+        keywords = self.tokenizer.extract_tags(processed_text, topK=100, withWeight=True)
         semantic_features = self._extract_semantic_features(processed_text)
         
         # 增强的四类行动分析
@@ -171,7 +197,7 @@ class OptimizedWeberianAnalyzer:
     def _extract_semantic_features(self, text_data: str) -> Dict:
         """提取语义特征"""
         # 分词
-        words = jieba.lcut(text_data)
+        words = self.tokenizer.tokenize(text_data)
         
         # 词性标注（简化版）
         features = {
@@ -199,13 +225,13 @@ class OptimizedWeberianAnalyzer:
     def _calculate_word_frequency_score(self, text_data: str, vocab_info: Dict) -> float:
         """计算词频分数"""
         core_words = vocab_info['core_words']
-        total_words = len(jieba.lcut(text_data))
+        total_words = len(self.tokenizer.tokenize(text_data))
         
         if total_words == 0:
             return 0.0
         
         # 计算核心词汇出现频率
-        word_count = sum(text_data.count(word) for word in core_words)
+        word_count = self.lexicon.scan(text_data).total(core_words)
         frequency_score = (word_count / total_words) * 100
         
         return min(frequency_score, 10.0)
@@ -260,7 +286,7 @@ class OptimizedWeberianAnalyzer:
         if not patterns:
             return 0.0
         
-        pattern_matches = sum(1 for pattern in patterns if pattern in text_data)
+        pattern_matches = self.lexicon.scan(text_data).present(patterns)
         pattern_score = (pattern_matches / len(patterns)) * 10
         
         return pattern_score
@@ -365,18 +391,13 @@ class OptimizedWeberianAnalyzer:
     def _analyze_meaning_structure_optimized(self, text_data: str, 
                                             keywords: List[Tuple]) -> Dict:
         """优化版意义结构分析"""
-        meaning_indicators = {
-            '工具意义': ['工具', '手段', '方法', '途径', '方式', '策略', '技巧', '实现', '达成', '获得'],
-            '价值意义': ['价值', '意义', '目的', '理想', '追求', '使命', '愿景', '意义', '重要性', '价值'],
-            '情感意义': ['感受', '体验', '情感', '心情', '感觉', '情绪', '心境', '感触', '体验', '感受'],
-            '社会意义': ['社会', '群体', '关系', '地位', '角色', '身份', '归属', '社会', '集体', '群体']
-        }
+        meaning_indicators = self.indicator_vocabulary['meaning_indicators']
         
         meaning_structure = {}
         for meaning_type, indicators in meaning_indicators.items():
             # 多维度分析
             keyword_score = sum(weight for word, weight in keywords if word in indicators)
-            word_count = sum(text_data.count(indicator) for indicator in indicators)
+            word_count = self.lexicon.scan(text_data).total(indicators)
             
             # 综合评分
             composite_score = keyword_score * 0.6 + word_count * 0.4
@@ -454,7 +475,7 @@ class OptimizedWeberianAnalyzer:
                                                      modernity_context: Dict = None) -> Dict:
         """优化版理性化过程分析"""
         processed_text = self._preprocess_text(text_data)
-        keywords = jieba.analyse.extract_tags(processed_text, topK=100, withWeight=True)
+        keywords = self.tokenizer.extract_tags(processed_text, topK=100, withWeight=True)
         semantic_features = self._extract_semantic_features(processed_text)
         
         rationalization_aspects = {}
@@ -510,18 +531,13 @@ class OptimizedWeberianAnalyzer:
     
     def _analyze_rationalization_conflicts_optimized(self, text_data: str) -> Dict:
         """优化版理性化冲突分析"""
-        conflict_indicators = {
-            '工具价值冲突': ['工具理性', '价值理性', '冲突', '矛盾', '张力', '对立', '冲突'],
-            '形式实质冲突': ['形式理性', '实质理性', '冲突', '矛盾', '对立', '张力'],
-            '理性化悖论': ['理性化', '悖论', '困境', '矛盾', '冲突', '问题', '挑战'],
-            '现代性困境': ['现代性', '困境', '问题', '挑战', '危机', '铁笼', '束缚']
-        }
+        conflict_indicators = self.indicator_vocabulary['conflict_indicators']
         
         conflict_analysis = {}
         total_conflict_intensity = 0
         
         for conflict_type, indicators in conflict_indicators.items():
-            intensity = sum(text_data.count(indicator) for indicator in indicators)
+            intensity = self.lexicon.scan(text_data).total(indicators)
             
             # 计算冲突密度
             text_length = len(text_data)
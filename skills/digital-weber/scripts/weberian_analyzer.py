@@ -11,6 +11,11 @@ from typing import Dict, List, Tuple, Optional
 import re
 from collections import Counter
 import warnings
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+from common.lexicon_matcher import LexiconMatcher
 
 
 class WeberianAnalyzer:
@@ -19,6 +24,83 @@ class WeberianAnalyzer:
     def __init__(self):
         self.analysis_results = {}
         self.quality_metrics = {}
+
+        # 各分析方法的指标词汇，统一编译为多模式匹配器，每篇文本只扫描一次
+        self.indicator_vocabulary = {
+            'purposive_rationality': [
+                '目标', '目的', '效率', '效果', '计算', '规划', '策略',
+                '优化', '选择', '决策', '手段', '工具', '理性', '利益'
+            ],
+            'value_rationality': [
+                '价值', '信念', '理想', '原则', '道德', '伦理', '责任',
+                '义务', '使命', '信仰', '理念', '追求', '坚持', '奉献'
+            ],
+            'affective_action': [
+                '情感', '情绪', '感觉', '感受', '冲动', '激情', '热爱',
+                '愤怒', '恐惧', '喜悦', '悲伤', '情感', '心情', '体验'
+            ],
+            'traditional_action': [
+                '传统', '习惯', '习俗', '惯例', '常规', '历史', '传承',
+                '古老', '传统', '沿袭', '遵循', '守旧', '传统', '经典'
+            ],
+            'meaning_structure': {
+                '工具意义': ['工具', '手段', '方法', '途径', '方式'],
+                '价值意义': ['价值', '意义', '目的', '理想', '追求'],
+                '情感意义': ['感受', '体验', '情感', '心情', '感觉'],
+                '社会意义': ['社会', '群体', '关系', '地位', '角色']
+            },
+            'disenchantment': [
+                '理性', '科学', '世俗', '理性化', '现代化', '除魅',
+                '去神秘化', '理性', '科学化', '世俗化', '理性'
+            ],
+            'formal_rationality': [
+                '规则', '程序', '制度', '法律', '规范', '标准',
+                '程序', '规则', '制度', '法律', '形式', '规范'
+            ],
+            'substantive_rationality': [
+                '价值', '伦理', '道德', '正义', '公平', '善',
+                '价值', '伦理', '道德', '正义', '善', '目的'
+            ],
+            'rationality_conflicts': [
+                '冲突', '矛盾', '张力', '对立', '冲突', '悖论',
+                '矛盾', '冲突', '张力', '对立', '悖论'
+            ],
+            'traditional_authority': [
+                '传统', '习俗', '习惯', '历史', '世袭', '传统',
+                '惯例', '传统', '习俗', '历史', '世袭'
+            ],
+            'charismatic_authority': [
+                '魅力', '个人', '领袖', '崇拜', '追随', '魅力',
+                '个人魅力', '领袖', '崇拜', '追随', '感召'
+            ],
+            'legal_rational_authority': [
+                '法律', '规则', '制度', '程序', '合法', '理性',
+                '法律', '规则', '制度', '程序', '合法性'
+            ],
+            'legitimacy_base': {
+                '传统合法性': ['传统', '习俗', '历史', '惯例'],
+                '魅力合法性': ['魅力', '个人', '崇拜', '追随'],
+                '法理合法性': ['法律', '规则', '程序', '制度'],
+                '绩效合法性': ['效果', '效率', '成果', '绩效']
+            },
+            'organizational_efficiency': [
+                '效率', '效果', '绩效', '优化', '改进', '提升',
+                '效率', '效果', '绩效', '优化', '改进'
+            ],
+            'impersonalization': [
+                '客观', '公正', '中立', '非人格化', '制度', '规则',
+                '客观', '公正', '中立', '非人格化', '制度'
+            ],
+            'modernity_dilemma': [
+                '困境', '悖论', '矛盾', '冲突', '问题', '挑战',
+                '困境', '悖论', '矛盾', '冲突', '铁笼'
+            ],
+            'iron_cage': [
+                '铁笼', '束缚', '禁锢', '限制', '枷锁', '牢笼',
+                '铁笼', '束缚', '禁锢', '限制', '官僚化'
+            ]
+        }
+        self.lexicon = LexiconMatcher.from_vocabularies(self.indicator_vocabulary)
         
     def analyze_social_action_typology(self, text_data: str, 
                                      context: Dict = None) -> Dict:
@@ -216,10 +298,7 @@ class WeberianAnalyzer:
     
     def _analyze_purposive_rationality(self, text_data: str) -> Dict:
         """分析目的理性"""
-        purposive_indicators = [
-            '目标', '目的', '效率', '效果', '计算', '规划', '策略',
-            '优化', '选择', '决策', '手段', '工具', '理性', '利益'
-        ]
+        purposive_indicators = self.indicator_vocabulary['purposive_rationality']
         
         score = 0.0
         words = re.findall(r'[\u4e00-\u9fff]+', text_data)
@@ -229,7 +308,7 @@ class WeberianAnalyzer:
             return {'score': 0.0, 'level': '低', 'evidence': []}
             
         for indicator in purposive_indicators:
-            count = text_data.count(indicator)
+            count = self.lexicon.scan(text_data).count(indicator)
             score += count * 1.0
             
         # 提取证据
@@ -243,10 +322,7 @@ class WeberianAnalyzer:
     
     def _analyze_value_rationality(self, text_data: str) -> Dict:
         """分析价值理性"""
-        value_indicators = [
-            '价值', '信念', '理想', '原则', '道德', '伦理', '责任',
-            '义务', '使命', '信仰', '理念', '追求', '坚持', '奉献'
-        ]
+        value_indicators = self.indicator_vocabulary['value_rationality']
         
         score = 0.0
         words = re.findall(r'[\u4e00-\u9fff]+', text_data)
@@ -256,7 +332,7 @@ class WeberianAnalyzer:
             return {'score': 0.0, 'level': '低', 'evidence': []}
             
         for indicator in value_indicators:
-            count = text_data.count(indicator)
+            count = self.lexicon.scan(text_data).count(indicator)
             score += count * 1.2
             
         evidence = self._extract_value_evidence(text_data)
@@ -269,10 +345,7 @@ class WeberianAnalyzer:
     
     def _analyze_affective_action(self, text_data: str) -> Dict:
         """分析情感性行动"""
-        affective_indicators = [
-            '情感', '情绪', '感觉', '感受', '冲动', '激情', '热爱',
-            '愤怒', '恐惧', '喜悦', '悲伤', '情感', '心情', '体验'
-        ]
+        affective_indicators = self.indicator_vocabulary['affective_action']
         
         score = 0.0
         words = re.findall(r'[\u4e00-\u9fff]+', text_data)
@@ -282,7 +355,7 @@ class WeberianAnalyzer:
             return {'score': 0.0, 'level': '低', 'evidence': []}
             
         for indicator in affective_indicators:
-            count = text_data.count(indicator)
+            count = self.lexicon.scan(text_data).count(indicator)
             score += count * 1.1
             
         evidence = self._extract_affective_evidence(text_data)
@@ -295,10 +368,7 @@ class WeberianAnalyzer:
     
     def _analyze_traditional_action(self, text_data: str) -> Dict:
         """分析传统性行动"""
-        traditional_indicators = [
-            '传统', '习惯', '习俗', '惯例', '常规', '历史', '传承',
-            '古老', '传统', '沿袭', '遵循', '守旧', '传统', '经典'
-        ]
+        traditional_indicators = self.indicator_vocabulary['traditional_action']
         
         score = 0.0
         words = re.findall(r'[\u4e00-\u9fff]+', text_data)
@@ -308,7 +378,7 @@ class WeberianAnalyzer:
             return {'score': 0.0, 'level': '低', 'evidence': []}
             
         for indicator in traditional_indicators:
-            count = text_data.count(indicator)
+            count = self.lexicon.scan(text_data).count(indicator)
             score += count * 1.0
             
         evidence = self._extract_traditional_evidence(text_data)
@@ -345,16 +415,11 @@ class WeberianAnalyzer:
     
     def _analyze_meaning_structure(self, text_data: str) -> Dict:
         """分析意义结构"""
-        meaning_indicators = {
-            '工具意义': ['工具', '手段', '方法', '途径', '方式'],
-            '价值意义': ['价值', '意义', '目的', '理想', '追求'],
-            '情感意义': ['感受', '体验', '情感', '心情', '感觉'],
-            '社会意义': ['社会', '群体', '关系', '地位', '角色']
-        }
+        meaning_indicators = self.indicator_vocabulary['meaning_structure']
         
         meaning_structure = {}
         for meaning_type, indicators in meaning_indicators.items():
-            count = sum(text_data.count(indicator) for indicator in indicators)
+            count = self.lexicon.scan(text_data).total(indicators)
             meaning_structure[meaning_type] = {
                 'frequency': count,
                 'prominence': '高' if count >= 3 else '中' if count >= 1 else '低'
@@ -375,12 +440,9 @@ class WeberianAnalyzer:
     
     def _analyze_disenchantment(self, text_data: str) -> Dict:
         """分析除魅过程"""
-        disenchantment_indicators = [
-            '理性', '科学', '世俗', '理性化', '现代化', '除魅',
-            '去神秘化', '理性', '科学化', '世俗化', '理性'
-        ]
+        disenchantment_indicators = self.indicator_vocabulary['disenchantment']
         
-        score = sum(text_data.count(indicator) for indicator in disenchantment_indicators)
+        score = self.lexicon.scan(text_data).total(disenchantment_indicators)
         words = re.findall(r'[\u4e00-\u9fff]+', text_data)
         total_words = len(words)
         
@@ -397,12 +459,9 @@ class WeberianAnalyzer:
     
     def _analyze_formal_rationality(self, text_data: str) -> Dict:
         """分析形式理性"""
-        formal_indicators = [
-            '规则', '程序', '制度', '法律', '规范', '标准',
-            '程序', '规则', '制度', '法律', '形式', '规范'
-        ]
+        formal_indicators = self.indicator_vocabulary['formal_rationality']
         
-        score = sum(text_data.count(indicator) for indicator in formal_indicators)
+        score = self.lexicon.scan(text_data).total(formal_indicators)
         words = re.findall(r'[\u4e00-\u9fff]+', text_data)
         total_words = len(words)
         
@@ -419,12 +478,9 @@ class WeberianAnalyzer:
     
     def _analyze_substantive_rationality(self, text_data: str) -> Dict:
         """分析实质理性"""
-        substantive_indicators = [
-            '价值', '伦理', '道德', '正义', '公平', '善',
-            '价值', '伦理', '道德', '正义', '善', '目的'
-        ]
+        substantive_indicators = self.indicator_vocabulary['substantive_rationality']
         
-        score = sum(text_data.count(indicator) for indicator in substantive_indicators)
+        score = self.lexicon.scan(text_data).total(substantive_indicators)
         words = re.findall(r'[\u4e00-\u9fff]+', text_data)
         total_words = len(words)
         
@@ -441,12 +497,9 @@ class WeberianAnalyzer:
     
     def _analyze_rationality_conflicts(self, text_data: str) -> Dict:
         """分析理性化冲突"""
-        conflict_indicators = [
-            '冲突', '矛盾', '张力', '对立', '冲突', '悖论',
-            '矛盾', '冲突', '张力', '对立', '悖论'
-        ]
+        conflict_indicators = self.indicator_vocabulary['rationality_conflicts']
         
-        score = sum(text_data.count(indicator) for indicator in conflict_indicators)
+        score = self.lexicon.scan(text_data).total(conflict_indicators)
         
         return {
             'conflict_intensity': score,
@@ -476,12 +529,9 @@ class WeberianAnalyzer:
     
     def _analyze_traditional_authority(self, text_data: str) -> Dict:
         """分析传统型权威"""
-        traditional_indicators = [
-            '传统', '习俗', '习惯', '历史', '世袭', '传统',
-            '惯例', '传统', '习俗', '历史', '世袭'
-        ]
+        traditional_indicators = self.indicator_vocabulary['traditional_authority']
         
-        score = sum(text_data.count(indicator) for indicator in traditional_indicators)
+        score = self.lexicon.scan(text_data).total(traditional_indicators)
         words = re.findall(r'[\u4e00-\u9fff]+', text_data)
         total_words = len(words)
         
@@ -498,12 +548,9 @@ class WeberianAnalyzer:
     
     def _analyze_charismatic_authority(self, text_data: str) -> Dict:
         """分析魅力型权威"""
-        charismatic_indicators = [
-            '魅力', '个人', '领袖', '崇拜', '追随', '魅力',
-            '个人魅力', '领袖', '崇拜', '追随', '感召'
-        ]
+        charismatic_indicators = self.indicator_vocabulary['charismatic_authority']
         
-        score = sum(text_data.count(indicator) for indicator in charismatic_indicators)
+        score = self.lexicon.scan(text_data).total(charismatic_indicators)
         words = re.findall(r'[\u4e00-\u9fff]+', text_data)
         total_words = len(words)
         
@@ -520,12 +567,9 @@ class WeberianAnalyzer:
     
     def _analyze_legal_rational_authority(self, text_data: str) -> Dict:
         """分析法理型权威"""
-        legal_indicators = [
-            '法律', '规则', '制度', '程序', '合法', '理性',
-            '法律', '规则', '制度', '程序', '合法性'
-        ]
+        legal_indicators = self.indicator_vocabulary['legal_rational_authority']
         
-        score = sum(text_data.count(indicator) for indicator in legal_indicators)
+        score = self.lexicon.scan(text_data).total(legal_indicators)
         words = re.findall(r'[\u4e00-\u9fff]+', text_data)
         total_words = len(words)
         
@@ -561,16 +605,11 @@ class WeberianAnalyzer:
     
     def _analyze_legitimacy_base(self, text_data: str) -> Dict:
         """分析合法性基础"""
-        legitimacy_indicators = {
-            '传统合法性': ['传统', '习俗', '历史', '惯例'],
-            '魅力合法性': ['魅力', '个人', '崇拜', '追随'],
-            '法理合法性': ['法律', '规则', '程序', '制度'],
-            '绩效合法性': ['效果', '效率', '成果', '绩效']
-        }
+        legitimacy_indicators = self.indicator_vocabulary['legitimacy_base']
         
         legitimacy_base = {}
         for leg_type, indicators in legitimacy_indicators.items():
-            count = sum(text_data.count(indicator) for indicator in indicators)
+            count = self.lexicon.scan(text_data).total(indicators)
             legitimacy_base[leg_type] = {
                 'strength': count,
                 'level': '强' if count >= 3 else '中' if count >= 1 else '弱'
@@ -608,12 +647,9 @@ class WeberianAnalyzer:
     
     def _analyze_organizational_efficiency(self, text_data: str) -> Dict:
         """分析组织效率"""
-        efficiency_indicators = [
-            '效率', '效果', '绩效', '优化', '改进', '提升',
-            '效率', '效果', '绩效', '优化', '改进'
-        ]
+        efficiency_indicators = self.indicator_vocabulary['organizational_efficiency']
         
-        score = sum(text_data.count(indicator) for indicator in efficiency_indicators)
+        score = self.lexicon.scan(text_data).total(efficiency_indicators)
         words = re.findall(r'[\u4e00-\u9fff]+', text_data)
         total_words = len(words)
         
@@ -630,12 +666,9 @@ class WeberianAnalyzer:
     
     def _analyze_impersonalization(self, text_data: str) -> Dict:
         """分析非人格化程度"""
-        impersonal_indicators = [
-            '客观', '公正', '中立', '非人格化', '制度', '规则',
-            '客观', '公正', '中立', '非人格化', '制度'
-        ]
+        impersonal_indicators = self.indicator_vocabulary['impersonalization']
         
-        score = sum(text_data.count(indicator) for indicator in impersonal_indicators)
+        score = self.lexicon.scan(text_data).total(impersonal_indicators)
         words = re.findall(r'[\u4e00-\u9fff]+', text_data)
         total_words = len(words)
         
@@ -652,12 +685,9 @@ class WeberianAnalyzer:
     
     def _diagnose_modernity_dilemma(self, text_data: str) -> Dict:
         """诊断现代性困境"""
-        dilemma_indicators = [
-            '困境', '悖论', '矛盾', '冲突', '问题', '挑战',
-            '困境', '悖论', '矛盾', '冲突', '铁笼'
-        ]
+        dilemma_indicators = self.indicator_vocabulary['modernity_dilemma']
         
-        score = sum(text_data.count(indicator) for indicator in dilemma_indicators)
+        score = self.lexicon.scan(text_data).total(dilemma_indicators)
         
         return {
             'dilemma_intensity': score,
@@ -667,12 +697,9 @@ class WeberianAnalyzer:
     
     def _analyze_iron_cage(self, text_data: str) -> Dict:
         """分析"铁笼"现象"""
-        iron_cage_indicators = [
-            '铁笼', '束缚', '禁锢', '限制', '枷锁', '牢笼',
-            '铁笼', '束缚', '禁锢', '限制', '官僚化'
-        ]
+        iron_cage_indicators = self.indicator_vocabulary['iron_cage']
         
-        score = sum(text_data.count(indicator) for indicator in iron_cage_indicators)
+        score = self.lexicon.scan(text_data).total(iron_cage_indicators)
         
         return {
             'iron_cage_intensity': score,
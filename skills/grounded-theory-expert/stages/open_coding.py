@@ -3,16 +3,108 @@
 此模块提供扎根理论开放编码阶段的各项功能
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import json
+import math
 
 
-def open_coding(data: Dict[str, Any]) -> Dict[str, Any]:
+# 持续比较的默认相似度阈值（字符集合Jaccard相似度需大于该值）
+SIMILARITY_THRESHOLD = 0.8
+
+
+class ConceptIndex:
+    """
+    持续比较的概念索引
+    
+    以概念编码的字符集合建立前缀过滤倒排索引：Jaccard相似度大于阈值的两个
+    编码，其按固定顺序排列的字符前缀必有交集，因此每个新概念只需与共享前缀
+    字符且长度相近的候选编码精确比较，结果与两两比较完全一致。支持增量插入，
+    新编码的访谈片段可直接与已有编码本比较而无需重算全部概念对。
+    """
+    
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD):
+        if not 0 < threshold <= 1:
+            raise ValueError("相似度阈值必须在(0, 1]区间内")
+        self.threshold = threshold
+        self.concepts: Dict[str, Dict[str, Any]] = {}
+        self.positions: Dict[str, int] = {}
+        self._code_concepts: Dict[str, List[str]] = {}
+        self._code_sizes: Dict[str, int] = {}
+        self._postings: Dict[str, List[str]] = {}
+    
+    def __len__(self) -> int:
+        return len(self.concepts)
+    
+    def _prefix(self, chars: List[str]) -> List[str]:
+        """相似编码必然共享的字符前缀"""
+        size = len(chars)
+        # 减去微小量防止浮点误差使前缀变短而漏掉候选
+        return chars[:size - math.ceil(self.threshold * size - 1e-9) + 1]
+    
+    def query(self, code: str) -> List[Tuple[str, float]]:
+        """
+        查找与编码相似度大于阈值的已索引编码
+        
+        Returns:
+            [(已索引编码, 相似度), ...]
+        """
+        matches = []
+        # 相同编码的相似度为1.0（包括空编码）
+        if code in self._code_concepts and 1.0 > self.threshold:
+            matches.append((code, 1.0))
+        
+        chars = sorted(set(code))
+        size = len(chars)
+        seen = {code}
+        for char in self._prefix(chars):
+            for candidate in self._postings.get(char, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                # 长度过滤：字符集合大小相差过大时不可能超过阈值
+                other_size = self._code_sizes[candidate]
+                if min(size, other_size) < self.threshold * max(size, other_size) - 1e-9:
+                    continue
+                similarity = calculate_similarity(code, candidate)
+                if similarity > self.threshold:
+                    matches.append((candidate, similarity))
+        return matches
+    
+    def add(self, concept: Dict[str, Any]) -> List[Tuple[str, float]]:
+        """
+        插入概念，返回此前已索引的相似概念
+        
+        Returns:
+            [(相似概念ID, 相似度), ...]，按插入顺序排列
+        """
+        code = concept["code"]
+        matches = [
+            (concept_id, similarity)
+            for matched_code, similarity in self.query(code)
+            for concept_id in self._code_concepts[matched_code]
+        ]
+        
+        if code not in self._code_concepts:
+            self._code_concepts[code] = []
+            chars = sorted(set(code))
+            self._code_sizes[code] = len(chars)
+            for char in self._prefix(chars):
+                self._postings.setdefault(char, []).append(code)
+        self._code_concepts[code].append(concept["id"])
+        self.positions[concept["id"]] = len(self.concepts)
+        self.concepts[concept["id"]] = concept
+        
+        matches.sort(key=lambda match: self.positions[match[0]])
+        return matches
+
+
+def open_coding(data: Dict[str, Any], index: Optional[ConceptIndex] = None) -> Dict[str, Any]:
     """
     执行扎根理论的开放编码阶段
     
     Args:
         data: 包含质性数据的字典
+        index: 已有编码本的概念索引，提供时新概念与已有概念增量比较
     
     Returns:
         包含开放编码结果的字典
@@ -25,14 +117,16 @@ def open_coding(data: Dict[str, Any]) -> Dict[str, Any]:
     if not segments and text_data:
         segments = split_text_into_segments(text_data)
     
-    # 执行概念识别
-    concepts = identify_concepts(segments)
+    # 执行概念识别，增量编码时概念编号接续已有编码本
+    concepts = identify_concepts(segments, start_id=len(index) + 1 if index is not None else 1)
     
     # 执行持续比较
-    comparison_results = perform_constant_comparison(concepts)
+    comparison_results = perform_constant_comparison(concepts, index=index)
     
     # 执行编码优化
-    optimized_codes = optimize_codes(concepts, comparison_results)
+    optimized_codes = optimize_codes(
+        concepts, comparison_results, codebook=index.concepts if index is not None else None
+    )
     
     # 返回开放编码结果
     return {
@@ -66,18 +160,19 @@ def split_text_into_segments(text: str) -> List[str]:
     return segments
 
 
-def identify_concepts(segments: List[str]) -> List[Dict[str, Any]]:
+def identify_concepts(segments: List[str], start_id: int = 1) -> List[Dict[str, Any]]:
     """
     从文本段落中识别概念
     
     Args:
         segments: 文本段落列表
+        start_id: 起始概念编号
     
     Returns:
         识别出的概念列表
     """
     concepts = []
-    concept_id = 1
+    concept_id = start_id
     
     for i, segment in enumerate(segments):
         # 简化的概念识别逻辑
@@ -99,42 +194,49 @@ def identify_concepts(segments: List[str]) -> List[Dict[str, Any]]:
     return concepts
 
 
-def perform_constant_comparison(concepts: List[Dict[str, Any]]) -> Dict[str, Any]:
+def perform_constant_comparison(concepts: List[Dict[str, Any]],
+                                threshold: float = SIMILARITY_THRESHOLD,
+                                index: Optional[ConceptIndex] = None) -> Dict[str, Any]:
     """
     执行持续比较分析
     
     Args:
         concepts: 概念列表
+        threshold: 相似度阈值
+        index: 已有编码本的概念索引，提供时新概念依次插入并与已有概念比较
     
     Returns:
         比较分析结果
     """
-    # 简化的比较逻辑
-    # 在实际应用中，这里会使用语义相似度算法
     comparison_results = {
         "similar_pairs": [],
         "merged_pairs": [],
         "relationship_matrix": {}
     }
     
-    # 比较概念间的相似性
-    for i, concept1 in enumerate(concepts):
-        for j, concept2 in enumerate(concepts[i+1:], i+1):
-            # 简化的相似性判断
-            similarity = calculate_similarity(concept1["code"], concept2["code"])
-            if similarity > 0.8:  # 相似度阈值
-                comparison_results["similar_pairs"].append({
-                    "concept1": concept1["id"],
-                    "concept2": concept2["id"],
-                    "similarity": similarity
-                })
-                
-                # 合并相似概念
-                comparison_results["merged_pairs"].append({
-                    "kept": concept1["id"],
-                    "merged": concept2["id"],
-                    "reason": "High semantic similarity"
-                })
+    if index is None:
+        index = ConceptIndex(threshold)
+    
+    # 每个概念只与索引给出的候选近邻比较
+    for concept in concepts:
+        for earlier_id, similarity in index.add(concept):
+            comparison_results["similar_pairs"].append({
+                "concept1": earlier_id,
+                "concept2": concept["id"],
+                "similarity": similarity
+            })
+            
+            # 合并相似概念
+            comparison_results["merged_pairs"].append({
+                "kept": earlier_id,
+                "merged": concept["id"],
+                "reason": "High semantic similarity"
+            })
+    
+    # 与两两比较的输出顺序保持一致
+    order = index.positions
+    for key, first, second in (("similar_pairs", "concept1", "concept2"), ("merged_pairs", "kept", "merged")):
+        comparison_results[key].sort(key=lambda pair: (order[pair[first]], order[pair[second]]))
     
     return comparison_results
 
@@ -164,19 +266,23 @@ def calculate_similarity(str1: str, str2: str) -> float:
     return len(common_chars) / len(total_chars)
 
 
-def optimize_codes(concepts: List[Dict[str, Any]], comparison_results: Dict[str, Any]) -> List[Dict[str, Any]]:
+def optimize_codes(concepts: List[Dict[str, Any]], comparison_results: Dict[str, Any],
+                   codebook: Optional[Dict[str, Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
     """
     优化编码结果
     
     Args:
         concepts: 原始概念列表
         comparison_results: 比较结果
+        codebook: 已有编码本的概念映射，被合并到已有概念的新概念示例追加到编码本中
     
     Returns:
         优化后的概念列表
     """
     # 创建概念ID到概念的映射
-    concept_map = {concept["id"]: concept for concept in concepts}
+    concept_map = dict(codebook or {})
+    concept_map.update({concept["id"]: concept for concept in concepts})
+    current_ids = [concept["id"] for concept in concepts]
     
     # 根据合并结果创建优化的概念列表
     kept_concept_ids = {pair["kept"] for pair in comparison_results.get("merged_pairs", [])}
@@ -185,7 +291,7 @@ def optimize_codes(concepts: List[Dict[str, Any]], comparison_results: Dict[str,
     # 保留未被合并的概念
     optimized_concepts = [
         concept_map[concept_id] 
-        for concept_id in concept_map 
+        for concept_id in current_ids 
         if concept_id not in merged_concept_ids
     ]
     
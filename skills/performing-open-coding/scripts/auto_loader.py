@@ -5,11 +5,15 @@
 为Claude提供快速的数据预处理支持
 """
 
-import jieba
 import re
+import sys
 from collections import Counter
+from pathlib import Path
 from typing import List, Dict, Any
 
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from common.text_tokenizer import get_tokenizer
+
 class OpenCodingAutoLoader:
     """开放编码自动处理工具"""
 
@@ -22,7 +26,7 @@ class OpenCodingAutoLoader:
     def quick_concept_extract(self, text: str) -> List[Dict[str, Any]]:
         """快速概念提取"""
         # 中文分词
-        words = jieba.lcut(text)
+        words = get_tokenizer().tokenize(text)
 
         # 过滤停用词和单字
         filtered_words = [
@@ -23,7 +23,9 @@ from typing import List, Dict
 import numpy as np
 from sklearn.cluster import KMeans, AgglomerativeClustering
 from sklearn.feature_extraction.text import TfidfVectorizer
-import jieba
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from common.text_tokenizer import get_tokenizer
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
@@ -46,7 +48,7 @@ def cluster_by_kmeans(concepts: List[Dict], n_clusters: int) -> Dict:
     concept_texts = [c.get('concept') or c.get('code', '') for c in concepts]
     
     # TF-IDF向量化
-    vectorizer = TfidfVectorizer(tokenizer=lambda x: jieba.lcut(x))
+    vectorizer = TfidfVectorizer(tokenizer=get_tokenizer().tokenize, token_pattern=None)
     try:
         tfidf_matrix = vectorizer.fit_transform(concept_texts)
     except Exception as e:
@@ -109,7 +111,7 @@ def cluster_hierarchical(concepts: List[Dict], n_clusters: int = None) -> Dict:
     concept_texts = [c.get('concept') or c.get('code', '') for c in concepts]
     
     # TF-IDF向量化
-    vectorizer = TfidfVectorizer(tokenizer=lambda x: jieba.lcut(x))
+    vectorizer = TfidfVectorizer(tokenizer=get_tokenizer().tokenize, token_pattern=None)
     try:
         tfidf_matrix = vectorizer.fit_transform(concept_texts)
     except Exception as e:
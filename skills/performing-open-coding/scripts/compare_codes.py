@@ -8,8 +8,12 @@
 - 识别重复编码
 - 建议合并编码
 
+全部编码只拟合一次TF-IDF，分块计算稀疏余弦相似度并按阈值与top-k筛选编码对；
+超大编码本可使用MinHash LSH生成候选对，再精确计算候选对的相似度。
+
 使用方式：
   python compare_codes.py --input codes.json --output comparison.json
+  python compare_codes.py --input codes.json --method lsh --top-k 10
 """
 
 import argparse
@@ -19,14 +23,32 @@ import sys
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Tuple
-import jieba
+import zlib
+from typing import List, Dict, Optional, Tuple
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
+from scipy import sparse
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from common.text_tokenizer import get_tokenizer
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
+# 分块相似度计算的默认块大小（行数）
+DEFAULT_BLOCK_SIZE = 1024
+
+# MinHash的哈希函数个数与LSH分带数，每带4行时约在Jaccard 0.4处开始成为候选
+DEFAULT_NUM_PERM = 128
+DEFAULT_LSH_BANDS = 32
+
+# 梅森素数2^31-1，用于MinHash的通用哈希
+_MERSENNE_PRIME = (1 << 31) - 1
+
+def get_code_text(code: Dict) -> str:
+    """获取编码文本，兼容'code'和'concept'字段"""
+    return code.get('code') or code.get('concept', '')
+
 def calculate_similarity(code1: str, code2: str) -> float:
     """
     计算两个编码的语义相似度
@@ -39,7 +61,7 @@ def calculate_similarity(code1: str, code2: str) -> float:
         相似度分数（0-1）
     """
     # 使用TF-IDF + 余弦相似度
-    vectorizer = TfidfVectorizer(tokenizer=lambda x: jieba.lcut(x))
+    vectorizer = TfidfVectorizer(tokenizer=get_tokenizer().tokenize, token_pattern=None)
     try:
         tfidf_matrix = vectorizer.fit_transform([code1, code2])
         similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
@@ -47,41 +69,189 @@ def calculate_similarity(code1: str, code2: str) -> float:
     except:
         return 0.0
 
-def identify_duplicates(codes: List[Dict], threshold: float = 0.8) -> List[Tuple]:
+def vectorize_codes(texts: List[str], analyzer: str = 'word') -> sparse.csr_matrix:
+    """
+    对全部编码一次性拟合TF-IDF，返回L2归一化的稀疏矩阵
+    
+    Args:
+        texts: 编码文本列表
+        analyzer: 'word'为jieba分词，'char'为字符1-2元组
+    
+    Returns:
+        CSR矩阵，行向量的内积即余弦相似度
+    """
+    if analyzer == 'word':
+        vectorizer = TfidfVectorizer(tokenizer=get_tokenizer().tokenize, token_pattern=None)
+    elif analyzer == 'char':
+        vectorizer = TfidfVectorizer(analyzer='char_wb', ngram_range=(1, 2))
+    else:
+        raise ValueError(f"不支持的分析器: {analyzer}")
+    
+    try:
+        return vectorizer.fit_transform(texts).tocsr()
+    except ValueError:
+        # 全部编码为空或只含停用词
+        return sparse.csr_matrix((len(texts), 0))
+
+def _prune_top_k(rows: np.ndarray, cols: np.ndarray, sims: np.ndarray,
+                 top_k: Optional[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """保留至少在一端编码的前k个最相似编码之内的编码对"""
+    if not top_k or len(sims) == 0:
+        return rows, cols, sims
+    
+    keep = np.zeros(len(sims), dtype=bool)
+    for owner in (rows, cols):
+        order = np.lexsort((-sims, owner))
+        owner_sorted = owner[order]
+        # 每个编码内按相似度降序的名次
+        group_start = np.r_[0, np.flatnonzero(np.diff(owner_sorted)) + 1]
+        ranks = np.arange(len(order)) - np.repeat(group_start, np.diff(np.r_[group_start, len(order)]))
+        keep[order[ranks < top_k]] = True
+    return rows[keep], cols[keep], sims[keep]
+
+def similar_pairs(matrix: sparse.csr_matrix, threshold: float, top_k: Optional[int] = None,
+                  block_size: int = DEFAULT_BLOCK_SIZE) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    分块计算稀疏余弦相似度，提取相似度不低于阈值的编码对
+    
+    Args:
+        matrix: vectorize_codes返回的归一化矩阵
+        threshold: 相似度阈值
+        top_k: 每个编码最多保留的相似编码数，None表示不限制
+        block_size: 每块的行数，控制峰值内存
+    
+    Returns:
+        (行索引, 列索引, 相似度)，行索引小于列索引，按(行, 列)排序
+    """
+    n = matrix.shape[0]
+    transposed = matrix.T.tocsc()
+    all_rows, all_cols, all_sims = [], [], []
+    
+    for start in range(0, n, block_size):
+        block = (matrix[start:start + block_size] @ transposed).tocoo()
+        rows = block.row + start
+        # 只保留上三角，避免重复和自身比较
+        mask = (block.col > rows) & (block.data >= threshold)
+        all_rows.append(rows[mask])
+        all_cols.append(block.col[mask])
+        all_sims.append(block.data[mask])
+    
+    if not all_rows:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, np.array([], dtype=float)
+    
+    rows, cols, sims = _prune_top_k(np.concatenate(all_rows).astype(np.int64),
+                                    np.concatenate(all_cols).astype(np.int64),
+                                    np.minimum(np.concatenate(all_sims), 1.0), top_k)
+    order = np.lexsort((cols, rows))
+    return rows[order], cols[order], sims[order]
+
+def minhash_signatures(matrix: sparse.csr_matrix, num_perm: int = DEFAULT_NUM_PERM,
+                       seed: int = 1) -> np.ndarray:
+    """
+    以每行的非零特征为集合计算MinHash签名
+    
+    Returns:
+        (编码数 × num_perm)的签名矩阵，空编码的签名为哈希上界
+    """
+    rng = np.random.RandomState(seed)
+    a = rng.randint(1, _MERSENNE_PRIME, size=(num_perm, 1)).astype(np.int64)
+    b = rng.randint(0, _MERSENNE_PRIME, size=(num_perm, 1)).astype(np.int64)
+    
+    signatures = np.full((matrix.shape[0], num_perm), _MERSENNE_PRIME, dtype=np.int64)
+    non_empty = np.flatnonzero(np.diff(matrix.indptr))
+    if len(non_empty) == 0:
+        return signatures
+    
+    features = matrix.indices.astype(np.int64) % _MERSENNE_PRIME
+    hashed = (a * features + b) % _MERSENNE_PRIME
+    signatures[non_empty] = np.minimum.reduceat(hashed, matrix.indptr[non_empty], axis=1).T
+    return signatures
+
+def lsh_candidate_pairs(signatures: np.ndarray, bands: int = DEFAULT_LSH_BANDS) -> np.ndarray:
+    """
+    将签名分带做局部敏感哈希，返回至少在一个带内同桶的候选编码对
+    
+    Returns:
+        (候选对数 × 2)数组，每行为(i, j)且i < j
+    """
+    n, num_perm = signatures.shape
+    rows_per_band = max(1, num_perm // bands)
+    valid = np.flatnonzero(signatures[:, 0] < _MERSENNE_PRIME)
+    candidates = set()
+    
+    for start in range(0, rows_per_band * bands, rows_per_band):
+        band = signatures[valid, start:start + rows_per_band]
+        buckets: Dict[int, List[int]] = {}
+        for index, row in zip(valid, band):
+            buckets.setdefault(zlib.crc32(row.tobytes()), []).append(int(index))
+        for members in buckets.values():
+            for pos, i in enumerate(members):
+                for j in members[pos + 1:]:
+                    candidates.add((i, j))
+    
+    if not candidates:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.array(sorted(candidates), dtype=np.int64)
+
+def lsh_similar_pairs(matrix: sparse.csr_matrix, threshold: float, top_k: Optional[int] = None,
+                      num_perm: int = DEFAULT_NUM_PERM,
+                      bands: int = DEFAULT_LSH_BANDS) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """用MinHash LSH生成候选对，只对候选对精确计算余弦相似度（近似召回）"""
+    candidates = lsh_candidate_pairs(minhash_signatures(matrix, num_perm), bands)
+    if len(candidates) == 0:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, np.array([], dtype=float)
+    
+    rows, cols = candidates[:, 0], candidates[:, 1]
+    sims = np.asarray(matrix[rows].multiply(matrix[cols]).sum(axis=1)).ravel()
+    mask = sims >= threshold
+    rows, cols, sims = _prune_top_k(rows[mask], cols[mask], np.minimum(sims[mask], 1.0), top_k)
+    order = np.lexsort((cols, rows))
+    return rows[order], cols[order], sims[order]
+
+def identify_duplicates(codes: List[Dict], threshold: float = 0.8, top_k: Optional[int] = None,
+                        method: str = 'exact', analyzer: str = 'word',
+                        block_size: int = DEFAULT_BLOCK_SIZE) -> List[Dict]:
     """
     识别重复或高度相似的编码
     
     Args:
         codes: 编码列表
         threshold: 相似度阈值（默认0.8）
+        top_k: 每个编码最多保留的相似编码数，None表示不限制
+        method: 'exact'为分块精确计算，'lsh'为MinHash LSH近似计算
+        analyzer: TF-IDF特征，'word'或'char'
+        block_size: 精确计算时每块的行数
     
     Returns:
-        重复编码对列表 [(code1, code2, similarity), ...]
+        重复编码对列表 [{'code1', 'code2', 'similarity', 'index1', 'index2'}, ...]
     """
-    duplicates = []
-    n = len(codes)
+    # 空编码不参与比较
+    indices = [i for i, code in enumerate(codes) if get_code_text(code)]
+    if len(indices) < 2:
+        return []
     
-    for i in range(n):
-        for j in range(i + 1, n):
-            # 兼容'code'和'concept'字段
-            code1 = codes[i].get('code') or codes[i].get('concept', '')
-            code2 = codes[j].get('code') or codes[j].get('concept', '')
-            
-            if not code1 or not code2:
-                continue
-            
-            similarity = calculate_similarity(code1, code2)
-            
-            if similarity >= threshold:
-                duplicates.append({
-                    'code1': code1,
-                    'code2': code2,
-                    'similarity': round(similarity, 3),
-                    'index1': i,
-                    'index2': j
-                })
-    
-    return duplicates
+    texts = [get_code_text(codes[i]) for i in indices]
+    matrix = vectorize_codes(texts, analyzer)
+    
+    if method == 'exact':
+        rows, cols, sims = similar_pairs(matrix, threshold, top_k, block_size)
+    elif method == 'lsh':
+        rows, cols, sims = lsh_similar_pairs(matrix, threshold, top_k)
+    else:
+        raise ValueError(f"不支持的比较方法: {method}")
+    
+    return [
+        {
+            'code1': texts[i],
+            'code2': texts[j],
+            'similarity': round(float(sim), 3),
+            'index1': indices[i],
+            'index2': indices[j]
+        }
+        for i, j, sim in zip(rows.tolist(), cols.tolist(), sims.tolist())
+    ]
 
 def suggest_merges(codes: List[Dict], duplicates: List[Dict]) -> List[Dict]:
     """
@@ -109,8 +279,8 @@ def suggest_merges(codes: List[Dict], duplicates: List[Dict]) -> List[Dict]:
             secondary = code1_data
         
         # 兼容字段名
-        primary_code = primary.get('code') or primary.get('concept', '')
-        secondary_code = secondary.get('code') or secondary.get('concept', '')
+        primary_code = get_code_text(primary)
+        secondary_code = get_code_text(secondary)
         
         suggestions.append({
             'action': 'merge',
@@ -123,49 +293,54 @@ def suggest_merges(codes: List[Dict], duplicates: List[Dict]) -> List[Dict]:
     
     return suggestions
 
-def analyze_code_relationships(codes: List[Dict]) -> Dict:
+def analyze_code_relationships(codes: List[Dict], include_matrix: bool = True,
+                               analyzer: str = 'word') -> Dict:
     """
     分析编码间的关系
     
+    Args:
+        codes: 编码列表
+        include_matrix: 是否返回完整的n×n相似度矩阵（编码较多时内存开销大）
+        analyzer: TF-IDF特征，'word'或'char'
+    
     Returns:
         关系分析结果
     """
     n = len(codes)
-    similarity_matrix = np.zeros((n, n))
+    texts = [get_code_text(code) for code in codes]
+    matrix = vectorize_codes([text or '' for text in texts], analyzer) if n else sparse.csr_matrix((0, 0))
+    
+    # 每个编码最相关的前3个编码（相似度需高于0.3）
+    rows, cols, sims = similar_pairs(matrix, threshold=0.3, top_k=3)
+    neighbors: Dict[int, List[Tuple[float, int]]] = {}
+    for i, j, sim in zip(rows.tolist(), cols.tolist(), sims.tolist()):
+        if sim > 0.3 and texts[i] and texts[j]:
+            neighbors.setdefault(i, []).append((sim, j))
+            neighbors.setdefault(j, []).append((sim, i))
     
-    # 计算相似度矩阵
-    for i in range(n):
-        for j in range(i + 1, n):
-            code_i = codes[i].get('code') or codes[i].get('concept', '')
-            code_j = codes[j].get('code') or codes[j].get('concept', '')
-            if not code_i or not code_j:
-                continue
-            sim = calculate_similarity(code_i, code_j)
-            similarity_matrix[i][j] = sim
-            similarity_matrix[j][i] = sim
-    
-    # 找出每个编码最相关的编码
     relationships = []
     for i in range(n):
-        related_indices = np.argsort(similarity_matrix[i])[::-1][1:4]  # 前3个相关编码
-        related_codes = [
-            {
-                'code': codes[j].get('code') or codes[j].get('concept', ''),
-                'similarity': round(float(similarity_matrix[i][j]), 3)
-            }
-            for j in related_indices if similarity_matrix[i][j] > 0.3
-        ]
-        
-        if related_codes:
-            relationships.append({
-                'code': codes[i].get('code') or codes[i].get('concept', ''),
-                'related_codes': related_codes
-            })
-    
-    return {
-        'similarity_matrix': similarity_matrix.tolist(),
-        'relationships': relationships
-    }
+        if i not in neighbors:
+            continue
+        related = sorted(neighbors[i], key=lambda item: (-item[0], item[1]))[:3]
+        relationships.append({
+            'code': texts[i],
+            'related_codes': [
+                {'code': texts[j], 'similarity': round(sim, 3)}
+                for sim, j in related
+            ]
+        })
+    
+    result = {'relationships': relationships}
+    if include_matrix:
+        similarity_matrix = (matrix @ matrix.T).toarray() if n else np.zeros((0, 0))
+        np.fill_diagonal(similarity_matrix, 0.0)
+        # 空编码与任何编码的相似度记为0
+        empty = [i for i, text in enumerate(texts) if not text]
+        similarity_matrix[empty, :] = 0.0
+        similarity_matrix[:, empty] = 0.0
+        result['similarity_matrix'] = np.minimum(similarity_matrix, 1.0).tolist()
+    return result
 
 def main():
     parser = argparse.ArgumentParser(
@@ -180,6 +355,12 @@ def main():
     parser.add_argument('--input', '-i', required=True, help='输入的编码JSON文件')
     parser.add_argument('--output', '-o', default='comparison.json', help='输出JSON文件')
     parser.add_argument('--threshold', '-t', type=float, default=0.8, help='相似度阈值（默认：0.8）')
+    parser.add_argument('--top-k', type=int, default=None, help='每个编码最多保留的相似编码数')
+    parser.add_argument('--method', choices=['exact', 'lsh'], default='exact',
+                        help='exact为分块精确计算，lsh为MinHash LSH近似计算（适合超大编码本）')
+    parser.add_argument('--analyzer', choices=['word', 'char'], default='word',
+                        help='TF-IDF特征：word为分词，char为字符n-gram')
+    parser.add_argument('--block-size', type=int, default=DEFAULT_BLOCK_SIZE, help='分块计算的行数')
     args = parser.parse_args()
     
     start_time = time.time()
@@ -210,9 +391,10 @@ def main():
         logging.info(f"✓ 读取编码: {len(codes)} 个")
         
         # 执行比较分析
-        duplicates = identify_duplicates(codes, args.threshold)
+        duplicates = identify_duplicates(codes, args.threshold, top_k=args.top_k, method=args.method,
+                                         analyzer=args.analyzer, block_size=args.block_size)
         suggestions = suggest_merges(codes, duplicates)
-        relationships = analyze_code_relationships(codes)
+        relationships = analyze_code_relationships(codes, include_matrix=False, analyzer=args.analyzer)
         
         processing_time = time.time() - start_time
         
@@ -223,6 +405,7 @@ def main():
                 'duplicate_pairs': len(duplicates),
                 'merge_suggestions': len(suggestions),
                 'similarity_threshold': args.threshold,
+                'method': args.method,
                 'processing_time': round(processing_time, 2)
             },
             'details': {
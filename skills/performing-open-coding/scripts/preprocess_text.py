@@ -19,9 +19,10 @@ import sys
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict
-import jieba
-import jieba.posseg as pseg
+from typing import List, Dict, Tuple
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from common.text_tokenizer import get_tokenizer
 
 # 配置日志
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -45,13 +46,25 @@ def tokenize_chinese(text: str, keep_pos: List[str] = None) -> List[str]:
     Returns:
         分词结果列表
     """
+    return filter_by_pos(get_tokenizer().pos_tag(text), keep_pos)
+
+def filter_by_pos(tagged_words: List[Tuple[str, str]], keep_pos: List[str] = None) -> List[str]:
+    """
+    按词性过滤词性标注结果
+    
+    Args:
+        tagged_words: (词, 词性)列表
+        keep_pos: 保留的词性列表（默认：名词、动词、形容词）
+    
+    Returns:
+        过滤后的词列表
+    """
     if keep_pos is None:
         keep_pos = ['n', 'v', 'a', 'vn', 'an']  # 名词、动词、形容词
     
-    words = pseg.cut(text)
     result = []
     
-    for word, flag in words:
+    for word, flag in tagged_words:
         # 保留指定词性且长度>1的词
         if any(flag.startswith(pos) for pos in keep_pos) and len(word) > 1:
             result.append(word)
@@ -120,12 +133,13 @@ def preprocess_text(text: str) -> Dict:
     # 1. 分段
     segments = segment_by_meaning(text)
     
-    # 2. 分词
+    # 2. 分词（批量词性标注，重复段落只处理一次）
     all_words = []
     segment_words = []
+    tagged_segments = get_tokenizer().tokenize_many(segments, mode='pos')
     
-    for seg in segments:
-        words = tokenize_chinese(seg)
+    for seg, tagged in zip(segments, tagged_segments):
+        words = filter_by_pos(tagged)
         words_filtered = remove_stopwords(words)
         all_words.extend(words_filtered)
         segment_words.append({
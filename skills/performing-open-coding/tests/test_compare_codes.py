@@ -14,7 +14,9 @@ from compare_codes import (
     calculate_similarity,
     identify_duplicates,
     suggest_merges,
-    analyze_code_relationships
+    analyze_code_relationships,
+    vectorize_codes,
+    similar_pairs
 )
 
 
@@ -147,6 +149,57 @@ class TestIdentifyDuplicates:
         assert len(duplicates) == 0
 
 
+class TestVectorizedSimilarity:
+    """测试一次拟合的向量化相似度计算"""
+    
+    CODES = [
+        {'concept': '寻求老师帮助', 'frequency': 5},
+        {'concept': '寻求教师帮助', 'frequency': 3},
+        {'concept': '寻求老师帮助', 'frequency': 2},
+        {'concept': '学习方法', 'frequency': 4},
+        {'concept': '', 'frequency': 1},
+        {'concept': '情感体验', 'frequency': 2}
+    ]
+    
+    def test_pairs_match_full_matrix(self):
+        """测试分块结果与完整相似度矩阵一致"""
+        texts = [c['concept'] for c in self.CODES if c['concept']]
+        matrix = vectorize_codes(texts)
+        full = (matrix @ matrix.T).toarray()
+        
+        rows, cols, sims = similar_pairs(matrix, threshold=0.2, block_size=2)
+        expected = {(i, j) for i in range(len(texts)) for j in range(i + 1, len(texts))
+                    if full[i, j] >= 0.2}
+        
+        assert set(zip(rows.tolist(), cols.tolist())) == expected
+        assert all(abs(full[i, j] - s) < 1e-9 for i, j, s in zip(rows, cols, sims))
+    
+    def test_empty_code_skipped(self):
+        """测试空编码不参与比较，索引对应原始列表"""
+        duplicates = identify_duplicates(self.CODES, threshold=0.95)
+        
+        assert [(d['index1'], d['index2']) for d in duplicates] == [(0, 2)]
+    
+    def test_top_k_pruning(self):
+        """测试top-k限制每个编码的相似编码数"""
+        codes = [{'concept': '寻求帮助'} for _ in range(5)]
+        
+        assert len(identify_duplicates(codes, threshold=0.8)) == 10
+        assert len(identify_duplicates(codes, threshold=0.8, top_k=1)) < 10
+    
+    def test_lsh_finds_exact_duplicates(self):
+        """测试MinHash LSH召回完全重复的编码"""
+        duplicates = identify_duplicates(self.CODES, threshold=0.95, method='lsh')
+        
+        assert (0, 2) in [(d['index1'], d['index2']) for d in duplicates]
+    
+    def test_char_analyzer(self):
+        """测试字符n-gram特征"""
+        duplicates = identify_duplicates(self.CODES, threshold=0.5, analyzer='char')
+        
+        assert (0, 1) in [(d['index1'], d['index2']) for d in duplicates]
+
+
 class TestSuggestMerges:
     """测试合并建议"""
     
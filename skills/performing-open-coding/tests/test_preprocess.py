@@ -17,6 +17,7 @@ from preprocess_text import (
     segment_by_meaning,
     preprocess_text
 )
+from common.text_tokenizer import TokenizationService
 
 class TestTokenizeChinese:
     """测试中文分词功能"""
@@ -183,5 +184,42 @@ class TestIntegration:
         assert any(w in ['学习', '老师', '帮助', '困难'] for w in top_words)
 
 
+class TestTokenizationService:
+    """测试共享分词服务的缓存"""
+    
+    def test_memory_cache_hit(self):
+        """测试同一文本只分词一次"""
+        service = TokenizationService()
+        text = "我会主动寻求老师的帮助"
+        first = service.tokenize(text)
+        second = service.tokenize(text)
+        
+        assert first == second
+        info = service.cache_info()
+        assert info['misses'] == 1
+        assert info['memory_hits'] == 1
+    
+    def test_disk_cache_shared(self, tmp_path):
+        """测试磁盘缓存可跨实例复用"""
+        text = "老师给了我很多学习上的指导和支持"
+        writer = TokenizationService(cache_dir=str(tmp_path))
+        expected = writer.pos_tag(text)
+        writer.close()
+        
+        reader = TokenizationService(cache_dir=str(tmp_path))
+        assert reader.pos_tag(text) == expected
+        assert reader.cache_info()['disk_hits'] == 1
+        reader.close()
+    
+    def test_extract_tags_matches_jieba(self):
+        """测试关键词提取与jieba.analyse一致"""
+        import jieba.analyse
+        text = "我在大学学习过程中遇到了很多困难，老师给了我很多学习上的指导。"
+        service = TokenizationService()
+        
+        assert service.extract_tags(text, topK=5, withWeight=True) == \
+            jieba.analyse.extract_tags(text, topK=5, withWeight=True)
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v', '--tb=short'])
@@ -8,9 +8,26 @@ import argparse
 import json
 import sys
 from datetime import datetime
-from typing import Dict, List, Any, Set
+from pathlib import Path
+from typing import Dict, List, Any, Set, Tuple
 from collections import defaultdict
 
+import numpy as np
+from scipy import sparse
+
+# 合作频率到边权重的映射
+FREQUENCY_WEIGHTS = {
+    '每天': 1.0,
+    '每周': 0.8,
+    '每月': 0.6,
+    '每季度': 0.4,
+    '每年': 0.2,
+    '偶尔': 0.3
+}
+
+# 超过该节点数时不再在JSON中输出稠密矩阵，仅保存.npz稀疏文件
+DENSE_EXPORT_LIMIT = 2000
+
 def extract_edgelist(respondents: List[Dict]) -> List[Dict]:
     """提取边列表"""
     edges = []
@@ -38,15 +55,7 @@ def extract_edgelist(respondents: List[Dict]) -> List[Dict]:
             
             # 计算权重（基于合作频率）
             frequency = collab.get('frequency', '')
-            weight_map = {
-                '每天': 1.0,
-                '每周': 0.8,
-                '每月': 0.6,
-                '每季度': 0.4,
-                '每年': 0.2,
-                '偶尔': 0.3
-            }
-            weight = weight_map.get(frequency, 0.5)
+            weight = FREQUENCY_WEIGHTS.get(frequency, 0.5)
             
             edge = {
                 'source': source,
@@ -60,60 +69,78 @@ def extract_edgelist(respondents: List[Dict]) -> List[Dict]:
     
     return edges
 
-def extract_adjacency_matrix(respondents: List[Dict]) -> Dict:
-    """提取邻接矩阵"""
-    # 获取所有节点
-    nodes = set()
-    for respondent in respondents:
-        nodes.add(respondent.get('name', ''))
-        for collab in respondent.get('collaborators', []):
-            nodes.add(collab.get('name', ''))
-    nodes = [n for n in nodes if n]  # 移除空值
-    
-    # 创建节点映射
-    node_to_index = {node: i for i, node in enumerate(nodes)}
-    n = len(nodes)
-    
-    # 初始化矩阵
-    matrix = [[0.0 for _ in range(n)] for _ in range(n)]
-    
-    # 填充矩阵
+def build_sparse_adjacency(sources: List[str], targets: List[str],
+                           weights: List[float]) -> Tuple[sparse.csr_matrix, List[str]]:
+    """由边三元组构建对称稀疏邻接矩阵
+
+    节点名称按首次出现顺序驻留为整数编号，权重用NumPy累积，
+    同一节点对出现多条边时取最大权重。
+    """
+    node_to_index: Dict[str, int] = {}
+    intern = node_to_index.setdefault
+    rows = np.fromiter((intern(s, len(node_to_index)) for s in sources),
+                       dtype=np.int64, count=len(sources))
+    cols = np.fromiter((intern(t, len(node_to_index)) for t in targets),
+                       dtype=np.int64, count=len(targets))
+    data = np.asarray(weights, dtype=np.float64)
+    n = len(node_to_index)
+
+    # 无向图：同时写入(i, j)与(j, i)
+    rows, cols = np.concatenate([rows, cols]), np.concatenate([cols, rows])
+    data = np.concatenate([data, data])
+
+    if data.size:
+        # 按线性下标排序后分组取最大值，替代逐元素的max比较
+        keys = rows * n + cols
+        order = np.argsort(keys, kind='stable')
+        keys, data = keys[order], data[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        data = np.maximum.reduceat(data, starts)
+        keys = keys[starts]
+        rows, cols = keys // n, keys % n
+
+    matrix = sparse.coo_matrix((data, (rows, cols)), shape=(n, n)).tocsr()
+    return matrix, list(node_to_index)
+
+def sparse_adjacency_summary(matrix: sparse.csr_matrix, nodes: List[str],
+                             dense_limit: int = DENSE_EXPORT_LIMIT) -> Dict:
+    """生成可写入JSON的邻接矩阵描述，仅在规模不超过上限时附带稠密矩阵"""
+    n = matrix.shape[0]
+    return {
+        'matrix': matrix.toarray().tolist() if n <= dense_limit else None,
+        'node_labels': nodes,
+        'node_to_index': {node: i for i, node in enumerate(nodes)},
+        'size': n,
+        'nnz': int(matrix.nnz),
+        'format': 'csr'
+    }
+
+def save_sparse_adjacency(matrix: sparse.csr_matrix, output_file: str) -> str:
+    """将稀疏邻接矩阵保存为与JSON结果同名的.npz文件，返回文件路径"""
+    npz_file = str(Path(output_file).with_suffix('.npz'))
+    sparse.save_npz(npz_file, matrix)
+    return npz_file
+
+def extract_adjacency_matrix(respondents: List[Dict],
+                             dense_limit: int = DENSE_EXPORT_LIMIT) -> Dict:
+    """提取邻接矩阵（稀疏CSR表示）"""
+    sources, targets, weights = [], [], []
     for respondent in respondents:
         source = respondent.get('name', '')
-        if not source or source not in node_to_index:
+        if not source:
             continue
-            
-        source_idx = node_to_index[source]
-        
         for collab in respondent.get('collaborators', []):
             target = collab.get('name', '')
-            if not target or target not in node_to_index:
+            if not target:
                 continue
-                
-            target_idx = node_to_index[target]
-            
-            # 计算权重
-            frequency = collab.get('frequency', '')
-            weight_map = {
-                '每天': 1.0,
-                '每周': 0.8,
-                '每月': 0.6,
-                '每季度': 0.4,
-                '每年': 0.2,
-                '偶尔': 0.3
-            }
-            weight = weight_map.get(frequency, 0.5)
-            
-            # 填充矩阵（无向图）
-            matrix[source_idx][target_idx] = weight
-            matrix[target_idx][source_idx] = weight
-    
-    return {
-        'matrix': matrix,
-        'node_labels': nodes,
-        'node_to_index': node_to_index,
-        'size': n
-    }
+            sources.append(source)
+            targets.append(target)
+            weights.append(FREQUENCY_WEIGHTS.get(collab.get('frequency', ''), 0.5))
+
+    matrix, nodes = build_sparse_adjacency(sources, targets, weights)
+    adjacency = sparse_adjacency_summary(matrix, nodes, dense_limit)
+    adjacency['sparse'] = matrix
+    return adjacency
 
 def extract_node_attributes(respondents: List[Dict]) -> Dict:
     """提取节点属性"""
@@ -203,6 +230,8 @@ def main():
                        choices=['edgelist', 'adjacency', 'both'],
                        default='edgelist',
                        help='输出格式')
+    parser.add_argument('--dense-limit', type=int, default=DENSE_EXPORT_LIMIT,
+                       help=f'JSON中输出稠密邻接矩阵的最大节点数（默认{DENSE_EXPORT_LIMIT}）')
     
     args = parser.parse_args()
     
@@ -234,8 +263,10 @@ def main():
     result['node_attributes'] = node_attributes
     
     # 提取邻接矩阵（如果需要）
+    sparse_matrix = None
     if args.format in ['adjacency', 'both']:
-        adjacency = extract_adjacency_matrix(respondents)
+        adjacency = extract_adjacency_matrix(respondents, args.dense_limit)
+        sparse_matrix = adjacency.pop('sparse')
         result['adjacency_matrix'] = adjacency
     
     # 计算统计信息
@@ -267,6 +298,12 @@ def main():
     
     # 保存结果
     try:
+        if sparse_matrix is not None:
+            npz_file = save_sparse_adjacency(sparse_matrix, args.output)
+            # 记录相对于JSON文件的文件名，便于整体移动结果目录
+            result['adjacency_matrix']['sparse_file'] = Path(npz_file).name
+            summary['sparse_file'] = Path(npz_file).name
+
         with open(args.output, 'w', encoding='utf-8') as f:
             json.dump(output, f, ensure_ascii=False, indent=2)
         
@@ -277,6 +314,8 @@ def main():
         print(f"  - 边类型：{list(statistics['edge_types'].keys())}")
         print(f"  - 输出格式：{args.format}")
         print(f"  - 输出文件：{args.output}")
+        if sparse_matrix is not None:
+            print(f"  - 稀疏矩阵：{npz_file}")
         
     except Exception as e:
         print(f"错误：无法保存结果 - {e}", file=sys.stderr)
@@ -8,65 +8,65 @@ import argparse
 import json
 import sys
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Any
 
-def edgelist_to_adjacency(edges: List[Dict]) -> Dict:
-    """将边列表转换为邻接矩阵"""
-    # 收集所有节点
-    nodes = set()
-    for edge in edges:
-        nodes.add(edge.get('source', ''))
-        nodes.add(edge.get('target', ''))
-    nodes = [n for n in nodes if n]  # 移除空值
-    
-    # 创建节点映射
-    node_to_index = {node: i for i, node in enumerate(nodes)}
-    n = len(nodes)
-    
-    # 初始化矩阵
-    matrix = [[0.0 for _ in range(n)] for _ in range(n)]
-    
-    # 填充矩阵
+import numpy as np
+from scipy import sparse
+
+from extract_network_data import (
+    DENSE_EXPORT_LIMIT,
+    build_sparse_adjacency,
+    sparse_adjacency_summary,
+    save_sparse_adjacency
+)
+
+def edgelist_to_adjacency(edges: List[Dict],
+                          dense_limit: int = DENSE_EXPORT_LIMIT) -> Dict:
+    """将边列表转换为邻接矩阵（稀疏CSR表示）"""
+    sources, targets, weights = [], [], []
     for edge in edges:
         source = edge.get('source', '')
         target = edge.get('target', '')
-        weight = edge.get('weight', 1.0)
-        
-        if source in node_to_index and target in node_to_index:
-            i = node_to_index[source]
-            j = node_to_index[target]
-            
-            # 如果有多个边，使用最大权重
-            matrix[i][j] = max(matrix[i][j], weight)
-            matrix[j][i] = max(matrix[j][i], weight)  # 无向图
-    
-    return {
-        'matrix': matrix,
-        'node_labels': nodes,
-        'node_to_index': node_to_index,
-        'size': n,
-        'is_directed': False
-    }
+        if not source or not target:
+            continue
+        sources.append(source)
+        targets.append(target)
+        weights.append(edge.get('weight', 1.0))
+
+    # 如果有多个边，使用最大权重
+    matrix, nodes = build_sparse_adjacency(sources, targets, weights)
+    adjacency = sparse_adjacency_summary(matrix, nodes, dense_limit)
+    adjacency['is_directed'] = False
+    adjacency['sparse'] = matrix
+    return adjacency
+
+def load_adjacency_matrix(adjacency: Dict, base_dir: str = '.') -> sparse.csr_matrix:
+    """读取邻接矩阵，优先使用稠密矩阵，否则加载关联的.npz稀疏文件"""
+    if adjacency.get('sparse') is not None:
+        return sparse.csr_matrix(adjacency['sparse'])
+    if adjacency.get('matrix'):
+        return sparse.csr_matrix(np.asarray(adjacency['matrix'], dtype=np.float64))
+    if adjacency.get('sparse_file'):
+        return sparse.load_npz(str(Path(base_dir) / adjacency['sparse_file'])).tocsr()
+    return sparse.csr_matrix((0, 0))
 
-def adjacency_to_edgelist(adjacency: Dict) -> List[Dict]:
+def adjacency_to_edgelist(adjacency: Dict, base_dir: str = '.') -> List[Dict]:
     """将邻接矩阵转换为边列表"""
-    matrix = adjacency.get('matrix', [])
     node_labels = adjacency.get('node_labels', [])
-    n = len(matrix)
-    
+    # 只处理上三角，避免重复；稀疏矩阵只遍历非零元素
+    upper = sparse.triu(load_adjacency_matrix(adjacency, base_dir)).tocoo()
+    mask = upper.data > 0  # 只保留有连接的边
+
     edges = []
-    
-    for i in range(n):
-        for j in range(i, n):  # 只处理上三角，避免重复
-            weight = matrix[i][j]
-            if weight > 0:  # 只保留有连接的边
-                edge = {
-                    'source': node_labels[i],
-                    'target': node_labels[j],
-                    'weight': weight
-                }
-                edges.append(edge)
-    
+    for i, j, weight in zip(upper.row[mask], upper.col[mask], upper.data[mask]):
+        edge = {
+            'source': node_labels[i],
+            'target': node_labels[j],
+            'weight': float(weight)
+        }
+        edges.append(edge)
+
     return edges
 
 def edgelist_to_adjlist(edges: List[Dict]) -> Dict:
@@ -171,6 +171,8 @@ def main():
                        choices=['edgelist', 'adjacency', 'adjlist'],
                        required=True,
                        help='输出格式')
+    parser.add_argument('--dense-limit', type=int, default=DENSE_EXPORT_LIMIT,
+                       help=f'JSON中输出稠密邻接矩阵的最大节点数（默认{DENSE_EXPORT_LIMIT}）')
     
     args = parser.parse_args()
     
@@ -183,6 +185,7 @@ def main():
         sys.exit(1)
     
     start_time = datetime.now()
+    base_dir = str(Path(args.input).parent)
     
     # 验证输入格式
     if not validate_input_format(data, args.from_format):
@@ -215,7 +218,7 @@ def main():
     # 边列表 -> 其他格式
     if args.from_format == 'edgelist':
         if args.to_format == 'adjacency':
-            result = edgelist_to_adjacency(edges)
+            result = edgelist_to_adjacency(edges, args.dense_limit)
             result_type = 'adjacency_matrix'
         elif args.to_format == 'adjlist':
             result = edgelist_to_adjlist(edges)
@@ -227,10 +230,10 @@ def main():
     # 邻接矩阵 -> 其他格式
     elif args.from_format == 'adjacency':
         if args.to_format == 'edgelist':
-            result = adjacency_to_edgelist(adjacency)
+            result = adjacency_to_edgelist(adjacency, base_dir)
             result_type = 'edges'
         elif args.to_format == 'adjlist':
-            edges = adjacency_to_edgelist(adjacency)
+            edges = adjacency_to_edgelist(adjacency, base_dir)
             result = edgelist_to_adjlist(edges)
             result_type = 'adjacency_list'
         elif args.to_format == 'adjacency':
@@ -244,12 +247,25 @@ def main():
             result_type = 'edges'
         elif args.to_format == 'adjacency':
             edges = adjlist_to_edgelist(adjlist)
-            result = edgelist_to_adjacency(edges)
+            result = edgelist_to_adjacency(edges, args.dense_limit)
             result_type = 'adjacency_matrix'
         elif args.to_format == 'adjlist':
             result = adjlist
             result_type = 'adjacency_list'
     
+    # 邻接矩阵以.npz稀疏文件保存，JSON中仅保留摘要
+    npz_file = None
+    if result_type == 'adjacency_matrix':
+        sparse_matrix = result.pop('sparse', None)
+        if sparse_matrix is None:
+            sparse_matrix = load_adjacency_matrix(result, base_dir)
+        try:
+            npz_file = save_sparse_adjacency(sparse_matrix, args.output)
+        except Exception as e:
+            print(f"错误：无法保存稀疏矩阵 - {e}", file=sys.stderr)
+            sys.exit(1)
+        result = dict(result, sparse_file=Path(npz_file).name)
+    
     end_time = datetime.now()
     
     # 准备输出
@@ -257,6 +273,8 @@ def main():
         output_data = {
             'summary': {
                 'matrix_size': result.get('size', 0),
+                'nnz': result.get('nnz', 0),
+                'sparse_file': result['sparse_file'],
                 'from_format': args.from_format,
                 'to_format': args.to_format,
                 'processing_time': round((end_time - start_time).total_seconds(), 2)
@@ -319,6 +337,7 @@ def main():
         
         if result_type == 'adjacency_matrix':
             print(f"  - 矩阵大小：{result.get('size', 0)}×{result.get('size', 0)}")
+            print(f"  - 稀疏矩阵：{npz_file}")
         elif result_type == 'edges':
             print(f"  - 边数：{len(result)}")
         elif result_type == 'adjacency_list':
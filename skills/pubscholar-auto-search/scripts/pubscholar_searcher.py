@@ -8,15 +8,26 @@ PubScholar自动搜索脚本
 2. 精准搜索优先，结果不足5篇时智能扩展
 3. 提取文献元数据（标题、作者、期刊等）
 4. 支持结果导出（JSON/CSV/Excel）
+5. 浏览器常驻复用：多次搜索共享同一个Chromium实例与页面池，扩展关键词并行检索
+6. 事件驱动的页面就绪判断：等待搜索框/结果统计出现、网络空闲与DOM稳定，
+   不再固定等待，并记录每个步骤的耗时
+7. 本地全文索引：导出的结果增量写入，可离线检索
 """
 
 import asyncio
+import atexit
 import json
+import os
 import re
+import sys
+import threading
 import time
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Awaitable, Dict, List, Optional
+from urllib.parse import urljoin
 import csv
 
 try:
@@ -26,23 +37,173 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     print("警告: Playwright未安装，将使用模拟模式")
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+try:
+    from common.literature_index import get_literature_index
+except ImportError:
+    # 分词依赖（jieba）未安装时不建立本地全文索引
+    get_literature_index = None
+
+DEFAULT_BASE_URL = "https://pubscholar.cn/"
+# 可将搜索指向本地镜像或fixtures/site静态测试站点
+BASE_URL_ENV = "PUBSCHOLAR_BASE_URL"
+# 同时打开的页面数上限，与扩展策略数上限一致，扩展检索可在一轮内完成
+DEFAULT_MAX_PARALLEL_PAGES = 5
+
+SEARCH_BOX_SELECTOR = (
+    'textarea[placeholder*="发现你感兴趣的内容"], input[placeholder*="发现你感兴趣的内容"]'
+)
+# 结果统计（如"20/1234 条"）在结果列表渲染完成后出现，作为结果页就绪信号
+RESULTS_READY_SELECTOR = 'text=/\\d+\\/\\d+ 条/'
+# DOM在该时长内没有变化即认为渲染完成（毫秒）
+DOM_QUIET_MS = 150
+# 必需元素未在上限内出现时，退回等待网络空闲的时长（秒）
+NETWORK_IDLE_FALLBACK_SECONDS = 2.0
+# 保留的步骤耗时记录条数
+STEP_TIMING_HISTORY = 1000
+
+
+class AdaptiveDeadline:
+    """
+    自适应等待上限
+
+    等待上限取近期成功耗时最大值的factor倍（限制在[minimum, maximum]内）；
+    某次等待超时后上限翻倍，避免在网络变慢时反复提前放弃。
+    """
+
+    def __init__(
+        self,
+        initial: float = 10.0,
+        minimum: float = 2.0,
+        maximum: float = 30.0,
+        factor: float = 3.0,
+        window: int = 20
+    ):
+        """
+        初始化等待上限
+
+        Args:
+            initial: 尚无耗时记录时的上限（秒）
+            minimum: 上限的最小值（秒）
+            maximum: 上限的最大值（秒）
+            factor: 上限相对近期最大耗时的倍数
+            window: 参与计算的近期记录数
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.factor = factor
+        self._samples = deque(maxlen=window)
+        self._value = min(maximum, max(minimum, initial))
+
+    def current(self) -> float:
+        """当前等待上限（秒）"""
+        return self._value
+
+    def observe(self, seconds: float, timed_out: bool = False):
+        """
+        记录一次等待的结果并调整上限
+
+        Args:
+            seconds: 实际等待时长（秒）
+            timed_out: 是否因达到上限而放弃
+        """
+        if timed_out:
+            self._samples.clear()
+            self._value = min(self.maximum, self._value * 2)
+            return
+        self._samples.append(seconds)
+        self._value = min(self.maximum, max(self.minimum, self.factor * max(self._samples)))
+
+
+async def _first_signal(waiters: Dict[str, Awaitable], timeout: float) -> str:
+    """
+    并发等待多个就绪信号，返回最先成功的信号名
+
+    某个信号出错（如等待超时）不影响其余信号；全部失败或达到timeout时返回"deadline"。
+    返回前取消仍在等待的信号。
+    """
+    tasks = {asyncio.ensure_future(waiter): name for name, waiter in waiters.items()}
+    pending = set(tasks)
+    give_up_at = time.monotonic() + timeout
+    try:
+        while pending:
+            remaining = give_up_at - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if not task.cancelled() and task.exception() is None:
+                    return tasks[task]
+        return 'deadline'
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+# 监听DOM变化，连续quietMs毫秒无变化或达到maxMs时返回期间的变化次数
+_DOM_SETTLE_SCRIPT = """
+([quietMs, maxMs]) => new Promise(resolve => {
+    let mutations = 0;
+    let quietTimer = null;
+    let capTimer = null;
+    const finish = () => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(capTimer);
+        resolve(mutations);
+    };
+    const observer = new MutationObserver(records => {
+        mutations += records.length;
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(finish, quietMs);
+    });
+    observer.observe(document.documentElement,
+                     {childList: true, subtree: true, characterData: true, attributes: true});
+    quietTimer = setTimeout(finish, quietMs);
+    capTimer = setTimeout(finish, maxMs);
+})
+"""
+
 
 class PubScholarSearcher:
     """PubScholar自动搜索器"""
 
-    def __init__(self, debug: bool = False, headless: bool = True):
+    def __init__(
+        self,
+        debug: bool = False,
+        headless: bool = True,
+        base_url: Optional[str] = None,
+        max_parallel_pages: int = DEFAULT_MAX_PARALLEL_PAGES,
+        index_path: Optional[str] = None
+    ):
         """
         初始化搜索器
 
         Args:
             debug: 是否启用调试模式
             headless: 是否使用无头浏览器（不显示GUI）
+            base_url: 平台首页地址，None时读取PUBSCHOLAR_BASE_URL环境变量，默认https://pubscholar.cn/
+            max_parallel_pages: 页面池大小，即同时执行的搜索数上限
+            index_path: 本地全文索引路径，None时读取SSCI_LITERATURE_INDEX环境变量，
+                两者都未提供时不建立索引
         """
         self.debug = debug
         self.headless = headless
-        self.base_url = "https://pubscholar.cn/"
+        self.base_url = base_url or os.environ.get(BASE_URL_ENV) or DEFAULT_BASE_URL
+        self.max_parallel_pages = max(1, max_parallel_pages)
+        self.playwright = None
         self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
+        self._idle_pages: List['Page'] = []
+        self._page_slots: Optional[asyncio.Semaphore] = None
+        # 浏览器启动锁，在事件循环中首次使用时创建
+        self._startup_lock: Optional[asyncio.Lock] = None
+        # 各等待步骤的自适应上限，以及每个步骤的耗时记录
+        self.deadlines = {'homepage': AdaptiveDeadline(), 'results': AdaptiveDeadline()}
+        self.step_timings = deque(maxlen=STEP_TIMING_HISTORY)
+        self.index = get_literature_index(index_path) if get_literature_index else None
 
     async def __aenter__(self):
         """异步上下文管理器入口"""
@@ -56,30 +217,72 @@ class PubScholarSearcher:
             await self.close_browser()
 
     async def start_browser(self):
-        """启动浏览器"""
+        """启动浏览器（已启动时直接返回，页面在首次使用时按需创建）"""
         if not PLAYWRIGHT_AVAILABLE:
             print("Playwright未安装，使用模拟模式")
             return
+        if self.browser is not None:
+            return
 
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            args=['--no-sandbox', '--disable-setuid-sandbox'] if self.headless else []
-        )
-        self.page = await self.browser.new_page()
+        # 并发的首次搜索在启动期间都会通过上面的检查，加锁后再检查一次，只启动一个浏览器
+        if self._startup_lock is None:
+            self._startup_lock = asyncio.Lock()
+        async with self._startup_lock:
+            if self.browser is not None:
+                return
+            if self._page_slots is None:
+                self._page_slots = asyncio.Semaphore(self.max_parallel_pages)
+            playwright = await async_playwright().start()
+            try:
+                self.browser = await playwright.chromium.launch(
+                    headless=self.headless,
+                    args=['--no-sandbox', '--disable-setuid-sandbox'] if self.headless else []
+                )
+            except BaseException:
+                await playwright.stop()
+                raise
+            self.playwright = playwright
 
         if self.debug:
             print("✓ 浏览器已启动")
 
     async def close_browser(self):
-        """关闭浏览器"""
+        """关闭页面池与浏览器"""
+        for page in self._idle_pages:
+            await page.context.close()
+        self._idle_pages = []
         if self.browser:
             await self.browser.close()
-        if hasattr(self, 'playwright'):
+            self.browser = None
+        if self.playwright:
             await self.playwright.stop()
+            self.playwright = None
         if self.debug:
             print("✓ 浏览器已关闭")
 
+    @asynccontextmanager
+    async def _pooled_page(self):
+        """
+        从页面池借出一个页面，用完归还
+
+        每个页面属于独立的浏览器上下文，并行搜索之间互不共享会话状态；
+        池中没有空闲页面且未达上限时新建，达到上限时等待其他搜索归还。
+        出错的页面状态不确定，直接关闭不再复用。
+        """
+        await self.start_browser()
+        async with self._page_slots:
+            if self._idle_pages:
+                page = self._idle_pages.pop()
+            else:
+                context = await self.browser.new_context()
+                page = await context.new_page()
+            try:
+                yield page
+            except BaseException:
+                await page.context.close()
+                raise
+            self._idle_pages.append(page)
+
     async def search(
         self,
         keyword: str,
@@ -102,7 +305,7 @@ class PubScholarSearcher:
         if not PLAYWRIGHT_AVAILABLE:
             return self._mock_search(keyword)
 
-        await self._navigate_to_homepage()
+        await self.start_browser()
 
         # 第一阶段：精准搜索
         if self.debug:
@@ -139,17 +342,102 @@ class PubScholarSearcher:
 
         return results
 
-    async def _navigate_to_homepage(self):
-        """导航到首页"""
-        await self.page.goto(self.base_url, wait_until='domcontentloaded')
-        await self.page.wait_for_timeout(2000)  # 等待页面完全加载
+    @asynccontextmanager
+    async def _timed_step(self, keyword: str, step: str):
+        """
+        记录一个步骤的耗时
+
+        Args:
+            keyword: 所属搜索的关键词
+            step: 步骤名称
+
+        Returns:
+            步骤记录字典，可在步骤内写入signal等附加信息
+        """
+        record = {'keyword': keyword, 'step': step, 'signal': None}
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = time.perf_counter() - start
+            self.step_timings.append(record)
+            if self.debug:
+                signal = f" ({record['signal']})" if record['signal'] else ""
+                print(f"  ⏱ {step}: {record['seconds']:.3f}s{signal}")
+
+    async def _wait_until_ready(
+        self,
+        page: 'Page',
+        selector: str,
+        deadline_name: str,
+        settle: bool = False,
+        require_selector: bool = False
+    ) -> Dict:
+        """
+        等待页面就绪
+
+        同时等待目标元素出现与网络空闲，以先到者为准；settle为True时再等待DOM
+        停止变化。所有信号都未出现时在自适应上限处放弃，由后续步骤按页面现状处理。
+
+        require_selector为True时只以目标元素为就绪信号：提交检索后结果请求发出前
+        网络可能短暂空闲，此时先到的networkidle并不表示结果已渲染。目标元素在上限内
+        未出现时才退回等待网络空闲，并按超时调整上限。
+
+        Args:
+            page: 页面
+            selector: 就绪时应出现的元素选择器
+            deadline_name: 使用的等待上限（homepage/results）
+            settle: 是否等待DOM稳定
+            require_selector: 是否必须等到目标元素出现
+
+        Returns:
+            {"signal": 就绪信号, "mutations": 稳定前的DOM变化次数}
+        """
+        deadline = self.deadlines[deadline_name]
+        budget = deadline.current()
+        start = time.monotonic()
+        waiters = {'selector': page.wait_for_selector(selector, state='visible', timeout=budget * 1000)}
+        if not require_selector:
+            waiters['network_idle'] = page.wait_for_load_state('networkidle', timeout=budget * 1000)
+        signal = await _first_signal(waiters, budget)
+
+        if signal == 'deadline' and require_selector:
+            # 只用于决定是否按页面现状继续提取，不作为成功耗时记录
+            deadline.observe(time.monotonic() - start, timed_out=True)
+            fallback = await _first_signal({
+                'network_idle': page.wait_for_load_state(
+                    'networkidle', timeout=NETWORK_IDLE_FALLBACK_SECONDS * 1000
+                ),
+            }, NETWORK_IDLE_FALLBACK_SECONDS)
+            return {'signal': 'network_idle_fallback' if fallback != 'deadline' else 'deadline',
+                    'mutations': None}
+
+        mutations = None
+        remaining = budget - (time.monotonic() - start)
+        if settle and signal != 'deadline' and remaining > 0:
+            try:
+                mutations = await page.evaluate(_DOM_SETTLE_SCRIPT, [DOM_QUIET_MS, remaining * 1000])
+            except Exception as e:
+                # 页面在等待期间跳转会销毁执行上下文，此时按已就绪处理
+                if self.debug:
+                    print(f"⚠ 等待DOM稳定失败: {e}")
+
+        deadline.observe(time.monotonic() - start, timed_out=signal == 'deadline')
+        return {'signal': signal, 'mutations': mutations}
+
+    async def _navigate_to_homepage(self, page: 'Page', keyword: str = ''):
+        """导航到首页并等待搜索框出现"""
+        async with self._timed_step(keyword, 'navigate'):
+            await page.goto(self.base_url, wait_until='domcontentloaded')
+        async with self._timed_step(keyword, 'homepage_ready') as step:
+            step.update(await self._wait_until_ready(page, SEARCH_BOX_SELECTOR, 'homepage'))
 
         if self.debug:
             print("✓ 已导航到PubScholar首页")
 
     async def _execute_search(self, keyword: str) -> List[Dict]:
         """
-        执行单次搜索
+        执行单次搜索（在页面池中借用一个页面）
 
         Args:
             keyword: 搜索关键词
@@ -157,31 +445,37 @@ class PubScholarSearcher:
         Returns:
             文献列表
         """
-        # 查找搜索框并输入关键词
-        search_box = self.page.locator('textarea[placeholder*="发现你感兴趣的内容"]').or_(
-            self.page.locator('input[placeholder*="发现你感兴趣的内容"]')
-        )
+        async with self._pooled_page() as page:
+            # 结果页同样有搜索框，每次都从首页开始，避免读到上一次的结果
+            await self._navigate_to_homepage(page, keyword)
 
-        await search_box.fill(keyword)
-        await self.page.wait_for_timeout(500)
+            async with self._timed_step(keyword, 'submit'):
+                # 查找搜索框并输入关键词（fill与click会自动等待元素可操作）
+                await page.locator(SEARCH_BOX_SELECTOR).first.fill(keyword)
 
-        # 点击搜索按钮
-        search_button = self.page.locator('button:has-text("检索")').first
-        await search_button.click()
+                # 点击搜索按钮
+                search_button = page.locator('button:has-text("检索")').first
+                await search_button.click()
 
-        # 等待结果页面加载
-        await self.page.wait_for_url("**/explore", timeout=10000)
-        await self.page.wait_for_timeout(3000)
+                # 等待跳转到结果页面
+                await page.wait_for_url("**/explore**", timeout=10000)
 
-        # 提取结果
-        results = await self._extract_results()
+            async with self._timed_step(keyword, 'results_ready') as step:
+                step.update(await self._wait_until_ready(
+                    page, RESULTS_READY_SELECTOR, 'results', settle=True, require_selector=True
+                ))
 
-        return results
+            # 提取结果
+            async with self._timed_step(keyword, 'extract'):
+                return await self._extract_results(page)
 
-    async def _extract_results(self) -> List[Dict]:
+    async def _extract_results(self, page: 'Page') -> List[Dict]:
         """
         从结果页面提取文献信息
 
+        Args:
+            page: 已加载结果的页面
+
         Returns:
             文献列表
         """
@@ -189,7 +483,7 @@ class PubScholarSearcher:
 
         try:
             # 等待结果列表加载
-            await self.page.wait_for_selector('text=/论文/', timeout=5000)
+            await page.wait_for_selector('text=/论文/', timeout=5000)
         except:
             if self.debug:
                 print("⚠ 未找到结果列表")
@@ -197,7 +491,7 @@ class PubScholarSearcher:
 
         # 获取结果数量
         try:
-            count_text = await self.page.locator('text=/\\d+\\/\\d+ 条').text_content()
+            count_text = await page.locator('text=/\\d+\\/\\d+ 条').text_content()
             if count_text:
                 match = re.search(r'(\d+)\s*/\s*(\d+)', count_text)
                 if match:
@@ -208,13 +502,13 @@ class PubScholarSearcher:
             pass
 
         # 提取每篇文献的信息
-        paper_items = await self.page.locator('generic').all()
+        paper_items = await page.locator('generic').all()
         if self.debug:
             print(f"✓ 找到 {len(paper_items)} 个文献条目")
 
         for i, item in enumerate(paper_items[:50]):  # 最多提取前50篇
             try:
-                paper = await self._extract_paper_info(item, i + 1)
+                paper = await self._extract_paper_info(item, len(papers) + 1, page.url)
                 if paper and paper.get('title'):
                     papers.append(paper)
             except Exception as e:
@@ -224,13 +518,14 @@ class PubScholarSearcher:
 
         return papers
 
-    async def _extract_paper_info(self, item, index: int) -> Optional[Dict]:
+    async def _extract_paper_info(self, item, index: int, page_url: str = DEFAULT_BASE_URL) -> Optional[Dict]:
         """
         从单个条目提取文献信息
 
         Args:
             item: 页面元素
             index: 文献序号
+            page_url: 结果页地址，用于补全相对链接
 
         Returns:
             文献信息字典
@@ -290,7 +585,7 @@ class PubScholarSearcher:
             if await link_elem.count() > 0:
                 paper['url'] = await link_elem.get_attribute('href')
                 if paper['url'] and not paper['url'].startswith('http'):
-                    paper['url'] = 'https://pubscholar.cn' + paper['url']
+                    paper['url'] = urljoin(page_url, paper['url'])
 
         except Exception as e:
             if self.debug:
@@ -298,6 +593,31 @@ class PubScholarSearcher:
 
         return paper if paper['title'] else None
 
+    def timing_summary(self) -> Dict[str, Dict]:
+        """
+        汇总各步骤的耗时
+
+        Returns:
+            {步骤名: {"count", "mean", "max", "total", "deadline_hits"}}，
+            等待步骤另含当前的等待上限"deadline"
+        """
+        summary = {}
+        for record in list(self.step_timings):
+            stats = summary.setdefault(record['step'], {
+                'count': 0, 'mean': 0.0, 'max': 0.0, 'total': 0.0, 'deadline_hits': 0
+            })
+            stats['count'] += 1
+            stats['total'] += record['seconds']
+            stats['max'] = max(stats['max'], record['seconds'])
+            if record['signal'] == 'deadline':
+                stats['deadline_hits'] += 1
+        for stats in summary.values():
+            stats['mean'] = stats['total'] / stats['count']
+        for step, deadline_name in (('homepage_ready', 'homepage'), ('results_ready', 'results')):
+            if step in summary:
+                summary[step]['deadline'] = self.deadlines[deadline_name].current()
+        return summary
+
     def _parse_journal_info(self, journal_text: str) -> Dict:
         """
         解析期刊信息字符串
@@ -340,27 +660,40 @@ class PubScholarSearcher:
         """
         智能扩展搜索
 
+        扩展关键词按页面池大小分轮并行检索，每轮结束后检查是否已达到目标；
+        并发数受页面池限制，不再在每个关键词之间固定等待。
+
         Args:
             original_keyword: 原始关键词
             current_results: 当前结果数
             target: 目标结果数
 
         Returns:
-            扩展搜索的文献列表
+            扩展搜索的文献列表（按扩展策略顺序排列）
         """
         expansion_strategies = self._generate_expansion_strategies(original_keyword)
         all_results = []
+        wave_size = self.max_parallel_pages
 
-        for i, strategy in enumerate(expansion_strategies, 1):
+        for wave_start in range(0, len(expansion_strategies), wave_size):
+            wave = expansion_strategies[wave_start:wave_start + wave_size]
             if self.debug:
-                print(f"\n  [扩展策略{i}] 搜索: '{strategy}'")
+                for i, strategy in enumerate(wave, wave_start + 1):
+                    print(f"\n  [扩展策略{i}] 搜索: '{strategy}'")
 
-            results = await self._execute_search(strategy)
-
-            if self.debug:
-                print(f"  → 返回 {len(results)} 篇")
+            wave_results = await asyncio.gather(
+                *(self._execute_search(strategy) for strategy in wave),
+                return_exceptions=True
+            )
 
-            all_results.extend(results)
+            for strategy, results in zip(wave, wave_results):
+                if isinstance(results, Exception):
+                    if self.debug:
+                        print(f"  ⚠ '{strategy}' 搜索失败: {results}")
+                    continue
+                if self.debug:
+                    print(f"  → '{strategy}' 返回 {len(results)} 篇")
+                all_results.extend(results)
 
             # 如果累计结果达到目标，停止扩展
             if current_results + len(all_results) >= target:
@@ -368,9 +701,6 @@ class PubScholarSearcher:
                     print(f"  ✓ 已达到目标结果数")
                 break
 
-            # 避免请求过快
-            await asyncio.sleep(2)
-
         return all_results
 
     def _generate_expansion_strategies(self, keyword: str) -> List[str]:
@@ -480,11 +810,20 @@ class PubScholarSearcher:
 
         return mock_papers
 
+    def _index_results(self, results: List[Dict]):
+        """将结果增量写入本地全文索引（未配置索引时跳过）"""
+        if self.index is None or not results:
+            return
+        counts = self.index.add_papers(results, 'pubscholar')
+        if self.debug:
+            print(f"✓ 全文索引: 新增 {counts['added']}，更新 {counts['updated']}")
+
     def export_to_json(self, results: List[Dict], filename: str):
         """导出结果为JSON"""
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(results, f, ensure_ascii=False, indent=2)
         print(f"✓ 结果已导出到 {filename}")
+        self._index_results(results)
 
     def export_to_csv(self, results: List[Dict], filename: str):
         """导出结果为CSV"""
@@ -506,6 +845,7 @@ class PubScholarSearcher:
                 writer.writerow(row)
 
         print(f"✓ 结果已导出到 {filename}")
+        self._index_results(results)
 
     def generate_citations(self, results: List[Dict]) -> List[str]:
         """
@@ -556,6 +896,10 @@ async def main():
 
         results = await searcher.search(keyword)
 
+        print(f"\n=== 步骤耗时 ===")
+        for step, stats in searcher.timing_summary().items():
+            print(f"{step:<16} 次数 {stats['count']:>3}  平均 {stats['mean']:.3f}s  最大 {stats['max']:.3f}s")
+
         print(f"\n=== 搜索结果 ===")
         print(f"共找到 {len(results)} 篇文献\n")
 
@@ -573,20 +917,68 @@ async def main():
 
 
 class SynchronousPubScholarSearcher:
-    """同步接口包装器（便于非async环境使用）"""
+    """
+    同步接口包装器（便于非async环境使用）
+
+    内部在后台线程中运行一个常驻事件循环，浏览器与页面池在首次搜索时启动，
+    之后的搜索直接复用，直到调用close()。可在多个线程中并发调用search()。
+    """
+
+    def __init__(
+        self,
+        debug: bool = False,
+        headless: bool = True,
+        base_url: Optional[str] = None,
+        max_parallel_pages: int = DEFAULT_MAX_PARALLEL_PAGES,
+        index_path: Optional[str] = None
+    ):
+        self.async_searcher = PubScholarSearcher(
+            debug=debug, headless=headless, base_url=base_url,
+            max_parallel_pages=max_parallel_pages, index_path=index_path
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
 
-    def __init__(self, debug: bool = False, headless: bool = True):
-        self.async_searcher = PubScholarSearcher(debug=debug, headless=headless)
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _run(self, coro):
+        """在常驻事件循环中执行协程并等待结果"""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name='pubscholar-loop', daemon=True
+                )
+                self._thread.start()
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
 
     def search(self, keyword: str, **kwargs) -> List[Dict]:
         """同步搜索方法"""
-        try:
-            loop = asyncio.get_event_loop()
-        except:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        return self._run(self.async_searcher.search(keyword, **kwargs))
 
-        return loop.run_until_complete(self.async_searcher.search(keyword, **kwargs))
+    def close(self):
+        """关闭浏览器并停止后台事件循环"""
+        if self._loop is None:
+            return
+        try:
+            self._run(self.async_searcher.close_browser())
+        finally:
+            with self._lock:
+                loop, thread = self._loop, self._thread
+                self._loop = self._thread = None
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def timing_summary(self) -> Dict[str, Dict]:
+        """各步骤耗时汇总"""
+        return self.async_searcher.timing_summary()
 
     def export_to_json(self, results: List[Dict], filename: str):
         """导出JSON"""
@@ -597,6 +989,28 @@ class SynchronousPubScholarSearcher:
         self.async_searcher.export_to_csv(results, filename)
 
 
+_shared_searcher: Optional[SynchronousPubScholarSearcher] = None
+_shared_searcher_lock = threading.Lock()
+
+
+def get_shared_searcher(debug: bool = False) -> SynchronousPubScholarSearcher:
+    """
+    获取进程内共享的同步搜索器，重复搜索复用同一个浏览器，进程退出时自动关闭
+
+    Args:
+        debug: 是否启用调试模式（仅在首次创建时生效）
+
+    Returns:
+        同步搜索器
+    """
+    global _shared_searcher
+    with _shared_searcher_lock:
+        if _shared_searcher is None:
+            _shared_searcher = SynchronousPubScholarSearcher(debug=debug)
+            atexit.register(_shared_searcher.close)
+        return _shared_searcher
+
+
 if __name__ == "__main__":
     # 运行测试
     asyncio.run(main())
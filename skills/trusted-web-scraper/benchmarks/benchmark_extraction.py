@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+HTML提取后端基准测试
+
+对fixtures目录中保存的网页分别使用各解析后端提取内容，比较耗时并校验
+各后端结果与BeautifulSoup解析结果是否一致。--scale可将页面正文重复多次，
+模拟大型响应；流式后端同时按块输入测试增量解析。
+
+示例：python benchmark_extraction.py --scale 50 --repeat 5
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'modules'))
+from core_trusted_scraper import parse_content
+from html_extraction import StreamingHTMLExtractor, available_backends
+
+CONTENT_TYPES = ['text', 'tables', 'images', 'documents', 'all']
+DATA_FIELDS = ['title', 'meta_description', 'links']
+
+
+def load_fixtures(fixtures_dir: str, scale: int):
+    """读取网页样本，scale大于1时将<body>内容重复scale次"""
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(fixtures_dir, '*.html'))):
+        with open(path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        if scale > 1:
+            start = html.find('<body>') + len('<body>')
+            end = html.rfind('</body>')
+            html = html[:start] + html[start:end] * scale + html[end:]
+        fixtures[os.path.basename(path)] = html
+    return fixtures
+
+
+def run_backend(html: str, content_type: str, backend: str, chunk_size: int = 0):
+    if chunk_size and backend != 'bs4':
+        extractor = StreamingHTMLExtractor(content_type, DATA_FIELDS, backend)
+        for start in range(0, len(html), chunk_size):
+            extractor.feed(html[start:start + chunk_size])
+        return extractor.close()
+    return parse_content(html, content_type, DATA_FIELDS, backend=backend)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML提取后端基准测试')
+    parser.add_argument('--fixtures', default=os.path.join(os.path.dirname(__file__), 'fixtures'),
+                        help='网页样本目录')
+    parser.add_argument('--scale', type=int, default=20, help='页面正文重复次数（默认20）')
+    parser.add_argument('--repeat', type=int, default=3, help='每个后端的重复次数，取最短耗时（默认3）')
+    parser.add_argument('--chunk-size', type=int, default=64 * 1024,
+                        help='流式后端的分块大小（字符数，0表示整篇输入）')
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures, args.scale)
+    if not fixtures:
+        print(f"错误：{args.fixtures} 中没有HTML样本", file=sys.stderr)
+        sys.exit(1)
+
+    backends = ['bs4'] + available_backends()
+    total_chars = sum(len(html) for html in fixtures.values())
+    print(f"样本数: {len(fixtures)}，总字符数: {total_chars}，内容类型: {', '.join(CONTENT_TYPES)}")
+
+    timings = {}
+    mismatches = {backend: 0 for backend in backends}
+    for backend in backends:
+        best = float('inf')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for html in fixtures.values():
+                for content_type in CONTENT_TYPES:
+                    run_backend(html, content_type, backend, args.chunk_size)
+            best = min(best, time.perf_counter() - start)
+        timings[backend] = best
+
+        if backend != 'bs4':
+            for html in fixtures.values():
+                for content_type in CONTENT_TYPES:
+                    expected = parse_content(html, content_type, DATA_FIELDS, backend='bs4')
+                    if run_backend(html, content_type, backend, args.chunk_size) != expected:
+                        mismatches[backend] += 1
+
+    baseline = timings['bs4']
+    print(f"{'后端':<14}{'耗时(秒)':>10}{'加速比':>8}{'MB/s':>8}{'结果不一致':>10}")
+    for backend in backends:
+        seconds = timings[backend]
+        throughput = total_chars * len(CONTENT_TYPES) / seconds / 1e6
+        print(f"{backend:<14}{seconds:>10.3f}{baseline / seconds:>8.2f}{throughput:>8.2f}{mismatches[backend]:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,22 +3,46 @@
 此模块提供从可信网站（企业官网、教育网、政务网）收集信息的功能
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Iterator
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import json
+import os
+import copy
+import sqlite3
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from urllib.parse import urlparse
 from datetime import datetime
 import ssl
 import socket
 
+from html_extraction import (
+    StreamingHTMLExtractor, declared_charset, extract_html, iter_decoded, select_backend
+)
+from http_cache import HTTPResponseCache, get_http_cache
 
-def trusted_web_scraper(data: Dict[str, Any]) -> Dict[str, Any]:
+# 流式下载时每次读取的字节数
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def trusted_web_scraper(
+    data: Dict[str, Any],
+    session: Optional[requests.Session] = None,
+    throttle: Optional[Callable[[], Any]] = None,
+    trust_verifier: Optional[Callable[[str, str], Dict[str, Any]]] = None
+) -> Dict[str, Any]:
     """
     执行可信网站爬虫任务
     
     Args:
         data: 包含爬取任务信息的字典
+        session: 复用连接的HTTP会话，None时每次请求单独建立连接
+        throttle: 每次发出请求前调用的限速函数
+        trust_verifier: 可信度验证函数，签名与verify_website_trustworthiness相同，
+            None时使用按域名缓存的get_trust_cache(cache_dir).verify
     
     Returns:
         包含爬取结果的字典
@@ -31,9 +55,13 @@ def trusted_web_scraper(data: Dict[str, Any]) -> Dict[str, Any]:
     timeout = data.get('timeout', 30)
     retry_attempts = data.get('retry_attempts', 3)
     output_format = data.get('output_format', 'json')
+    parser_backend = data.get('parser_backend')
+    cache_dir = data.get('cache_dir') or os.environ.get(TRUST_CACHE_DIR_ENV)
+    http_cache = get_http_cache(os.path.join(cache_dir, 'http')) if cache_dir else None
     
     # 验证网站可信度
-    trust_verification = verify_website_trustworthiness(url, verification_level)
+    verifier = trust_verifier or get_trust_cache(cache_dir).verify
+    trust_verification = verifier(url, verification_level)
     
     if not trust_verification['is_trusted']:
         return {
@@ -47,7 +75,8 @@ def trusted_web_scraper(data: Dict[str, Any]) -> Dict[str, Any]:
     # 执行信息提取
     extraction_results = extract_information(
         url, content_type, data_fields, crawl_strategy, 
-        timeout, retry_attempts
+        timeout, retry_attempts, session=session, throttle=throttle,
+        parser_backend=parser_backend, http_cache=http_cache
     )
     
     # 数据处理和清洗
@@ -67,11 +96,212 @@ def trusted_web_scraper(data: Dict[str, Any]) -> Dict[str, Any]:
             "status_code": extraction_results.get('status_code', 'N/A'),
             "trust_level": trust_verification['trust_level'],
             "content_extracted": len(extraction_results.get('extracted_data', [])),
-            "processing_time": extraction_results.get('processing_time', 0)
+            "processing_time": extraction_results.get('processing_time', 0),
+            "http_cache": {
+                "status": extraction_results.get('cache_status', 'bypass'),
+                "bytes_saved": extraction_results.get('bytes_saved', 0)
+            }
         }
     }
 
 
+class TokenBucket:
+    """
+    令牌桶限速器（线程安全）
+
+    令牌按rate_per_minute的速率补充，桶中最多积累capacity个令牌；
+    令牌不足时预支令牌并在锁外等待，多个线程按取令牌的先后顺序依次放行。
+
+    Args:
+        rate_per_minute: 每分钟允许的平均请求数
+        capacity: 允许的突发请求数
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: int = 1):
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute必须为正数")
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, int(capacity))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        取出一个令牌，令牌不足时阻塞等待
+
+        Returns:
+            等待的秒数
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+def create_pooled_session(pool_connections: int = 10, pool_maxsize: int = 10) -> requests.Session:
+    """
+    创建带连接池的HTTP会话，同一主机的请求复用keep-alive连接
+
+    Args:
+        pool_connections: 缓存连接池的主机数
+        pool_maxsize: 每个主机连接池的最大连接数
+
+    Returns:
+        HTTP会话
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def iter_trusted_web_scraper(
+    data: Dict[str, Any],
+    session: Optional[requests.Session] = None,
+    trust_verifier: Optional[Callable[[str, str], Dict[str, Any]]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    批量爬取多个URL，按完成先后逐个产出处理结果
+
+    所有请求共享一个带连接池的会话；每个域名同时进行的任务数不超过
+    per_domain_concurrency，并由该域名的令牌桶按rate_limit（每分钟请求数，
+    含重试）限速，不同域名之间并行爬取。
+
+    Args:
+        data: 与trusted_web_scraper相同的任务字典，另含：
+            urls: 目标URL列表（重复的URL只爬取一次）
+            max_workers: 工作线程数，默认8
+            per_domain_concurrency: 每个域名的并发上限，默认2
+            burst: 每个域名令牌桶的突发请求数，默认1
+        session: 复用的HTTP会话，None时内部创建并在结束后关闭
+        trust_verifier: 可信度验证函数，None时使用按域名缓存的验证；各域名的
+            首个任务并行执行验证，同一域名的后续任务直接读取缓存
+
+    Returns:
+        逐个产出各URL的爬取结果，结果中batch_index为该URL在输入列表中的位置
+    """
+    urls = list(dict.fromkeys(url for url in data.get('urls', []) if url))
+    max_workers = max(1, int(data.get('max_workers', 8)))
+    per_domain = max(1, int(data.get('per_domain_concurrency', 2)))
+    rate_limit = data.get('rate_limit', 10)
+    burst = data.get('burst', 1)
+
+    # 按域名排队，某域名有空闲并发名额时才提交其下一个任务
+    queues: Dict[str, deque] = {}
+    for index, url in enumerate(urls):
+        queues.setdefault(urlparse(url).netloc, deque()).append((index, url))
+    if not queues:
+        return
+    buckets = {
+        domain: TokenBucket(rate_limit, burst) if rate_limit and rate_limit > 0 else None
+        for domain in queues
+    }
+    active = {domain: 0 for domain in queues}
+
+    own_session = session is None
+    if own_session:
+        session = create_pooled_session(max(10, len(queues)), per_domain)
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='trusted-scraper')
+    running = {}
+
+    def dispatch(domain: str):
+        queue = queues[domain]
+        bucket = buckets[domain]
+        while queue and active[domain] < per_domain:
+            index, url = queue.popleft()
+            active[domain] += 1
+            future = executor.submit(
+                _scrape_batch_item, dict(data, url=url), session,
+                bucket.acquire if bucket is not None else None, trust_verifier
+            )
+            running[future] = (domain, index)
+
+    try:
+        for domain in queues:
+            dispatch(domain)
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                domain, index = running.pop(future)
+                active[domain] -= 1
+                dispatch(domain)
+                result = future.result()
+                result['batch_index'] = index
+                yield result
+    finally:
+        # 调用方提前停止迭代时取消尚未开始的任务
+        for future in running:
+            future.cancel()
+        executor.shutdown(wait=True)
+        if own_session:
+            session.close()
+
+
+def trusted_web_scraper_batch(
+    data: Dict[str, Any],
+    session: Optional[requests.Session] = None,
+    trust_verifier: Optional[Callable[[str, str], Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    批量爬取多个URL并汇总结果
+
+    Args:
+        data: 任务字典，参数同iter_trusted_web_scraper
+        session: 复用的HTTP会话
+        trust_verifier: 可信度验证函数
+
+    Returns:
+        按输入顺序排列的各URL结果及批量汇总
+    """
+    start_time = time.time()
+    results = sorted(
+        iter_trusted_web_scraper(data, session=session, trust_verifier=trust_verifier),
+        key=lambda result: result['batch_index']
+    )
+    failed = [result['summary']['url'] for result in results if 'error' in result]
+    cache_statuses = [result['summary'].get('http_cache', {}) for result in results]
+    return {
+        "results": results,
+        "summary": {
+            "total_urls": len(results),
+            "succeeded": len(results) - len(failed),
+            "failed": len(failed),
+            "failed_urls": failed,
+            "domains": len({urlparse(result['summary']['url']).netloc for result in results}),
+            "processing_time": time.time() - start_time,
+            "trust_cache": get_trust_cache(data.get('cache_dir')).cache_info() if trust_verifier is None else None,
+            "http_cache": {
+                "hits": sum(1 for status in cache_statuses if status.get('status') == 'hit'),
+                "misses": sum(1 for status in cache_statuses if status.get('status') == 'miss'),
+                "bytes_saved": sum(status.get('bytes_saved', 0) for status in cache_statuses)
+            }
+        }
+    }
+
+
+def _scrape_batch_item(
+    data: Dict[str, Any],
+    session: requests.Session,
+    throttle: Optional[Callable[[], Any]],
+    trust_verifier: Optional[Callable[[str, str], Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """在工作线程中爬取单个URL，异常转换为错误结果以免中断整个批次"""
+    url = data['url']
+    try:
+        result = trusted_web_scraper(data, session=session, throttle=throttle, trust_verifier=trust_verifier)
+    except Exception as e:
+        result = {"error": f"Scraping failed: {e}"}
+    result.setdefault('summary', {"url": url, "status_code": 'N/A'})
+    return result
+
+
 def verify_website_trustworthiness(url: str, verification_level: str = 'standard') -> Dict[str, Any]:
     """
     验证网站的可信度
@@ -113,6 +343,220 @@ def verify_website_trustworthiness(url: str, verification_level: str = 'standard
     }
 
 
+# 可信度验证缓存目录的环境变量，未设置时仅使用内存缓存
+TRUST_CACHE_DIR_ENV = 'TRUSTED_SCRAPER_CACHE_DIR'
+
+
+class _TrustStore:
+    """基于SQLite的可信度验证结果持久化存储"""
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS trust ('
+            'domain TEXT NOT NULL, level TEXT NOT NULL, payload TEXT NOT NULL, '
+            'expires_at REAL NOT NULL, PRIMARY KEY (domain, level))'
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get(self, domain: str, level: str) -> Optional[tuple]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT payload, expires_at FROM trust WHERE domain = ? AND level = ?', (domain, level)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def put(self, domain: str, level: str, payload: Dict[str, Any], expires_at: float):
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO trust VALUES (?, ?, ?, ?)',
+                (domain, level, json.dumps(payload, ensure_ascii=False, default=str), expires_at)
+            )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute('DELETE FROM trust')
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class TrustVerificationCache:
+    """
+    按域名缓存的可信度验证
+
+    验证结果以(域名, 验证级别)为键缓存，可信结果保存ttl秒；不可信或验证
+    出错的结果按negative_ttl缓存，避免对失败域名反复发起TLS与WHOIS检查。
+    同一域名的并发验证只执行一次，其余调用等待并复用该结果。
+
+    Args:
+        ttl: 可信结果的有效期（秒）
+        negative_ttl: 不可信或验证失败结果的有效期（秒）
+        cache_path: SQLite持久化文件路径，None表示仅使用内存缓存
+        verifier: 实际执行验证的函数，默认verify_website_trustworthiness
+    """
+
+    def __init__(
+        self,
+        ttl: float = 86400.0,
+        negative_ttl: float = 3600.0,
+        cache_path: Optional[str] = None,
+        verifier: Optional[Callable[[str, str], Dict[str, Any]]] = None
+    ):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._verifier = verifier or verify_website_trustworthiness
+        self._memory: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[tuple, threading.Lock] = {}
+        self._store = _TrustStore(cache_path) if cache_path else None
+        self._stats = {'memory_hits': 0, 'store_hits': 0, 'misses': 0, 'negative_hits': 0}
+
+    def verify(self, url: str, verification_level: str = 'standard') -> Dict[str, Any]:
+        """
+        验证URL所在域名的可信度，签名与verify_website_trustworthiness相同
+
+        Args:
+            url: 要验证的URL
+            verification_level: 验证级别
+
+        Returns:
+            验证结果（url字段为本次传入的URL）
+        """
+        key = (urlparse(url).netloc, verification_level)
+        payload = self._lookup(key)
+        if payload is None:
+            with self._lock:
+                key_lock = self._key_locks.setdefault(key, threading.Lock())
+            with key_lock:
+                # 等待期间其他线程可能已完成同一域名的验证
+                payload = self._lookup(key)
+                if payload is None:
+                    payload = self._verify_uncached(url, key)
+        result = copy.deepcopy(payload)
+        result['url'] = url
+        return result
+
+    def verify_many(
+        self,
+        urls: List[str],
+        verification_level: str = 'standard',
+        max_workers: int = 8
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        并行验证多个URL涉及的全部域名，每个域名只验证一次
+
+        Args:
+            urls: URL列表
+            verification_level: 验证级别
+            max_workers: 并行验证的线程数
+
+        Returns:
+            域名到验证结果的映射
+        """
+        first_urls: Dict[str, str] = {}
+        for url in urls:
+            first_urls.setdefault(urlparse(url).netloc, url)
+        if not first_urls:
+            return {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(first_urls)))) as executor:
+            results = executor.map(lambda url: self.verify(url, verification_level), first_urls.values())
+            return dict(zip(first_urls, results))
+
+    def cache_info(self) -> Dict[str, int]:
+        """返回缓存命中统计"""
+        with self._lock:
+            return dict(self._stats, memory_size=len(self._memory))
+
+    def clear(self):
+        """清空内存缓存与持久化存储"""
+        with self._lock:
+            self._memory.clear()
+        if self._store is not None:
+            self._store.clear()
+
+    def close(self):
+        """关闭持久化存储"""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def _lookup(self, key: tuple) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and entry[1] > now:
+                self._count_hit('memory_hits', entry[0])
+                return entry[0]
+        if self._store is not None:
+            entry = self._store.get(*key)
+            if entry is not None and entry[1] > now:
+                with self._lock:
+                    self._memory[key] = entry
+                    self._count_hit('store_hits', entry[0])
+                return entry[0]
+        return None
+
+    def _count_hit(self, kind: str, payload: Dict[str, Any]):
+        self._stats[kind] += 1
+        if not payload.get('is_trusted'):
+            self._stats['negative_hits'] += 1
+
+    def _verify_uncached(self, url: str, key: tuple) -> Dict[str, Any]:
+        try:
+            payload = self._verifier(url, key[1])
+        except Exception as e:
+            # 验证过程出错按不可信处理，并进行负缓存
+            payload = {
+                "url": url,
+                "domain": key[0],
+                "trust_score": 0.0,
+                "trust_level": "unknown",
+                "is_trusted": False,
+                "verification_error": str(e)
+            }
+        ttl = self.ttl if payload.get('is_trusted') else self.negative_ttl
+        payload = dict(payload, cached_at=datetime.now().isoformat())
+        entry = (payload, time.time() + ttl)
+        with self._lock:
+            self._memory[key] = entry
+            self._stats['misses'] += 1
+        if self._store is not None:
+            self._store.put(key[0], key[1], payload, entry[1])
+        return payload
+
+
+_trust_caches: Dict[Optional[str], TrustVerificationCache] = {}
+_trust_caches_lock = threading.Lock()
+
+
+def get_trust_cache(cache_dir: Optional[str] = None) -> TrustVerificationCache:
+    """
+    获取进程内共享的可信度验证缓存（每个持久化目录一个实例）
+
+    Args:
+        cache_dir: 持久化目录，验证结果保存在其中的trust_cache.sqlite3；
+            None时读取TRUSTED_SCRAPER_CACHE_DIR环境变量，仍未设置则仅使用内存缓存
+
+    Returns:
+        验证缓存
+    """
+    cache_dir = cache_dir or os.environ.get(TRUST_CACHE_DIR_ENV)
+    key = os.path.abspath(cache_dir) if cache_dir else None
+    with _trust_caches_lock:
+        if key not in _trust_caches:
+            cache_path = os.path.join(key, 'trust_cache.sqlite3') if key else None
+            _trust_caches[key] = TrustVerificationCache(cache_path=cache_path)
+        return _trust_caches[key]
+
+
 def check_ssl_certificate(domain: str) -> bool:
     """
     检查SSL证书的有效性
@@ -292,7 +736,11 @@ def extract_information(
     data_fields: List[str], 
     crawl_strategy: Dict[str, Any], 
     timeout: int, 
-    retry_attempts: int
+    retry_attempts: int,
+    session: Optional[requests.Session] = None,
+    throttle: Optional[Callable[[], Any]] = None,
+    parser_backend: Optional[str] = None,
+    http_cache: Optional[HTTPResponseCache] = None
 ) -> Dict[str, Any]:
     """
     从网站提取信息
@@ -304,6 +752,11 @@ def extract_information(
         crawl_strategy: 爬取策略
         timeout: 超时时间
         retry_attempts: 重试次数
+        session: 复用连接的HTTP会话，None时使用requests.get
+        throttle: 每次请求（含重试）前调用的限速函数
+        parser_backend: HTML解析后端（lxml、html.parser或bs4），None时自动选择；
+            流式后端在下载过程中逐块解析响应，不在内存中保留完整页面
+        http_cache: HTTP响应缓存，提供时发送条件请求，304响应直接读取缓存正文
     
     Returns:
         提取结果
@@ -313,16 +766,25 @@ def extract_information(
     headers = {
         'User-Agent': crawl_strategy.get('user_agent', 'TrustedWebScraper/1.0')
     }
+    cached_entry = http_cache.lookup(url) if http_cache is not None else None
+    if cached_entry is not None:
+        headers.update(cached_entry.conditional_headers())
     
     # 执行HTTP请求
+    http = session if session is not None else requests
     response = None
     for attempt in range(retry_attempts + 1):
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
-            if response.status_code == 200:
+            if throttle is not None:
+                throttle()
+            response = http.get(url, headers=headers, timeout=timeout, stream=True)
+            if response.status_code == 200 or (response.status_code == 304 and cached_entry is not None):
                 break
             else:
                 print(f"Attempt {attempt + 1}: Received status code {response.status_code}")
+                if attempt < retry_attempts:
+                    # 释放连接以便重试时复用
+                    response.close()
         except requests.RequestException as e:
             print(f"Attempt {attempt + 1}: Request failed with error: {e}")
             if attempt == retry_attempts:
@@ -336,9 +798,36 @@ def extract_information(
             "processing_time": time.time() - start_time
         }
     
-    # 这似解析HTML内容（在实际实现中，这里会使用BeautifulSoup或类似库）
-    content = response.text
-    extracted_data = parse_content(content, content_type, data_fields)
+    streaming_backend = select_backend(parser_backend) if parser_backend != 'bs4' else None
+    response_content_type = response.headers.get('Content-Type', '')
+    cache_status = 'bypass'
+    with response:
+        if response.status_code == 304 and cached_entry is not None:
+            # 页面未变化，正文取自缓存
+            chunks = http_cache.serve(cached_entry)
+            response_content_type = cached_entry.content_type
+            cache_status = 'hit'
+        else:
+            chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+            if http_cache is not None and response.status_code == 200:
+                chunks = http_cache.record(url, response.headers, chunks)
+                cache_status = 'miss'
+
+        if streaming_backend is not None:
+            # 边下载边解析，单遍提取全部所需内容
+            extractor = StreamingHTMLExtractor(content_type, data_fields, streaming_backend)
+            for text in iter_decoded(chunks, declared_charset(response_content_type)):
+                extractor.feed(text)
+            extracted_data = extractor.close()
+            content_length = extractor.characters_fed
+        else:
+            if cache_status == 'bypass':
+                content = response.text
+            else:
+                encoding = requests.utils.get_encoding_from_headers({'content-type': response_content_type})
+                content = b''.join(chunks).decode(encoding or 'utf-8', errors='replace')
+            extracted_data = parse_content(content, content_type, data_fields, backend='bs4')
+            content_length = len(content)
     
     processing_time = time.time() - start_time
     
@@ -346,15 +835,22 @@ def extract_information(
         "url": url,
         "status_code": response.status_code,
         "headers": dict(response.headers),
-        "content_type": response.headers.get('Content-Type', ''),
-        "content_length": len(content),
+        "content_type": response_content_type,
+        "content_length": content_length,
         "extracted_data": extracted_data,
         "processing_time": processing_time,
-        "crawl_strategy_used": crawl_strategy
+        "crawl_strategy_used": crawl_strategy,
+        "cache_status": cache_status,
+        "bytes_saved": cached_entry.size if cache_status == 'hit' else 0
     }
 
 
-def parse_content(content: str, content_type: str, data_fields: List[str]) -> List[Dict[str, Any]]:
+def parse_content(
+    content: str,
+    content_type: str,
+    data_fields: List[str],
+    backend: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """
     解析网页内容，优先使用功能更强的库，如果没有则使用内置方法
 
@@ -362,10 +858,16 @@ def parse_content(content: str, content_type: str, data_fields: List[str]) -> Li
         content: 网页内容
         content_type: 内容类型
         data_fields: 要提取的数据字段
+        backend: 解析后端（lxml、html.parser或bs4），None时安装了lxml则使用
+            单遍流式提取，否则使用BeautifulSoup，两者都不可用时使用正则表达式
 
     Returns:
         提取的数据列表
     """
+    streaming_backend = select_backend(backend) if backend != 'bs4' else None
+    if streaming_backend is not None:
+        return extract_html(content, content_type, data_fields, streaming_backend)
+
     # 尝试使用BeautifulSoup（如果可用）
     try:
         from bs4 import BeautifulSoup
@@ -0,0 +1,465 @@
+"""
+HTML流式提取模块
+此模块以事件驱动的方式单遍扫描HTML，一次遍历即可提取标题、段落、表格、图片、
+文档链接及指定的数据字段，无需先构建完整的文档树。解析后端可插拔：安装lxml时
+使用其libxml2解析器的target接口，否则可使用标准库html.parser；两者都支持分块
+输入，适合对通过iter_content流式下载的大型响应边下载边解析。
+"""
+
+import codecs
+import re
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# 流式解析后端
+STREAMING_BACKENDS = ('lxml', 'html.parser')
+
+# 没有结束标签的空元素
+VOID_ELEMENTS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link',
+    'menuitem', 'meta', 'param', 'source', 'track', 'wbr', 'basefont', 'bgsound',
+    'command', 'frame', 'image', 'isindex', 'nextid', 'spacer'
+])
+
+# 其中文本不计入页面正文的元素（与BeautifulSoup的get_text一致）
+SKIPPED_TEXT_ELEMENTS = frozenset(['script', 'style', 'template'])
+
+HEADING_TAGS = frozenset(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+DOCUMENT_EXTENSIONS = ('.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx')
+
+_HEADER_CHARSET_PATTERN = re.compile(r'charset=["\']?([A-Za-z0-9_\-]+)', re.IGNORECASE)
+_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset=["\']?\s*([A-Za-z0-9_\-]+)', re.IGNORECASE)
+
+
+def available_backends() -> List[str]:
+    """
+    当前环境可用的流式解析后端
+
+    Returns:
+        后端名称列表，按优先级排列
+    """
+    return [backend for backend in STREAMING_BACKENDS if backend != 'lxml' or LXML_AVAILABLE]
+
+
+def select_backend(preferred: Optional[str] = None) -> Optional[str]:
+    """
+    选择流式解析后端
+
+    Args:
+        preferred: 指定的后端名称，None时自动选择
+
+    Returns:
+        后端名称；未指定且lxml不可用时返回None，由调用方退回BeautifulSoup解析
+    """
+    if preferred:
+        if preferred not in available_backends():
+            raise ValueError(f"不可用的HTML解析后端: {preferred}")
+        return preferred
+    return 'lxml' if LXML_AVAILABLE else None
+
+
+class _ExtractionHandler:
+    """
+    接收解析事件并累积提取结果
+
+    连续的文本事件合并为一个文本节点，遇到标签或注释时整体去除首尾空白后
+    分发给当前打开的各个收集器，语义与BeautifulSoup的get_text(strip=True)一致。
+    """
+
+    def __init__(self, content_type: str, data_fields: List[str]):
+        self.content_type = content_type
+        self.data_fields = [field.lower() for field in data_fields]
+        fields = set(self.data_fields)
+
+        self.collect_text = content_type not in ('tables', 'images', 'documents')
+        self.collect_structure = content_type == 'text'
+        self.collect_tables = content_type == 'tables'
+        self.collect_images = content_type == 'images'
+        self.collect_documents = content_type == 'documents'
+        self.collect_title = 'title' in fields
+        self.collect_meta = 'meta_description' in fields
+        self.collect_links = 'links' in fields
+
+        self.text_parts: List[str] = []
+        self.headings: List[Dict[str, Any]] = []
+        self.paragraphs: List[Dict[str, Any]] = []
+        self.paragraph_count = 0
+        self.tables: List[List[List[List[str]]]] = []
+        self.images: List[Dict[str, Any]] = []
+        self.documents: List[Dict[str, Any]] = []
+        self.links: List[str] = []
+        self.title: Optional[str] = None
+        self.meta_description: Optional[str] = None
+
+        # 打开的元素栈，每项为(标签, 在该元素关闭时执行的收尾函数列表)
+        self._stack: List[tuple] = []
+        self._collectors: List[List[str]] = []
+        self._open_tables: List[List[List[List[str]]]] = []
+        self._open_rows: List[List[List[str]]] = []
+        self._skip_depth = 0
+        self._pending: List[str] = []
+        self._title_seen = False
+        # 已自动关闭的空元素，其后出现的一个同名结束标签直接忽略
+        self._closed_void: Dict[str, int] = {}
+
+    def start(self, tag: str, attrs: Dict[str, str]):
+        self._flush()
+        finalizers = []
+
+        if tag in SKIPPED_TEXT_ELEMENTS:
+            self._skip_depth += 1
+            finalizers.append(self._leave_skipped)
+
+        if self.collect_structure and (tag in HEADING_TAGS or tag == 'p'):
+            if tag == 'p':
+                entry = {"type": "paragraph", "index": self.paragraph_count}
+                self.paragraph_count += 1
+                self.paragraphs.append(entry)
+            else:
+                entry = {"type": f"title_{tag}"}
+                self.headings.append(entry)
+            finalizers.append(self._open_collector(entry))
+
+        if self.collect_tables:
+            if tag == 'table':
+                rows: List[List[List[str]]] = []
+                self.tables.append(rows)
+                self._open_tables.append(rows)
+                finalizers.append(self._open_tables.pop)
+            elif tag == 'tr':
+                row: List[List[str]] = []
+                for rows in self._open_tables:
+                    rows.append(row)
+                self._open_rows.append(row)
+                finalizers.append(self._open_rows.pop)
+            elif tag in ('td', 'th'):
+                cell: List[str] = []
+                for row in self._open_rows:
+                    row.append(cell)
+                finalizers.append(self._open_text(cell))
+
+        if tag == 'img' and self.collect_images:
+            self.images.append({
+                "type": "image",
+                "src": attrs.get('src', ''),
+                "alt": attrs.get('alt', ''),
+                "title": attrs.get('title', ''),
+                "index": len(self.images)
+            })
+        elif tag == 'a' and 'href' in attrs:
+            href = attrs['href']
+            if self.collect_links:
+                self.links.append(href)
+            if self.collect_documents and any(ext in href.lower() for ext in DOCUMENT_EXTENSIONS):
+                entry = {"url": href}
+                self.documents.append(entry)
+                finalizers.append(self._open_collector(entry, key='text', with_length=False))
+        elif tag == 'title' and self.collect_title and not self._title_seen:
+            self._title_seen = True
+            parts: List[str] = []
+            finalizers.append(self._open_text(parts, lambda: setattr(self, 'title', ''.join(parts))))
+        elif (tag == 'meta' and self.collect_meta and self.meta_description is None
+              and attrs.get('name') == 'description'):
+            self.meta_description = attrs.get('content', '')
+
+        if tag not in VOID_ELEMENTS:
+            self._stack.append((tag, finalizers))
+        else:
+            self._closed_void[tag] = self._closed_void.get(tag, 0) + 1
+            for finalize in reversed(finalizers):
+                finalize()
+
+    def end(self, tag: str):
+        if self._closed_void.get(tag):
+            # 空元素之后的同名结束标签（如<img ...></img>）不切分文本
+            self._closed_void[tag] -= 1
+            return
+        self._flush()
+        # 与BeautifulSoup相同：结束标签关闭最近的同名元素，没有对应元素时忽略
+        for position in range(len(self._stack) - 1, -1, -1):
+            if self._stack[position][0] == tag:
+                break
+        else:
+            return
+        while len(self._stack) > position:
+            _, finalizers = self._stack.pop()
+            for finalize in reversed(finalizers):
+                finalize()
+
+    def data(self, text: str):
+        self._pending.append(text)
+
+    def boundary(self):
+        """注释、处理指令等非文本节点会切分相邻文本"""
+        self._flush()
+
+    def close(self) -> List[Dict[str, Any]]:
+        self._flush()
+        while self._stack:
+            _, finalizers = self._stack.pop()
+            for finalize in reversed(finalizers):
+                finalize()
+        return self._results()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        text = ''.join(self._pending).strip()
+        self._pending.clear()
+        if not text or self._skip_depth:
+            return
+        if self.collect_text:
+            self.text_parts.append(text)
+        for parts in self._collectors:
+            parts.append(text)
+
+    def _leave_skipped(self):
+        self._skip_depth -= 1
+
+    def _open_text(self, parts: List[str], on_close=None):
+        self._collectors.append(parts)
+
+        def finalize():
+            # 按对象身份移除，内容相同的收集器互不影响
+            for position in range(len(self._collectors) - 1, -1, -1):
+                if self._collectors[position] is parts:
+                    del self._collectors[position]
+                    break
+            if on_close is not None:
+                on_close()
+        return finalize
+
+    def _open_collector(self, entry: Dict[str, Any], key: str = 'content', with_length: bool = True):
+        parts: List[str] = []
+
+        def fill():
+            entry[key] = ''.join(parts)
+            if with_length:
+                entry['length'] = len(entry[key])
+        return self._open_text(parts, fill)
+
+    def _results(self) -> List[Dict[str, Any]]:
+        extracted_data: List[Dict[str, Any]] = []
+        text_content = ' '.join(self.text_parts)
+
+        if self.content_type == 'text':
+            extracted_data.append({"type": "text", "content": text_content, "length": len(text_content)})
+            for entry in self.headings:
+                extracted_data.append({"type": entry['type'], "content": entry['content'], "length": entry['length']})
+            for entry in self.paragraphs:
+                if entry['content']:
+                    extracted_data.append({
+                        "type": "paragraph", "content": entry['content'],
+                        "length": entry['length'], "index": entry['index']
+                    })
+        elif self.content_type == 'tables':
+            for i, rows in enumerate(self.tables):
+                content = [[''.join(cell) for cell in row] for row in rows if row]
+                extracted_data.append({"type": "table", "content": content, "length": len(content), "index": i})
+        elif self.content_type == 'images':
+            extracted_data.extend(self.images)
+        elif self.content_type == 'documents':
+            extracted_data.append({"type": "documents", "content": self.documents, "count": len(self.documents)})
+        else:
+            extracted_data.append({"type": "general_content", "content": text_content, "length": len(text_content)})
+
+        for field in self.data_fields:
+            if field == 'title':
+                if self.title is not None:
+                    extracted_data.append({
+                        "type": "specified_field", "field_name": "title", "content": self.title, "found": True
+                    })
+            elif field == 'meta_description':
+                if self.meta_description is not None:
+                    extracted_data.append({
+                        "type": "specified_field", "field_name": "meta_description",
+                        "content": self.meta_description, "found": True
+                    })
+            elif field == 'links':
+                extracted_data.append({
+                    "type": "specified_field", "field_name": "links",
+                    "content": list(self.links), "found": len(self.links) > 0
+                })
+        return extracted_data
+
+
+class _StdlibEventParser(HTMLParser):
+    """标准库html.parser事件适配器"""
+
+    def __init__(self, handler: _ExtractionHandler):
+        super().__init__(convert_charrefs=True)
+        self.handler = handler
+
+    def handle_starttag(self, tag, attrs):
+        self.handler.start(tag, {name: value if value is not None else '' for name, value in attrs})
+
+    def handle_endtag(self, tag):
+        self.handler.end(tag)
+
+    def handle_data(self, data):
+        self.handler.data(data)
+
+    def handle_comment(self, data):
+        self.handler.boundary()
+
+    def handle_pi(self, data):
+        self.handler.boundary()
+
+
+class _LxmlTarget:
+    """lxml解析器target接口适配器，不构建文档树"""
+
+    def __init__(self, handler: _ExtractionHandler):
+        self.handler = handler
+
+    def start(self, tag, attrib):
+        self.handler.start(tag, dict(attrib))
+
+    def end(self, tag):
+        self.handler.end(tag)
+
+    def data(self, data):
+        self.handler.data(data)
+
+    def comment(self, text):
+        self.handler.boundary()
+
+    def close(self):
+        return None
+
+
+class StreamingHTMLExtractor:
+    """
+    分块输入的单遍HTML提取器
+
+    Args:
+        content_type: 内容类型（text, tables, images, documents, all）
+        data_fields: 要额外提取的数据字段（title, meta_description, links）
+        backend: 解析后端（lxml或html.parser），None时优先使用lxml
+    """
+
+    def __init__(self, content_type: str = 'text', data_fields: Optional[List[str]] = None,
+                 backend: Optional[str] = None):
+        self.backend = select_backend(backend) or 'html.parser'
+        self._handler = _ExtractionHandler(content_type, data_fields or [])
+        if self.backend == 'lxml':
+            self._parser = etree.HTMLParser(target=_LxmlTarget(self._handler))
+        else:
+            self._parser = _StdlibEventParser(self._handler)
+        self.characters_fed = 0
+
+    def feed(self, chunk: str):
+        """输入一段已解码的HTML文本"""
+        if chunk:
+            self.characters_fed += len(chunk)
+            self._parser.feed(chunk)
+
+    def close(self) -> List[Dict[str, Any]]:
+        """
+        结束输入并返回提取结果
+
+        Returns:
+            提取的数据列表，格式与parse_content一致
+        """
+        if self.backend == 'lxml':
+            try:
+                self._parser.close()
+            except etree.XMLSyntaxError:
+                # 空文档等无法解析的输入按无内容处理
+                pass
+        else:
+            self._parser.close()
+        return self._handler.close()
+
+
+def extract_html(content: str, content_type: str = 'text', data_fields: Optional[List[str]] = None,
+                 backend: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    单遍提取完整HTML文本
+
+    Args:
+        content: HTML文本
+        content_type: 内容类型
+        data_fields: 要额外提取的数据字段
+        backend: 解析后端
+
+    Returns:
+        提取的数据列表
+    """
+    extractor = StreamingHTMLExtractor(content_type, data_fields, backend)
+    extractor.feed(content)
+    return extractor.close()
+
+
+def sniff_encoding(head: bytes, declared: Optional[str] = None) -> str:
+    """
+    确定流式解码使用的字符编码
+
+    Args:
+        head: 响应开头的字节
+        declared: Content-Type头中声明的charset
+
+    Returns:
+        编码名称，依次取响应头声明、页面meta声明，默认utf-8
+    """
+    if declared:
+        return declared
+    match = _CHARSET_PATTERN.search(head[:4096])
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode('ascii')).name
+        except LookupError:
+            pass
+    return 'utf-8'
+
+
+def declared_charset(content_type: str) -> Optional[str]:
+    """
+    读取Content-Type响应头中声明的charset
+
+    Args:
+        content_type: Content-Type响应头
+
+    Returns:
+        编码名称，未声明或无法识别时返回None
+    """
+    match = _HEADER_CHARSET_PATTERN.search(content_type or '')
+    if not match:
+        return None
+    try:
+        return codecs.lookup(match.group(1)).name
+    except LookupError:
+        return None
+
+
+def iter_decoded(chunks: Iterable[bytes], declared_encoding: Optional[str] = None) -> Iterable[str]:
+    """
+    将字节块增量解码为文本块，多字节字符跨块时不会被截断
+
+    Args:
+        chunks: 字节块序列，例如response.iter_content()
+        declared_encoding: 响应头声明的编码
+
+    Returns:
+        逐块产出的文本
+    """
+    decoder = None
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if decoder is None:
+            decoder = codecs.getincrementaldecoder(sniff_encoding(chunk, declared_encoding))(errors='replace')
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    if decoder is not None:
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
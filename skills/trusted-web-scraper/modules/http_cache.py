@@ -0,0 +1,246 @@
+"""
+HTTP响应磁盘缓存模块
+此模块为定期重复爬取同一批可信网站提供条件请求缓存：响应正文按SHA-256内容
+寻址存储，不同URL的相同正文只保存一份；每个URL记录ETag/Last-Modified等校验
+信息，再次爬取时发送If-None-Match/If-Modified-Since，服务器返回304时直接从
+缓存读取正文，并统计命中、未命中与节省的下载字节数。
+"""
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+# 从缓存读取正文时每次读取的字节数
+BODY_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """某个URL的缓存记录"""
+    url: str
+    body_hash: str
+    size: int
+    status_code: int
+    content_type: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        生成条件请求头
+
+        Returns:
+            If-None-Match/If-Modified-Since请求头
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class HTTPResponseCache:
+    """
+    内容寻址的HTTP响应缓存（线程安全）
+
+    Args:
+        cache_dir: 缓存目录，正文保存在bodies子目录，索引保存在index.sqlite3
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self._bodies_dir = os.path.join(cache_dir, 'bodies')
+        self._tmp_dir = os.path.join(cache_dir, 'tmp')
+        os.makedirs(self._bodies_dir, exist_ok=True)
+        os.makedirs(self._tmp_dir, exist_ok=True)
+        self._conn = sqlite3.connect(os.path.join(cache_dir, 'index.sqlite3'), check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'url TEXT PRIMARY KEY, body_hash TEXT NOT NULL, size INTEGER NOT NULL, '
+            'status_code INTEGER NOT NULL, content_type TEXT, etag TEXT, last_modified TEXT, '
+            'stored_at REAL NOT NULL)'
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0, 'misses': 0, 'stored': 0, 'deduplicated': 0,
+            'bytes_downloaded': 0, 'bytes_saved': 0
+        }
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """
+        查询URL的缓存记录
+
+        Args:
+            url: 请求URL
+
+        Returns:
+            缓存记录，未缓存或正文文件已丢失时返回None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT url, body_hash, size, status_code, content_type, etag, last_modified, stored_at '
+                'FROM responses WHERE url = ?', (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        entry = CachedResponse(*row)
+        if not os.path.exists(self._body_path(entry.body_hash)):
+            return None
+        return entry
+
+    def serve(self, entry: CachedResponse) -> Iterator[bytes]:
+        """
+        服务器返回304后，从缓存逐块读取正文并计入命中统计
+
+        Args:
+            entry: 缓存记录
+
+        Returns:
+            正文字节块
+        """
+        with self._lock:
+            self._stats['hits'] += 1
+            self._stats['bytes_saved'] += entry.size
+        return self._iter_body(entry.body_hash)
+
+    def record(self, url: str, headers: Dict[str, Any], chunks: Iterable[bytes],
+               status_code: int = 200) -> Iterator[bytes]:
+        """
+        透传下载的正文字节块，同时写入缓存
+
+        响应没有ETag和Last-Modified时无法发起条件请求，只计入未命中而不缓存。
+        正文完整读取后才写入索引，中途停止读取时丢弃已写入的临时文件。
+
+        Args:
+            url: 请求URL
+            headers: 响应头
+            chunks: 正文字节块
+            status_code: 响应状态码
+
+        Returns:
+            原样产出的正文字节块
+        """
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        with self._lock:
+            self._stats['misses'] += 1
+        if not etag and not last_modified:
+            self.forget(url)
+            for chunk in chunks:
+                self._count_downloaded(len(chunk))
+                yield chunk
+            return
+
+        digest = hashlib.sha256()
+        size = 0
+        handle, tmp_path = tempfile.mkstemp(dir=self._tmp_dir)
+        completed = False
+        try:
+            with os.fdopen(handle, 'wb') as tmp:
+                for chunk in chunks:
+                    if not chunk:
+                        continue
+                    digest.update(chunk)
+                    tmp.write(chunk)
+                    size += len(chunk)
+                    self._count_downloaded(len(chunk))
+                    yield chunk
+            completed = True
+        finally:
+            if not completed:
+                os.unlink(tmp_path)
+
+        body_hash = digest.hexdigest()
+        body_path = self._body_path(body_hash)
+        with self._lock:
+            if os.path.exists(body_path):
+                os.unlink(tmp_path)
+                self._stats['deduplicated'] += 1
+            else:
+                os.makedirs(os.path.dirname(body_path), exist_ok=True)
+                os.replace(tmp_path, body_path)
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (url, body_hash, size, status_code, headers.get('Content-Type', ''),
+                 etag, last_modified, time.time())
+            )
+            self._conn.commit()
+            self._stats['stored'] += 1
+
+    def forget(self, url: str):
+        """删除URL的缓存记录（正文由prune统一清理）"""
+        with self._lock:
+            self._conn.execute('DELETE FROM responses WHERE url = ?', (url,))
+            self._conn.commit()
+
+    def prune(self) -> int:
+        """
+        删除不再被任何URL引用的正文文件
+
+        Returns:
+            删除的文件数
+        """
+        with self._lock:
+            referenced = {row[0] for row in self._conn.execute('SELECT DISTINCT body_hash FROM responses')}
+            removed = 0
+            for prefix in os.listdir(self._bodies_dir):
+                directory = os.path.join(self._bodies_dir, prefix)
+                for name in os.listdir(directory):
+                    if name not in referenced:
+                        os.unlink(os.path.join(directory, name))
+                        removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """返回命中、未命中、去重及节省字节数统计"""
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self):
+        """关闭索引数据库"""
+        with self._lock:
+            self._conn.close()
+
+    def _count_downloaded(self, size: int):
+        with self._lock:
+            self._stats['bytes_downloaded'] += size
+
+    def _body_path(self, body_hash: str) -> str:
+        return os.path.join(self._bodies_dir, body_hash[:2], body_hash)
+
+    def _iter_body(self, body_hash: str) -> Iterator[bytes]:
+        with open(self._body_path(body_hash), 'rb') as f:
+            while True:
+                chunk = f.read(BODY_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+
+
+_caches: Dict[str, HTTPResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_http_cache(cache_dir: str) -> HTTPResponseCache:
+    """
+    获取指定目录的进程内共享缓存实例
+
+    Args:
+        cache_dir: 缓存目录
+
+    Returns:
+        HTTP响应缓存
+    """
+    key = os.path.abspath(cache_dir)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = HTTPResponseCache(key)
+        return _caches[key]
@@ -15,6 +15,7 @@ from typing import Dict, Any
 # 导入内部模块
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'modules'))
 from core_trusted_scraper import trusted_web_scraper as skill_function
+from core_trusted_scraper import iter_trusted_web_scraper
 
 
 def main():
@@ -22,7 +23,10 @@ def main():
         description='可信网站爬虫工具（专门用于爬取企业官网、教育网、政务网信息）',
         epilog='示例：python trusted_web_scraper.py --url https://example.com --output results.json --content-type text'
     )
-    parser.add_argument('--url', '-u', required=True, help='目标网站URL')
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--url', '-u', help='目标网站URL')
+    target.add_argument('--urls', nargs='+', help='批量爬取的多个URL')
+    target.add_argument('--url-file', help='批量爬取的URL列表文件（每行一个URL）')
     parser.add_argument('--output', '-o', default='trusted_scraping_results.json', help='输出文件')
     parser.add_argument('--content-type', '-ct', 
                        choices=['text', 'tables', 'images', 'documents', 'all'],
@@ -44,9 +48,21 @@ def main():
                        choices=['json', 'csv', 'markdown'],
                        default='json',
                        help='输出格式')
+    parser.add_argument('--parser-backend', choices=['lxml', 'html.parser', 'bs4'], default=None,
+                       help='HTML解析后端（默认安装lxml时使用lxml流式解析，否则使用BeautifulSoup）')
+    parser.add_argument('--cache-dir', default=None,
+                       help='HTTP响应与可信度验证缓存目录，重复爬取时发送条件请求（默认读取TRUSTED_SCRAPER_CACHE_DIR）')
+    parser.add_argument('--max-workers', type=int, default=8,
+                       help='批量模式的工作线程数（默认8）')
+    parser.add_argument('--per-domain-concurrency', type=int, default=2,
+                       help='批量模式下每个域名的并发上限（默认2）')
     
     args = parser.parse_args()
 
+    if args.urls or args.url_file:
+        run_batch(args)
+        return
+
     start_time = datetime.now()
 
     # 准备输入数据
@@ -58,7 +74,9 @@ def main():
         'rate_limit': args.rate_limit,
         'timeout': args.timeout,
         'retry_attempts': args.retry_attempts,
-        'output_format': args.output_format
+        'output_format': args.output_format,
+        'parser_backend': args.parser_backend,
+        'cache_dir': args.cache_dir
     }
 
     try:
@@ -78,7 +96,8 @@ def main():
             'trust_level': results.get('summary', {}).get('trust_level', 'N/A'),
             'content_extracted': results.get('summary', {}).get('content_extracted', 0),
             'processing_time': round((end_time - start_time).total_seconds(), 2),
-            'verification_level': args.verification_level
+            'verification_level': args.verification_level,
+            'http_cache': results.get('summary', {}).get('http_cache')
         },
         'details': results,
         'metadata': {
@@ -105,5 +124,63 @@ def main():
     print(f"  - 输出文件: {args.output}")
 
 
+def run_batch(args):
+    """批量模式：结果按完成先后逐行写入JSON Lines输出文件"""
+    if args.url_file:
+        with open(args.url_file, 'r', encoding='utf-8') as f:
+            urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    else:
+        urls = args.urls
+
+    input_data = {
+        'urls': urls,
+        'content_type': args.content_type,
+        'data_fields': args.data_fields,
+        'verification_level': args.verification_level,
+        'rate_limit': args.rate_limit,
+        'timeout': args.timeout,
+        'retry_attempts': args.retry_attempts,
+        'output_format': args.output_format,
+        'parser_backend': args.parser_backend,
+        'cache_dir': args.cache_dir,
+        'max_workers': args.max_workers,
+        'per_domain_concurrency': args.per_domain_concurrency
+    }
+
+    start_time = datetime.now()
+    succeeded = failed = 0
+    try:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            for results in iter_trusted_web_scraper(input_data):
+                summary = results.get('summary', {})
+                if 'error' in results:
+                    failed += 1
+                    print(f"✗ {summary.get('url')}: {results['error']}")
+                else:
+                    succeeded += 1
+                    print(f"✓ {summary.get('url')}: 提取内容数 {summary.get('content_extracted', 0)}")
+                record = {
+                    'summary': summary,
+                    'details': results,
+                    'metadata': {
+                        'timestamp': datetime.now().isoformat(),
+                        'version': '1.0.0',
+                        'skill': 'trusted-web-scraper'
+                    }
+                }
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+                f.flush()
+    except Exception as e:
+        print(f"错误：批量爬取过程中发生异常 - {e}", file=sys.stderr)
+        sys.exit(1)
+
+    processing_time = round((datetime.now() - start_time).total_seconds(), 2)
+    print(f"✓ 批量爬取完成")
+    print(f"  - URL数: {len(set(urls))}")
+    print(f"  - 成功: {succeeded}，失败: {failed}")
+    print(f"  - 处理时间: {processing_time} 秒")
+    print(f"  - 输出文件: {args.output}")
+
+
 if __name__ == '__main__':
     main()
\ No newline at end of file